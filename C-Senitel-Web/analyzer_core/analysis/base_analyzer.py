@@ -1,58 +1,137 @@
-class BaseAnalyzer:
-    def __init__(self):
-        self.vulnerabilities = []
-        self.tainted_vars = set()
-        self.heap_vars = set()
-        self._visited = set()
-
-
-    def analyze(self, ast):
-        self.visit(ast)
-        return self.vulnerabilities
-    
-    def visit(self, node):
-        if id(node) in self._visited:
-            return
-        self._visited.add(id(node))
-        try:
-            if node is None:
-                return
-
-            if isinstance(node, list):
-                for item in node:
-                    self.visit(item)
-                return
-
-            if isinstance(node, tuple):
-                for item in node:
-                    self.visit(item)
-                return
-
-            if isinstance(node, (str, int, float, bool)):
-                return
-
-            method = f"visit_{type(node).__name__}"
-            visitor = getattr(self, method, self.generic_visit)
-            visitor(node)
-
-        except Exception as e:
-            print(f"[ANALYZER WARNING] {type(node).__name__}: {e}")
-
-
-    def generic_visit(self, node):
-        for attr, value in vars(node).items():
-            if attr == "parent":
-                continue
-
-            # Assign parent safely
-            if hasattr(value, "__dict__"):
-                value.parent = node
-
-            self.visit(value)
-
-
-    def report(self, vuln):
-        self.vulnerabilities.append(vuln)
-
-    
-    
\ No newline at end of file
+import sys
+from collections import deque
+
+# Exact-type classification for visit(): one hash probe per node
+_LEAF = frozenset({str, int, float, bool, type(None)})
+_SEQ = frozenset({list, tuple})
+
+
+def _child_attrs(node):
+    # AST classes list their child fields once, at class creation
+    # (scalar fields such as pos, "parent" and underscore-prefixed
+    # annotations excluded)
+    return getattr(type(node), "_child_fields", ())
+
+
+def _annotate_call(node):
+    """Record a Call's callee name and source line for all analyzers."""
+    func = getattr(node, "func", None)
+    name = getattr(func, "name", None)
+    # interned so sink/allocator table probes can match on identity
+    node._csent_fname = sys.intern(name) if isinstance(name, str) else name
+    pos = getattr(func, "pos", None)
+    node._csent_line = pos[0] if pos and pos[0] is not None else "unknown"
+
+
+class BaseAnalyzer:
+    def __init__(self):
+        self.vulnerabilities = []
+        self.tainted_vars = set()
+        self.heap_vars = set()
+        self._visited = set()
+        self._stack = None
+
+        # node type name -> bound visitor, resolved once per analyzer
+        self._visitors_by_name = {
+            name[len("visit_"):]: getattr(self, name)
+            for name in dir(self)
+            if name.startswith("visit_")
+        }
+        # node class -> bound visitor (or generic_visit), filled on first
+        # sight of each class so the hot path keys on type(node) directly
+        self._dispatch = {}
+
+
+    @classmethod
+    def prepare(cls, ast):
+        """
+        Link every AST node to its parent (node.parent) in one pass, and
+        annotate Call nodes with _csent_fname / _csent_line.
+        Done once per AST; later calls and every analyzer reuse the results.
+        """
+        if getattr(ast, "_has_parents", False):
+            return ast
+
+        stack = [(ast, None)]
+        while stack:
+            node, parent = stack.pop()
+
+            if isinstance(node, (list, tuple)):
+                stack.extend((item, parent) for item in node)
+                continue
+
+            if not hasattr(node, "_fields"):
+                continue
+
+            if parent is not None:
+                node.parent = parent
+
+            if type(node).__name__ == "Call":
+                _annotate_call(node)
+
+            for attr in _child_attrs(node):
+                stack.append((getattr(node, attr, None), node))
+
+        if hasattr(ast, "_fields"):
+            ast._has_parents = True
+        return ast
+
+    def analyze(self, ast):
+        self.prepare(ast)
+        self.visit(ast)
+        return self.vulnerabilities
+
+    def visit(self, node):
+        # Iterative pre-order walk: visitors push children onto self._stack
+        # (via generic_visit) instead of recursing into self.visit.
+        outer = self._stack
+        stack = self._stack = deque([node])
+        dispatch = self._dispatch
+        visited = self._visited
+        generic_visit = self.generic_visit
+
+        try:
+            while stack:
+                node = stack.pop()
+                t = type(node)
+                if t in _LEAF:
+                    continue
+
+                if t in _SEQ:
+                    stack.extend(reversed(node))
+                    continue
+
+                if id(node) in visited:
+                    continue
+                visited.add(id(node))
+
+                visitor = dispatch.get(t)
+                if visitor is None:
+                    visitor = dispatch[t] = self._visitors_by_name.get(
+                        t.__name__, generic_visit
+                    )
+
+                try:
+                    visitor(node)
+                except Exception as e:
+                    print(f"[ANALYZER WARNING] {type(node).__name__}: {e}")
+        finally:
+            self._stack = outer
+
+
+    def generic_visit(self, node):
+        # Leaf classes (Identifier, Constant, ...) have no child fields at
+        # all. Whether a class is a leaf comes from the class, never from
+        # one instance: UnaryOp.operand is a str for sizeof(int) but a node
+        # for !gets(buf).
+        attrs = _child_attrs(node)
+        if not attrs:
+            return
+        # reversed so children pop off the stack in field order
+        self._stack.extend(getattr(node, attr, None) for attr in reversed(attrs))
+
+
+    def report(self, vuln):
+        self.vulnerabilities.append(vuln)
+
+
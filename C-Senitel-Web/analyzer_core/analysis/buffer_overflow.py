@@ -1,97 +1,168 @@
+import sys
+
+from analyzer_core.core.parser_ast import (
+    ArrayDecl,
+    ArrayRef,
+    Break,
+    Call,
+    Cast,
+    Constant,
+    Identifier,
+    Include,
+    MemberAccess,
+    PointerDecl,
+    PointerMemberAccess,
+    UnaryOp,
+)
+
 from .base_analyzer import BaseAnalyzer
 
-HEAP_ALLOCATORS = {"malloc", "calloc", "realloc"}
+HEAP_ALLOCATORS = frozenset(map(sys.intern, ("malloc", "calloc", "realloc")))
+
+# unsafe sink -> index of the argument it writes to (negative = from the end)
+_WRITE_ARG_IDX = {
+    sys.intern("gets"): 0,
+    sys.intern("strcpy"): 0,
+    sys.intern("strcat"): 0,
+    sys.intern("scanf"): -1,
+}
+
+# Parser node types whose subtrees can never hold a Call or Declaration;
+# generic_visit does not descend into them.
+_SKIP_TYPES = frozenset({
+    Include,
+    Identifier,
+    Constant,
+    PointerDecl,
+    ArrayDecl,
+    Break,
+})
+
+_MISS = object()
 
 
 class BufferOverflowAnalyzer(BaseAnalyzer):
+    def __init__(self):
+        super().__init__()
+        # id(node) -> result, valid for one analysis pass (AST is not mutated)
+        self._base_cache = {}
+        self._label_cache = {}
+
+    def analyze(self, ast):
+        try:
+            return super().analyze(ast)
+        finally:
+            self._base_cache.clear()
+            self._label_cache.clear()
+
+    def generic_visit(self, node):
+        if type(node) in _SKIP_TYPES:
+            return
+        super().generic_visit(node)
+
     def _extract_call_name(self, call):
-        func = getattr(call, "func", None)
-        return getattr(func, "name", None)
+        # set for every Call by BaseAnalyzer.prepare
+        return call._csent_fname
 
     def _unwrap_call(self, node):
-        if node is None:
-            return None
-        t = type(node).__name__
-        if t == "Call":
+        t = type(node)
+        if t is Call:
             return node
-        if t == "Cast":
-            return self._unwrap_call(getattr(node, "expr", None))
+        if t is Cast:
+            return self._unwrap_call(node.expr)
         return None
 
     def _target_base_name(self, node):
-        if node is None:
-            return None
-        t = type(node).__name__
-        if hasattr(node, "name"):
-            return node.name
-        if t == "UnaryOp" and getattr(node, "op", None) == "&":
-            return self._target_base_name(getattr(node, "operand", None))
-        if t == "ArrayRef":
-            return self._target_base_name(getattr(node, "base", None))
-        if t in {"MemberAccess", "PointerMemberAccess"}:
-            return self._target_base_name(getattr(node, "base", None))
-        return None
+        key = id(node)
+        name = self._base_cache.get(key, _MISS)
+        if name is _MISS:
+            name = self._base_cache[key] = self._resolve_base_name(node)
+        return name
+
+    # node class -> resolver; each class guarantees the fields it reads
+    _BASE_NAME_OF = {
+        Identifier: lambda self, n: n.name,
+        UnaryOp: lambda self, n: (
+            self._target_base_name(n.operand) if n.op == "&" else None
+        ),
+        ArrayRef: lambda self, n: self._target_base_name(n.base),
+        MemberAccess: lambda self, n: self._target_base_name(n.base),
+        PointerMemberAccess: lambda self, n: self._target_base_name(n.base),
+    }
+
+    def _resolve_base_name(self, node):
+        resolve = self._BASE_NAME_OF.get(type(node))
+        if resolve is not None:
+            return resolve(self, node)
+        # other named nodes (declarators, fields, ...)
+        return getattr(node, "name", None)
 
     def _target_label(self, node):
+        key = id(node)
+        label = self._label_cache.get(key, _MISS)
+        if label is _MISS:
+            label = self._label_cache[key] = self._resolve_label(node)
+        return label
+
+    _LABEL_OF = {
+        Identifier: lambda self, n: str(n.name),
+        UnaryOp: lambda self, n: (
+            f"&{self._target_label(n.operand)}" if n.op == "&" else "UnaryOp"
+        ),
+        ArrayRef: lambda self, n: f"{self._target_label(n.base)}[]",
+        MemberAccess: lambda self, n: (
+            f"{self._target_label(n.base)}.{n.member.name}"
+        ),
+        PointerMemberAccess: lambda self, n: (
+            f"{self._target_label(n.base)}->{n.member.name}"
+        ),
+    }
+
+    def _resolve_label(self, node):
         if node is None:
             return "unknown"
-        t = type(node).__name__
+        resolve = self._LABEL_OF.get(type(node))
+        if resolve is not None:
+            return resolve(self, node)
         if hasattr(node, "name"):
             return str(node.name)
-        if t == "UnaryOp" and getattr(node, "op", None) == "&":
-            return f"&{self._target_label(getattr(node, 'operand', None))}"
-        if t == "ArrayRef":
-            return f"{self._target_label(getattr(node, 'base', None))}[]"
-        if t == "MemberAccess":
-            member = getattr(getattr(node, "member", None), "name", "field")
-            return f"{self._target_label(getattr(node, 'base', None))}.{member}"
-        if t == "PointerMemberAccess":
-            member = getattr(getattr(node, "member", None), "name", "field")
-            return f"{self._target_label(getattr(node, 'base', None))}->{member}"
-        return t
+        return type(node).__name__
 
     def visit_Call(self, node):
-        func_name = self._extract_call_name(node)
-        args = getattr(node, "args", []) or []
-        line_no = "unknown"
+        # Runs for every call in the program: keep lookups local
+        generic_visit = self.generic_visit
+        heap_vars = self.heap_vars
 
-        func_obj = getattr(node, "func", None)
-        if hasattr(func_obj, "pos") and func_obj.pos and func_obj.pos[0] is not None:
-            line_no = func_obj.pos[0]
+        func_name = node._csent_fname
+        line_no = node._csent_line
+        args = getattr(node, "args", []) or []
 
         if not func_name:
-            self.generic_visit(node)
+            generic_visit(node)
             return
 
-        write_arg_index = {
-            "gets": 0,
-            "strcpy": 0,
-            "strcat": 0,
-            "scanf": -1,
-        }
-
         if func_name in HEAP_ALLOCATORS:
             parent = getattr(node, "parent", None)
             if parent and hasattr(parent, "name"):
-                self.heap_vars.add(parent.name)
-            self.generic_visit(node)
+                heap_vars.add(parent.name)
+            generic_visit(node)
             return
 
-        if func_name not in write_arg_index:
-            self.generic_visit(node)
+        idx = _WRITE_ARG_IDX.get(func_name, _MISS)
+        if idx is _MISS:
+            generic_visit(node)
             return
 
-        idx = write_arg_index[func_name]
         if idx < 0:
             idx = len(args) + idx
         if idx < 0 or idx >= len(args):
-            self.generic_visit(node)
+            generic_visit(node)
             return
 
         target = args[idx]
         base_name = self._target_base_name(target)
         target_label = self._target_label(target)
-        vuln_type = "HEAP_OVERFLOW" if base_name in self.heap_vars else "STACK_OVERFLOW"
+        vuln_type = "HEAP_OVERFLOW" if base_name in heap_vars else "STACK_OVERFLOW"
 
         self.report({
             "type": vuln_type,
@@ -106,7 +177,7 @@ class BufferOverflowAnalyzer(BaseAnalyzer):
             )
         })
 
-        self.generic_visit(node)
+        generic_visit(node)
 
     def visit_Declaration(self, node):
         for decl in getattr(node, "declarators", []) or []:
@@ -1,7 +1,8 @@
-from analyzer_core.core.preprocess import preprocess_file
-from analyzer_core.core.lexer_c import lex_code
+from analyzer_core.core.preprocess import preprocess_code, preprocess_file
+from analyzer_core.core.lexer_c import lex_code, normalize_newlines
 from analyzer_core.core.parser_ast import parse_code
 from analyzer_core.core.ast_printer import print_ast
+from analyzer_core.analysis.base_analyzer import BaseAnalyzer
 from analyzer_core.analysis.buffer_overflow import BufferOverflowAnalyzer
 import sys
 
@@ -25,26 +26,45 @@ def format_value(val):
     return MAGENTA + str(val) + RESET
 
 def print_tokens(tokens):
-    """Beautiful, aligned token table output."""
-    print("\n" + CYAN + "=== LEXER: TOKENIZATION ===" + RESET + "\n")
+    """Beautiful, aligned token table output (written to stdout in one go)."""
+    out = ["\n" + CYAN + "=== LEXER: TOKENIZATION ===" + RESET + "\n"]
 
     header = f"{YELLOW}LINE COL  TYPE{' ' * 20}VALUE{RESET}"
-    print(header)
-    print(DIM + "-" * 70 + RESET)
+    out.append(header)
+    out.append(DIM + "-" * 70 + RESET)
 
-    for t in tokens:
-        line = f"{t.line}".rjust(4)
-        col  = f"{t.column}".rjust(4)
+    # read the TokenStream columns directly; no per-token TokenObj
+    for t_line, t_col, t_type, t_value in zip(
+        tokens.line, tokens.column, tokens.type, tokens.value
+    ):
+        line = f"{t_line}".rjust(4)
+        col  = f"{t_col}".rjust(4)
 
-        token_type = (CYAN + t.type + RESET).ljust(22)
-        value = format_value(t.value)
+        token_type = (CYAN + t_type + RESET).ljust(22)
+        value = format_value(t_value)
 
-        print(f"{line} {col}  {token_type} {value}")
+        out.append(f"{line} {col}  {token_type} {value}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def run_pipeline(input_path):
     # Phase 2
     cleaned_code, meta = preprocess_file(input_path)
+    return _run_phases(cleaned_code)
+
+
+def run_pipeline_from_string(code):
+    """
+    Same as run_pipeline, for source text already in memory (e.g. an
+    upload), without a round-trip through a file.
+    """
+    # Phase 2 (newlines translated as preprocess_file's read would)
+    cleaned_code, meta = preprocess_code(normalize_newlines(code))
+    return _run_phases(cleaned_code)
+
+
+def _run_phases(cleaned_code):
     print(f"\n[PRE-PROCESSOR OUTPUT] Length of CLEANED CODE is: {len(cleaned_code)}")
     #print(cleaned_code)
 
@@ -54,6 +74,8 @@ def run_pipeline(input_path):
 
     # Phase 4
     ast = parse_code(cleaned_code)
+    # Parent links are shared by every analyzer run on this AST
+    BaseAnalyzer.prepare(ast)
     print("\n=== ABSTRACT SYNTAX TREE ===")
     print_ast(ast, is_root=True)
 
@@ -80,11 +102,11 @@ if __name__ == "__main__":
         exit(1)
 
     # Phase 1–4
-    ast = run_pipeline(sys.argv[1])
+    pipeline = run_pipeline(sys.argv[1])
 
     # Phase 5: Vulnerability Analysis
     analyzer = BufferOverflowAnalyzer()
-    vulns = analyzer.analyze(ast)
+    vulns = analyzer.analyze(pipeline["ast"])
     if not vulns:
         print("\n[✓] No vulnerabilities detected")
     else:
@@ -4,6 +4,8 @@
 
 import os
 import platform
+import sys
+from functools import lru_cache
 
 # ---------------- ANSI COLOR DEFINITIONS ------------------
 class Colors:
@@ -52,90 +54,128 @@ COLOR_MAP = {
 }
 
 
+# Fixed fragments of printed lines, joined once instead of per node
+_R = Colors.RESET
+_W = Colors.WHITE
+_PROGRAM_SUFFIX = "Program" + _R
+_NONE_LINE = _W + "None" + _R
+_LIST_LINE = _W + "list" + _R
+_PP_LINE = Colors.HOT_PINK + "PP_DIRECTIVE" + _R
+
+
+@lru_cache(maxsize=128)
+def get_color_for_type(t):
+    return COLOR_MAP.get(t.__name__, Colors.RESET)
+
+
 def get_color(node):
-    return COLOR_MAP.get(type(node).__name__, Colors.RESET)
+    return get_color_for_type(type(node))
 
 
 # ---------------- CORE AST PRINTER ------------------------
 def print_ast(node, indent='', is_last=True, is_root=False):
     """
     Pretty printer that NEVER prints a tree symbol for Program.
+
+    Walks the tree with an explicit stack (no recursion limit on deep
+    expressions) and writes the collected lines to stdout once.
+    Stack entries are either (node, indent, is_last, is_root) or an
+    already-rendered line (str) that is emitted as-is.
     """
+    out = []
+    stack = [(node, indent, is_last, is_root)]
+
+    while stack:
+        entry = stack.pop()
+        if isinstance(entry, str):
+            out.append(entry)
+            continue
+
+        node, indent, is_last, is_root = entry
+
+        # ---------- ROOT (Program) ----------
+        if is_root:
+            out.append(get_color_for_type(type(node)) + _PROGRAM_SUFFIX)
+            children = getattr(node, "external_declarations", [])
+            last_i = len(children) - 1
+            for i in range(last_i, -1, -1):
+                stack.append((children[i], "", i == last_i, False))
+            continue
+
+        branch = "+-- " if is_last else "|-- "
+        prefix = indent + branch
+
+        # ---------- None ----------
+        if node is None:
+            out.append(prefix + _NONE_LINE)
+            continue
+
+        # ---------- Primitive ----------
+        if isinstance(node, (str, int, float, bool)):
+            out.append(f"{prefix}{Colors.PURE_GREEN}{node!r}{_R}")
+            continue
+
+        # ---------- List ----------
+        # (an empty tuple is an empty child sequence, e.g. Compound(()))
+        if isinstance(node, list) or (type(node) is tuple and not node):
+            out.append(prefix + _LIST_LINE)
+            sub = indent + ("    " if is_last else "|   ")
+            last_i = len(node) - 1
+            for i in range(last_i, -1, -1):
+                stack.append((node[i], sub, i == last_i, False))
+            continue
+
+        # ---------- Non-AST ----------
+        fields = getattr(type(node), "_fields", None)
+        if fields is None:
+            out.append(prefix + repr(node))
+            continue
+
+        # ---------- AST NODE ----------
+        t = type(node)
+        node_color = get_color_for_type(t)
+        out.append(f"{prefix}{node_color}{t.__name__}{_R}")
 
-    # ---------- ROOT (Program) ----------
-    if is_root:
-        print(get_color(node) + "Program" + Colors.RESET)
-        children = getattr(node, "external_declarations", [])
-        for i, child in enumerate(children):
-            print_ast(child, indent="", is_last=(i == len(children) - 1))
-        return
-
-    branch = "+-- " if is_last else "|-- "
-    prefix = indent + branch
-
-    # ---------- None ----------
-    if node is None:
-        print(prefix + Colors.WHITE + "None" + Colors.RESET)
-        return
-
-    # ---------- Primitive ----------
-    if isinstance(node, (str, int, float, bool)):
-        print(prefix + Colors.PURE_GREEN + repr(node) + Colors.RESET)
-        return
-
-    # ---------- List ----------
-    if isinstance(node, list):
-        print(prefix + Colors.WHITE + "list" + Colors.RESET)
         sub = indent + ("    " if is_last else "|   ")
-        for i, item in enumerate(node):
-            
-            print_ast(item, sub, i == len(node) - 1)
-        return
-
-    # ---------- Non-AST ----------
-    if not hasattr(node, "__dict__"):
-        print(prefix + repr(node))
-        return
-
-    # ---------- AST NODE ----------
-    node_color = get_color(node)
-    print(prefix + node_color + type(node).__name__ + Colors.RESET)
-
-    sub = indent + ("    " if is_last else "|   ")
-    attrs = list(node.__dict__.items())
-
-    for i, (name, value) in enumerate(attrs):
-        last = (i == len(attrs) - 1)
-        attr_prefix = sub + ("+-- " if last else "|-- ")
-
-        # ---- Simple fields ----
-        if isinstance(value, (str, int, float, bool)) or value is None:
-
-            # SPECIAL CASE: Include → show PP_DIRECTIVE
-            if type(node).__name__ == "Include" and name in ("text", "filename"):
-                print(attr_prefix + Colors.HOT_PINK + "PP_DIRECTIVE" + Colors.RESET)
-                continue
-
-            if name == "value" and type(node).__name__ == "Constant":
-                vcolor = Colors.PURE_GREEN
-            elif name in ("name", "filename"):
-                vcolor = Colors.NEON_CYAN
-            elif name in ("op", "type_name"):
-                vcolor = Colors.GOLD
+        # set fields only (an unassigned slot is skipped, not shown as None)
+        attrs = [
+            (name, getattr(node, name)) for name in fields
+            if hasattr(node, name)
+        ]
+
+        # Rendered in field order, pushed in reverse so they pop in order
+        pending = []
+        for i, (name, value) in enumerate(attrs):
+            last = (i == len(attrs) - 1)
+            attr_prefix = sub + ("+-- " if last else "|-- ")
+
+            # ---- Simple fields ----
+            if isinstance(value, (str, int, float, bool)) or value is None:
+
+                # SPECIAL CASE: Include → show PP_DIRECTIVE
+                if t.__name__ == "Include" and name in ("text", "filename"):
+                    pending.append(attr_prefix + _PP_LINE)
+                    continue
+
+                if name == "value" and t.__name__ == "Constant":
+                    vcolor = Colors.PURE_GREEN
+                elif name in ("name", "filename"):
+                    vcolor = Colors.NEON_CYAN
+                elif name in ("op", "type_name"):
+                    vcolor = Colors.GOLD
+                else:
+                    vcolor = Colors.WHITE
+
+                pending.append(f"{attr_prefix}{_W}{name}: {vcolor}{value!r}{_R}")
+
+            # ---- Complex fields ----
             else:
-                vcolor = Colors.WHITE
-
-            print(
-                attr_prefix +
-                Colors.WHITE + name + ": " +
-                vcolor + repr(value) +
-                Colors.RESET
-            )
-
-        # ---- Complex fields ----
-        else:
-            print(attr_prefix + Colors.WHITE + name + ":" + Colors.RESET)
-            print_ast(value, sub + ("    " if last else "|   "), True)
+                pending.append(f"{attr_prefix}{_W}{name}:{_R}")
+                pending.append((value, sub + ("    " if last else "|   "), True, False))
+
+        stack.extend(reversed(pending))
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ---------------- ENTRY POINT -----------------------------
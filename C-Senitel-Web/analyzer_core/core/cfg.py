@@ -1,20 +1,37 @@
-import uuid
+import itertools
+
+from analyzer_core.core.parser_ast import Constant, Identifier
+
+# Process-wide block id source; ids only need to be unique, not random
+_BLOCK_ID = itertools.count()
+
+_MISS = object()
 
 class BasicBlock:
+    __slots__ = (
+        "id", "label", "instructions", "successors", "predecessors",
+        "_succ_ids", "_pred_ids",
+    )
+
     def __init__(self, label="block"):
-        self.id = str(uuid.uuid4())[:8]  
+        self.id = f"b{next(_BLOCK_ID):x}"
         self.label = label
         self.instructions = []  
         self.successors = []    
         self.predecessors = []  
+        # id(block) sets mirroring the edge lists for O(1) dedup
+        self._succ_ids = set()
+        self._pred_ids = set()
 
     def add_instruction(self, node):
         self.instructions.append(node)
 
     def add_successor(self, block):
-        if block not in self.successors:
+        if id(block) not in self._succ_ids:
+            self._succ_ids.add(id(block))
             self.successors.append(block)
-        if self not in block.predecessors:
+        if id(self) not in block._pred_ids:
+            block._pred_ids.add(id(self))
             block.predecessors.append(self)
 
     def to_dict(self):
@@ -22,18 +39,23 @@ class BasicBlock:
         return {
             "id": self.id,
             "label": self.label,
-            "instructions": [str(inst) for inst in self.instructions],
+            # format_instruction already produces strings
+            "instructions": list(self.instructions),
             "successors": [b.id for b in self.successors]
         }
 
 
 class CFG:
+    __slots__ = ("blocks", "entry_block", "_block_ids")
+
     def __init__(self):
         self.blocks = []
         self.entry_block = None
+        self._block_ids = set()
 
     def add_block(self, block):
-        if block not in self.blocks:
+        if id(block) not in self._block_ids:
+            self._block_ids.add(id(block))
             self.blocks.append(block)
 
     def set_entry(self, block):
@@ -51,10 +73,14 @@ class CFGGenerator:
     """
     Traverses the AST and builds a Control Flow Graph.
     """
+    __slots__ = ("cfg", "current_block", "loop_stack", "_visitors")
+
     def __init__(self):
         self.cfg = CFG()
         self.current_block = None
         self.loop_stack = [] 
+        # node class -> bound visit_* method (or generic_visit)
+        self._visitors = {}
 
     def format_instruction(self, node):
         """
@@ -63,97 +89,138 @@ class CFGGenerator:
         if node is None:
             return ""
 
-        t = type(node).__name__
-
-        if t == "Constant":
-            return str(node.value)
-        
-        elif t == "Identifier":
-            return str(node.name)
-        
-        elif t == "ID":
-            return str(node.name)
+        cls = type(node)
+        fmt = self._FMT_BY_TYPE.get(cls, _MISS)
+        if fmt is _MISS:
+            fmt = self._FMT_BY_TYPE[cls] = self._FMT.get(cls.__name__)
+        if fmt is not None:
+            return fmt(self, node)
 
-        elif t == "BinaryOp":
-            left = self.format_instruction(node.left)
-            right = self.format_instruction(node.right)
-            return f"{left} {node.op} {right}"
-
-        elif t == "Assignment": 
-            left = self.format_instruction(node.lvalue)
-            right = self.format_instruction(node.rvalue)
-            return f"{left} {node.op} {right}"
-
-        elif t == "UnaryOp":
-            operand = self.format_instruction(node.operand)
-            if node.op == "p++": return f"{operand}++"
-            if node.op == "p--": return f"{operand}--"
-            return f"{node.op}{operand}"
-            
-        elif t == "Decl":
-            name = node.name if node.name else ""
-            init = ""
-            if hasattr(node, "init") and node.init:
-                 init = f" = {self.format_instruction(node.init)}"
-            return f"Decl {name}{init}"
-            
-        elif t == "FuncCall":
-            args = []
-            if hasattr(node, "args") and node.args:
-                arg_list = node.args.exprs if hasattr(node.args, "exprs") else []
-                args = [self.format_instruction(a) for a in arg_list]
-            return f"{node.name.name}({', '.join(args)})"
-
-        elif t == "ArrayRef":
-            base = self.format_instruction(node.base)
-            index = self.format_instruction(node.index)
-            return f"{base}[{index}]"
-
-        elif t == "MemberAccess":
-            base = self.format_instruction(node.base)
-            member = str(node.member.name) if hasattr(node.member, "name") else str(node.member)
-            return f"{base}.{member}"
-
-        elif t == "PointerMemberAccess":
-            base = self.format_instruction(node.base)
-            member = str(node.member.name) if hasattr(node.member, "name") else str(node.member)
-            return f"{base}->{member}"
-            
-        elif t == "Cast":
-            to_type = str(node.to_type)
-            expr = self.format_instruction(node.expr)
-            return f"({to_type}){expr}"
-
-        elif t == "TernaryOp":
-            cond = self.format_instruction(node.condition)
-            true_e = self.format_instruction(node.true_expr)
-            false_e = self.format_instruction(node.false_expr)
-            return f"{cond} ? {true_e} : {false_e}"
-            
-        elif t == "Return":
-             expr = self.format_instruction(node.expr) if node.expr else ""
-             return f"return {expr}"
-        
-        elif t == "Break":
-            return "break"
+        if hasattr(node, "coord"):
+            return f"Stmt at {node.coord.line}"
+        return cls.__name__
 
-        elif t == "SwitchStmt":
-            expr = self.format_instruction(node.expr)
-            return f"SWITCH ({expr})"
+    # ---------------------------------------------------------
+    # Instruction formatters (one per AST node type, see _FMT)
+    # ---------------------------------------------------------
 
-        elif t == "CaseStmt":
-            val = self.format_instruction(node.value)
-            return f"CASE {val}"
+    def _fmt_Constant(self, node):
+        return str(node.value)
 
-        elif t == "DefaultStmt":
-            return "DEFAULT"
-        
-        elif t == "ExprStmt":
-             return self.format_instruction(node.expr)
+    def _fmt_name(self, node):
+        return str(node.name)
 
-        if hasattr(node, "coord"):
-             return f"Stmt at {node.coord.line}"
-        return t
+    def _fmt_operand(self, node):
+        # Identifiers and constants are most operands: format them inline
+        # rather than through another format_instruction dispatch
+        t = type(node)
+        if t is Identifier:
+            return str(node.name)
+        if t is Constant:
+            return str(node.value)
+        return self.format_instruction(node)
+
+    def _fmt_BinaryOp(self, node):
+        left = self._fmt_operand(node.left)
+        right = self._fmt_operand(node.right)
+        return f"{left} {node.op} {right}"
+
+    def _fmt_Assignment(self, node):
+        left = self.format_instruction(node.lvalue)
+        right = self.format_instruction(node.rvalue)
+        return f"{left} {node.op} {right}"
+
+    def _fmt_UnaryOp(self, node):
+        operand = self._fmt_operand(node.operand)
+        if node.op == "p++": return f"{operand}++"
+        if node.op == "p--": return f"{operand}--"
+        return f"{node.op}{operand}"
+
+    def _fmt_Decl(self, node):
+        name = node.name if node.name else ""
+        init = ""
+        if hasattr(node, "init") and node.init:
+            init = f" = {self.format_instruction(node.init)}"
+        return f"Decl {name}{init}"
+
+    def _fmt_FuncCall(self, node):
+        args = []
+        if hasattr(node, "args") and node.args:
+            arg_list = node.args.exprs if hasattr(node.args, "exprs") else []
+            args = [self.format_instruction(a) for a in arg_list]
+        return f"{node.name.name}({', '.join(args)})"
+
+    def _fmt_ArrayRef(self, node):
+        base = self._fmt_operand(node.base)
+        index = self._fmt_operand(node.index)
+        return f"{base}[{index}]"
+
+    def _fmt_MemberAccess(self, node):
+        base = self.format_instruction(node.base)
+        member = str(node.member.name) if hasattr(node.member, "name") else str(node.member)
+        return f"{base}.{member}"
+
+    def _fmt_PointerMemberAccess(self, node):
+        base = self.format_instruction(node.base)
+        member = str(node.member.name) if hasattr(node.member, "name") else str(node.member)
+        return f"{base}->{member}"
+
+    def _fmt_Cast(self, node):
+        to_type = str(node.to_type)
+        expr = self.format_instruction(node.expr)
+        return f"({to_type}){expr}"
+
+    def _fmt_TernaryOp(self, node):
+        cond = self.format_instruction(node.condition)
+        true_e = self.format_instruction(node.true_expr)
+        false_e = self.format_instruction(node.false_expr)
+        return f"{cond} ? {true_e} : {false_e}"
+
+    def _fmt_Return(self, node):
+        expr = self.format_instruction(node.expr) if node.expr else ""
+        return f"return {expr}"
+
+    def _fmt_Break(self, node):
+        return "break"
+
+    def _fmt_SwitchStmt(self, node):
+        expr = self.format_instruction(node.expr)
+        return f"SWITCH ({expr})"
+
+    def _fmt_CaseStmt(self, node):
+        val = self.format_instruction(node.value)
+        return f"CASE {val}"
+
+    def _fmt_DefaultStmt(self, node):
+        return "DEFAULT"
+
+    def _fmt_ExprStmt(self, node):
+        return self.format_instruction(node.expr)
+
+    # node type name -> formatter; replaces a linear if/elif chain
+    _FMT = {
+        "Constant": _fmt_Constant,
+        "Identifier": _fmt_name,
+        "ID": _fmt_name,
+        "BinaryOp": _fmt_BinaryOp,
+        "Assignment": _fmt_Assignment,
+        "UnaryOp": _fmt_UnaryOp,
+        "Decl": _fmt_Decl,
+        "FuncCall": _fmt_FuncCall,
+        "ArrayRef": _fmt_ArrayRef,
+        "MemberAccess": _fmt_MemberAccess,
+        "PointerMemberAccess": _fmt_PointerMemberAccess,
+        "Cast": _fmt_Cast,
+        "TernaryOp": _fmt_TernaryOp,
+        "Return": _fmt_Return,
+        "Break": _fmt_Break,
+        "SwitchStmt": _fmt_SwitchStmt,
+        "CaseStmt": _fmt_CaseStmt,
+        "DefaultStmt": _fmt_DefaultStmt,
+        "ExprStmt": _fmt_ExprStmt,
+    }
+    # node class -> formatter (or None), resolved from _FMT on first sight
+    _FMT_BY_TYPE = {}
 
     def build(self, ast_root):
         """Main entry point. Takes an AST root (Program or FunctionDef)."""
@@ -188,13 +255,17 @@ class CFGGenerator:
             return
         
         # Check for list of statements (common in Compound nodes)
-        if isinstance(node, list):
+        if isinstance(node, (list, tuple)):
             for item in node:
                 self.visit(item)
             return
 
-        method_name = f"visit_{type(node).__name__}"
-        visitor = getattr(self, method_name, self.generic_visit)
+        cls = type(node)
+        visitor = self._visitors.get(cls)
+        if visitor is None:
+            visitor = self._visitors[cls] = getattr(
+                self, f"visit_{cls.__name__}", self.generic_visit
+            )
         visitor(node)
 
     def generic_visit(self, node):
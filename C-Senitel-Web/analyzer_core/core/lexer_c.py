@@ -2,7 +2,8 @@
 Phase 3 - PLY-based Lexer (C99-level)
 
 - Input: cleaned C code string (from preprocess_file)
-- Output: list of Token objects: Token(type, value, line, column)
+- Output: TokenStream (parallel per-field columns); indexing or iterating
+  it yields Token objects: Token(type, value, line, column)
 - Uses PLY (lex) for tokenization
 - Full logging to project-root/logs/sentinel.log
 - Robust numeric literal support (decimal, hex, octal, binary, floats with exponent, suffixes)
@@ -11,11 +12,16 @@ Phase 3 - PLY-based Lexer (C99-level)
 """
 
 import logging
-import traceback
+import mmap
+import os
 from pathlib import Path
 from typing import List, Tuple, NamedTuple, Optional
 import ply.lex as lex
 import re
+import sys
+import threading
+from functools import lru_cache
+from array import array
 
 #-----LOGGING------
 def ensure_logging():
@@ -31,8 +37,25 @@ def ensure_logging():
             format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
         )
 
-ensure_logging()
-logger = logging.getLogger("c_sentinel.phase3")
+class LazyLogger:
+    """
+    Stand-in for a phase logger: setup() (log directory, root handler) runs
+    on the first logging call instead of at import. Each logger method is
+    looked up once and then cached on the instance, so later calls reach
+    the real logger directly.
+    """
+
+    def __init__(self, name, setup):
+        self._name = name
+        self._setup = setup
+
+    def __getattr__(self, attr):
+        self._setup()
+        value = getattr(logging.getLogger(self._name), attr)
+        self.__dict__[attr] = value
+        return value
+
+logger = LazyLogger("c_sentinel.phase3", ensure_logging)
 
 #------TOKEN OBJECT------
 class TokenObj(NamedTuple):
@@ -43,6 +66,62 @@ class TokenObj(NamedTuple):
     end_line: int
     end_column: int
 
+#------TOKEN STREAM------
+class TokenStream:
+    """
+    lex_code's result, stored struct-of-arrays: one column per TokenObj
+    field (a str list for type, int arrays otherwise) instead of one tuple
+    per token. Token text is not stored: start/end are offsets into
+    `source`, and values are sliced out only when asked for.
+    Indexing or iterating builds TokenObj views on demand; consumers that
+    scan single fields should read the columns directly.
+    A producer may preallocate `capacity` slots, fill them by index and
+    _resize() to the final count.
+    """
+    _COLUMNS = ("type", "start", "end", "line", "column", "end_line", "end_column")
+    __slots__ = _COLUMNS + ("source",)
+
+    def __init__(self, source: str = "", capacity: int = 0):
+        self.source = source
+        self.type: List[str] = [None] * capacity
+        self.start = array("i", [0]) * capacity
+        self.end = array("i", [0]) * capacity
+        self.line = array("i", [0]) * capacity
+        self.column = array("i", [0]) * capacity
+        self.end_line = array("i", [0]) * capacity
+        self.end_column = array("i", [0]) * capacity
+
+    def _resize(self, n: int) -> None:
+        # in place, so references to the column objects stay valid
+        for name in self._COLUMNS:
+            col = getattr(self, name)
+            extra = n - len(col)
+            if extra < 0:
+                del col[n:]
+            elif extra:
+                col.extend(([None] if isinstance(col, list) else array("i", [0])) * extra)
+
+    @property
+    def value(self) -> List[str]:
+        """Token texts, sliced from source on each access."""
+        src = self.source
+        return [src[s:e] for s, e in zip(self.start, self.end)]
+
+    def __len__(self) -> int:
+        return len(self.type)
+
+    def __getitem__(self, i: int) -> TokenObj:
+        return TokenObj(
+            self.type[i], self.source[self.start[i]:self.end[i]], self.line[i],
+            self.column[i], self.end_line[i], self.end_column[i],
+        )
+
+    def __iter__(self):
+        return map(
+            TokenObj, self.type, self.value, self.line,
+            self.column, self.end_line, self.end_column,
+        )
+
 #------RESERVED KEYWORD------
 _reserved = {
     'auto': 'AUTO', 'break': 'BREAK', 'case': 'CASE', 'char': 'CHAR', 'const': 'CONST',
@@ -57,6 +136,13 @@ _reserved = {
     '_Static_assert': 'STATIC_ASSERT', '_Thread_local': 'THREAD_LOCAL'
 }
 
+# keyword length -> {keyword: type}; identifiers whose length no keyword has
+# (most of them: 1 char, or longer than 14) are rejected without hashing
+_KW_BY_LEN = {}
+for _kw, _kw_type in _reserved.items():
+    _KW_BY_LEN.setdefault(len(_kw), {})[_kw] = _kw_type
+del _kw, _kw_type
+
 #-----Token names required by PLY------
 tokens = [
     #IDENTIFIER AND LITERALS
@@ -147,16 +233,16 @@ def t_PP_DIRECTIVE(t):
 
 # String literal (double-quoted) - includes escape sequences
 def t_STRING_LITERAL(t):
-    r'"([^\\\n]|\\.)*"'
+    r'"(?:[^"\\\n]|\\.)*"'
     if "\n" in t.value:
-        logger.warning(f"Possible unterminated string literal at line {t.lineno}")
+        logger.warning("Possible unterminated string literal at line %s", t.lineno)
     return t
 
 #-----------CHARACTER CONSTANT----------
 def t_CHAR_CONST(t):
-    r"'([^\\\n]|\\.)'"
+    r"'(?:[^'\\\n]|\\.)'"
     if "\n" in t.value:
-        logger.warning(f"Possible unterminated char literal at line {t.lineno}")
+        logger.warning("Possible unterminated char literal at line %s", t.lineno)
     return t
 
 
@@ -170,40 +256,19 @@ def t_FLOAT_CONST(t):
     return t
 
 
-#HEXADECIMAL integer literal
-def t_INT_CONST_HEX(t):
-    r'0[xX][0-9a-fA-F]+[uUlL]*'
-    t.type = 'INT_CONST'
-    t.value = t.value
-    return t
-
-#BINARY literal (GCC EXTENSION)
-def t_INT_CONST_BIN(t):
-    r'0[bB][01]+[uUlL]*'
-    t.type = 'INT_CONST'
-    t.value = t.value
-    return t
-
-#OCTAL literal
-def t_INT_CONST_OCT(t):
-    r'0[0-7]+[uUlL]*'    
-    t.type = 'INT_CONST'
-    t.value = t.value
-    return t
-
-#DECIMAL integer
-def t_INT_CONST_DEC(t):
-    r'\d+[uUlL]*'
-    t.type = 'INT_CONST'
-    t.value = t.value
+#INTEGER literal: hexadecimal | binary (GCC extension) | octal | decimal,
+#tried in that order within one rule
+def t_INT_CONST(t):
+    r'0[xX][0-9a-fA-F]+[uUlL]*|0[bB][01]+[uUlL]*|0[0-7]+[uUlL]*|\d+[uUlL]*'
     return t
 
 #IDENTIFIER and KEYWORDS
 def t_IDENTIFIER(t):
     r'[A-Za-z_][A-Za-z0-9_]*'
     val = t.value
-    if val in _reserved:
-        t.type = _reserved[val]
+    bucket = _KW_BY_LEN.get(len(val))
+    if bucket and val in bucket:
+        t.type = bucket[val]
     else:
         t.type = 'IDENTIFIER'
     return t
@@ -213,7 +278,7 @@ def t_newline(t):
     r'\n+'
     t.lexer.lineno += t.value.count("\n")
 
-#COMMENTS SHOULD NOT APPEAR (preprocessor removed them). If present, skip safely.
+#COMMENTS: skipped here as well, so raw (unpreprocessed) source lexes directly
 def t_comment_single(t):
     r'//.*'
     t.lexer.lineno += t.value.count("\n")
@@ -231,7 +296,7 @@ def t_error(t):
     #compute column
     last_cr = t.lexer.lexdata.rfind('\n', 0, t.lexpos)
     col = t.lexpos - last_cr
-    logger.warning(f"PHASE 3: Illegal character {bad_char!r} at line {t.lineno} col {col}")
+    logger.warning("PHASE 3: Illegal character %r at line %s col %s", bad_char, t.lineno, col)
     #create an ERROR token and return it so parser can see it if desired
     t.type = 'ERROR'
     t.value = bad_char
@@ -239,70 +304,294 @@ def t_error(t):
     t.lexer.skip(1)
     return t
 
-#---------HELPER: compute column------------
-def _find_column(input_text: str, token) -> int:
-    # token.lexpos gives position in the whole input text
-    last_cr = input_text.rfind('\n', 0, token.lexpos)
-    if last_cr < 0:
-        last_cr = -1
-        
-    return token.lexpos - last_cr
+#------FUSED MASTER REGEX (lex_code)------
+# lex_code runs the rules above as one compiled alternation instead of going
+# through PLY's per-token dispatch. PLY itself is still built from the same
+# rules for the parser (see build_lexer / parse_code).
+
+# re tries alternatives left to right, so the most frequent token kinds go
+# first: identifiers/keywords, then punctuators. Neither can start where a
+# PP_DIRECTIVE, string/char literal or number can, so hoisting them does not
+# change any match -- except these literals, which begin a function rule's
+# match ('.5' is FLOAT_CONST, '#...' is PP_DIRECTIVE) and must stay behind.
+# Flags for both the master regex and PLY's build of the same rules: PLY's
+# default re.VERBOSE, plus re.ASCII so \d / \s only mean their C meanings
+# (no Unicode digits inside numeric literals)
+_REFLAGS = re.VERBOSE | re.ASCII
+
+_HOT_RULES = ("t_IDENTIFIER",)
+_SHADOWED_LITERALS = frozenset({"t_DOT", "t_HASH"})
+
+# Token types whose text can span lines. Currently none: PP_DIRECTIVE and
+# string/char literals exclude '\n' in their patterns, and a '\n' never
+# reaches t_error because the skip group consumes it. Add a type here if a
+# rule is changed to allow embedded newlines.
+_MULTILINE_CAPABLE = frozenset()
+
+def _literal_trie(names, texts):
+    """
+    Factor literal rules on their first character: one branch per leading
+    character, whose suffixes (each its rule's own named group, possibly
+    empty) keep the rules' relative order. The regex then picks the branch
+    with one character test instead of trying every operator in turn, and
+    still returns the same rule the flat alternation would.
+    """
+    by_first = {}
+    for name in names:
+        text = texts[name]
+        by_first.setdefault(text[0], []).append((name, text[1:]))
+    return [
+        re.escape(first)
+        + "(?:" + "|".join(f"(?P<{name}>{re.escape(rest)})" for name, rest in rest_rules) + ")"
+        for first, rest_rules in by_first.items()
+    ]
+
+
+def _build_master_re():
+    """
+    Fuse this module's t_* rules into a single regex, in the order PLY tries
+    them: ignored characters first, then function rules by definition line,
+    then string rules by decreasing pattern length (ties in name order, as
+    PLY collects rules via dir()), then a one-character catch-all standing
+    in for t_error.
+
+    The token-less rules (t_newline, t_comment_*) are folded with the ignored
+    characters into one leading skip group, so a run of whitespace, newlines
+    and comments is matched in one go, as the prefix of the next token's
+    match. Moving them first is safe: no token rule can start with a
+    newline, '//' or '/*'. The skip group is followed by _HOT_RULES and the
+    unshadowed literals (see above).
+    Returns (compiled pattern, table) where table[m.lastindex] is the
+    (interned) token type for each rule's group and None for every other
+    group index.
+    """
+    rules = globals()
+    names = sorted(name for name in rules if name.startswith("t_"))
+    funcs = sorted(
+        (name for name in names
+         if callable(rules[name]) and name != "t_error"),
+        key=lambda name: rules[name].__code__.co_firstlineno,
+    )
+    strings = sorted(
+        (name for name in names
+         if isinstance(rules[name], str) and name != "t_ignore"),
+        key=lambda name: len(rules[name]),
+        reverse=True,
+    )
+
+    skip = [f"[{re.escape(t_ignore)}]+"]
+    token_funcs = []
+    group_types = {"t_error": "ERROR"}
+    fixed_values = {}
+    for name in funcs:
+        if name[2:] in tokens:
+            group_types[name] = sys.intern(name[2:])
+        else:
+            skip.append(rules[name].__doc__)
+            continue
+        token_funcs.append(name)
+    for name in strings:
+        group_types[name] = sys.intern(name[2:])
+        # string rules are escaped literals: every match has the same text
+        fixed_values[name] = re.sub(r"\\(.)", r"\1", rules[name])
+
+    parts = [f"(?P<{name}>{rules[name].__doc__})" for name in _HOT_RULES]
+    parts.extend(_literal_trie(
+        [name for name in strings if name not in _SHADOWED_LITERALS],
+        fixed_values,
+    ))
+    parts.extend(
+        f"(?P<{name}>{rules[name].__doc__})"
+        for name in token_funcs if name not in _HOT_RULES
+    )
+    parts.extend(
+        f"(?P<{name}>{rules[name]})"
+        for name in strings if name in _SHADOWED_LITERALS
+    )
+    parts.append(r"(?P<t_error>[\s\S])")
+    # trailing skipped text, at EOF only (t_error matches anything else)
+    parts.append(r"\Z")
+
+    # Skipped text is a prefix of each match (group 1, possibly empty), not
+    # a match of its own, so whitespace between tokens costs no extra match
+    # object. Group 1 closes before any rule group, so lastindex is still
+    # the rule's group, and 1 (table entry None) for the EOF-only match.
+    pattern = re.compile(f"((?:{'|'.join(skip)})*)(?:{'|'.join(parts)})", _REFLAGS)
+
+    # Index by group number rather than name: m.lastindex is a plain int,
+    # while m.lastgroup resolves the name through the pattern's index map on
+    # every match. Each rule's group is the last to close within its branch,
+    # so lastindex is that group even when the rule has groups of its own.
+    table = [None] * (pattern.groups + 1)
+    for name, index in pattern.groupindex.items():
+        table[index] = group_types[name]
+    return pattern, tuple(table)
+
+
+_MASTER_RE, _RULE_TABLE = _build_master_re()
+
 
 #-------MAIN API: LEXCODE--------
 
-def build_lexer():
-    #build a fresh lexer instance based on this module's rules
-    from core import lexer_c
-    return lex.lex(module=lexer_c, reflags=re.UNICODE)
+_MASTER_LEXER = None
+_MASTER_LOCK = threading.Lock()
+_TLS = threading.local()
 
-def lex_code(cleaned_code: str) -> List[TokenObj]:
+def build_lexer():
+    """
+    Return a PLY lexer in fresh state (lineno 1, no input).
+    PLY's rule scan and regex compile run once per process; later calls
+    clone that master lexer, which shares the compiled tables.
+    """
+    global _MASTER_LEXER
+    if _MASTER_LEXER is None:
+        with _MASTER_LOCK:
+            if _MASTER_LEXER is None:
+                _MASTER_LEXER = lex.lex(module=sys.modules[__name__], reflags=_REFLAGS)
+    lexer = _MASTER_LEXER.clone()
+    lexer.lineno = 1
+    return lexer
+
+def thread_lexer():
     """
-    Tokenize cleaned_code and return a list of TokenObj(type, value, line, column).
+    Return the calling thread's own PLY lexer, reset to line 1.
+    Each thread clones the master lexer once and reuses it, so concurrent
+    callers (e.g. web workers) never share lexer state.
+    """
+    lexer = getattr(_TLS, "lexer", None)
+    if lexer is None:
+        lexer = _TLS.lexer = build_lexer()
+    lexer.lineno = 1
+    return lexer
+
+@lru_cache(maxsize=64)
+def lex_code(cleaned_code: str) -> TokenStream:
+    """
+    Tokenize cleaned_code and return a TokenStream of
+    TokenObj(type, value, line, column).
+
+    Results are memoized on the source text, so re-lexing unchanged code
+    returns the same TokenStream object: callers must not modify it.
 
     """
     logger.info("Phase 3: lex_code started")
     try:
-        #build fresh lexer instance to avoid state carryover
-        lexer = build_lexer()
-        
-        lexer.input(cleaned_code)
-        tokens: List[TokenObj] = []
-        for tok in lexer:
-            #compute column
-            col = _find_column(cleaned_code, tok)
-            val = str(tok.value)
-            if "\n" in val:
-                #multi-line literal (rare, but possible if malformed strings)
-                lines = val.splitlines()
-                end_line = tok.lineno + len(lines) - 1
+        rule_table = _RULE_TABLE
+        multiline_capable = _MULTILINE_CAPABLE
+        kw_by_len = _KW_BY_LEN
+        # checked once: per-token records are only built when DEBUG is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Monotone line cursor: tokens arrive in increasing position, so the
+        # current line (1-based number, offsets of the '\n' before it and of
+        # the one ending it) only ever moves forward, and each stretch of
+        # source between tokens is scanned for newlines once, in C.
+        count = cleaned_code.count
+        find = cleaned_code.find
+        rfind = cleaned_code.rfind
+        code_len = len(cleaned_code)
+        lineno = 1
+        line_start = -1
+        line_end = find("\n")
+        if line_end < 0:
+            line_end = code_len
+        # Preallocated columns, filled by index (no append/realloc churn);
+        # about one token per 3 chars of source, doubled if exceeded
+        capacity = max(64, code_len // 3)
+        tokens = TokenStream(cleaned_code, capacity)
+        types = tokens.type
+        starts = tokens.start
+        ends = tokens.end
+        lines_col = tokens.line
+        columns = tokens.column
+        end_lines = tokens.end_line
+        end_columns = tokens.end_column
+        n = 0
+        for m in _MASTER_RE.finditer(cleaned_code):
+            ttype = rule_table[m.lastindex]
+            if ttype is None:
+                # whitespace / newlines / comments at EOF
+                continue
+            # the token starts after the skipped prefix (group 1)
+            pos = m.end(1)
+            stop = m.end()
+            #line and column from the line cursor
+            if pos > line_end:
+                lineno += count("\n", line_end, pos)
+                line_start = rfind("\n", line_end, pos)
+                line_end = find("\n", pos)
+                if line_end < 0:
+                    line_end = code_len
+            col = pos - line_start
+            if ttype == "IDENTIFIER":
+                # only identifiers of a keyword's length need their text
+                bucket = kw_by_len.get(stop - pos)
+                if bucket:
+                    ttype = bucket.get(cleaned_code[pos:stop], "IDENTIFIER")
+            elif ttype == "ERROR":
+                logger.warning("PHASE 3: Illegal character %r at line %d col %d", cleaned_code[pos:stop], lineno, col)
+
+            if ttype in multiline_capable and "\n" in cleaned_code[pos:stop]:
+                #multi-line literal
+                lines = cleaned_code[pos:stop].splitlines()
+                end_line = lineno + len(lines) - 1
                 end_col = len(lines[-1]) + 1
             else:
-                end_line = tok.lineno
-                end_col = col + len(val)
-            token_obj = TokenObj(tok.type, tok.value, tok.lineno, col, end_line, end_col)
-            tokens.append(token_obj)
-            logger.debug(
-                f"Phase 3: token {token_obj.type} "
-                f"val = {token_obj.value!r}"
-                f"start = ({token_obj.line}, {token_obj.column})"
-                f"end = ({token_obj.end_line}, {token_obj.end_column})"
-            )
-        logger.info(f"Phase 3: lex_code finished, tokens = {len(tokens)}")
+                end_line = lineno
+                end_col = col + (stop - pos)
+            if n == capacity:
+                capacity *= 2
+                tokens._resize(capacity)
+            types[n] = ttype
+            starts[n] = pos
+            ends[n] = stop
+            lines_col[n] = lineno
+            columns[n] = col
+            end_lines[n] = end_line
+            end_columns[n] = end_col
+            n += 1
+            if debug:
+                logger.debug(
+                    "Phase 3: token %s val = %rstart = (%d, %d)end = (%d, %d)",
+                    ttype, cleaned_code[pos:stop], lineno, col, end_line, end_col,
+                )
+        tokens._resize(n)
+        logger.info("Phase 3: lex_code finished, tokens = %d", len(tokens))
         return tokens
     except Exception as e:
         logger.error("Phase 3: lex_code failed: %s", e)
-        logger.debug(traceback.format_exc())
+        logger.debug("Phase 3: lex_code traceback", exc_info=True)
         raise
     
+def read_source(path) -> str:
+    """
+    Read a source file as text, like Path.read_text(encoding='utf-8',
+    errors='replace'), but decode straight from a read-only mmap of the file
+    so no intermediate bytes copy of the whole file is made.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            code = str(mm, 'utf-8', 'replace')
+    # read_text() opens in universal-newlines mode; keep that behaviour
+    return normalize_newlines(code)
+
+def normalize_newlines(code: str) -> str:
+    """Translate \\r\\n and lone \\r to \\n, as universal-newlines reading does."""
+    if "\r" in code:
+        code = code.replace("\r\n", "\n").replace("\r", "\n")
+    return code
+
 # ---------------- Convenience: lex_file (for tests, not main pipeline) ----------------
-def lex_file(path: str) -> List[TokenObj]:
-    logger.info(f"Phase 3: lex_file called: {path}")
+def lex_file(path: str) -> TokenStream:
+    logger.info("Phase 3: lex_file called: %s", path)
     p = Path(path)
     if not p.exists():
         msg = f"Phase 3: file not found: {path}"
         logger.error(msg)
         raise FileNotFoundError(msg)
-    code = p.read_text(encoding='utf-8', errors='replace')
+    code = read_source(p)
     return lex_code(code)
    
    
@@ -310,11 +599,11 @@ def lex_file(path: str) -> List[TokenObj]:
 # GLOBAL LEXER INSTANCE REQUIRED BY parser_ast.py
 # ==================================================
 
-import sys
-
-def build_lexer():
-    # Build lexer using the current module object
-    return lex.lex(module=sys.modules[__name__])
-
 # ---- THIS IS THE REQUIRED GLOBAL VARIABLE ----
-lexer = build_lexer()
+# Built on first access (PEP 562), so importing this module for lex_code
+# alone does not pay for the PLY build.
+def __getattr__(name):
+    if name == "lexer":
+        lexer = globals()["lexer"] = build_lexer()
+        return lexer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,18 +8,16 @@ Phase 4 - PLY-based Parser + AST (C99 subset)
 - Produces an AST root (Program) suitable for CFG construction
 - Logging + graceful error handling
 """
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[2]))
 from .ast_printer import print_ast
 
 from pathlib import Path
 import logging
-import traceback
 from typing import List, Optional, Any
+from functools import lru_cache
+import itertools
+import operator
 import sys
-import ply.lex as lex
+from ply.lex import LexToken
 import ply.yacc as yacc
 
 # import lexer module - uses the tokens list and token regexes defined there
@@ -39,15 +37,54 @@ def ensure_logging():
             format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
         )
 
-ensure_logging()
-logger = logging.getLogger("c_sentinel.phase4")
+logger = lexer_module.LazyLogger("c_sentinel.phase4", ensure_logging)
 
 # AST Node Classes (simple, extendable)
 
 class Node:
+    # Nodes carry no __dict__: each subclass lists its fields in __slots__
+    # (in __init__ order, plus "pos" which rules may assign after
+    # construction). The analysis layer's parent link lives here.
+    __slots__ = ("parent", "_has_parents")
+    # fields the grammar only ever fills with plain values (never nodes or
+    # lists); subclasses extend this where that holds for every instance
+    _scalar_fields = ("pos",)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # child field names in declaration order, for tree walkers; parent
+        # links and underscore-prefixed annotations are not fields
+        cls._fields = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get("__slots__", ())
+            if name != "parent" and not name.startswith("_")
+        )
+        # the subset of _fields that can hold a node or a list of nodes, so
+        # walkers that only descend skip the scalar attributes outright
+        scalars = {
+            name
+            for klass in cls.__mro__
+            for name in klass.__dict__.get("_scalar_fields", ())
+        }
+        cls._child_fields = tuple(f for f in cls._fields if f not in scalars)
+
     def __repr__(self):
-        attrs = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
-        return f"{self.__class__.__name__}({attrs})"
+        # Shallow on purpose: child nodes and lists are elided, so repr() of
+        # a whole Program (a stray print, a traceback) stays cheap.
+        # print_ast gives the full dump.
+        attrs = []
+        for k in self._fields:
+            if not hasattr(self, k):
+                continue
+            v = getattr(self, k)
+            if isinstance(v, Node):
+                attrs.append(f"{k}=<{v.__class__.__name__}>")
+            elif isinstance(v, list):
+                attrs.append(f"{k}=[{len(v)} items]")
+            else:
+                attrs.append(f"{k}={v!r}")
+        return f"{self.__class__.__name__}({', '.join(attrs)})"
     def get_pos(self):
         """Return (lineno, lexpos) if stored, else (None, None)."""
         pos = getattr(self, "pos", None)
@@ -57,21 +94,30 @@ class Node:
 
 
 class Program(Node):
+    __slots__ = ("external_declarations", "pos")
+
     def __init__(self, external_declarations: List[Any]):
         self.external_declarations = external_declarations
 
 class Include(Node):
+    __slots__ = ("text", "pos")
+    _scalar_fields = ("text", "pos")
+
     def __init__(self, text: str):
         self.text = text
 
 class FunctionDef(Node):
+    __slots__ = ("return_type", "name", "params", "body", "pos")
+
     def __init__(self, return_type, name, params, body):
         self.return_type = return_type
         self.name = name
-        self.params = params or []
+        self.params = params or ()
         self.body = body
 
 class Declaration(Node):
+    __slots__ = ("decl_type", "declarators", "initializer", "pos")
+
     def __init__(self, decl_type, declarators: List[Any], initializer=None, pos=None):
         self.decl_type = decl_type
         self.declarators = declarators  # list of (name, type_modifier)
@@ -79,39 +125,55 @@ class Declaration(Node):
         self.pos = pos
 
 class VarDeclarator(Node):
+    __slots__ = ("name", "declarator_type", "initializer", "pos")
+    _scalar_fields = ("name", "pos")
+
     def __init__(self, name, declarator_type=None, initializer=None, pos=None):
-        self.name = name
+        # interned: the same names recur across declarations and uses
+        self.name = sys.intern(name) if type(name) is str else name
         self.declarator_type = declarator_type  # e.g., pointer, array(size)
         self.initializer = initializer
         self.pos = pos
 
 class Compound(Node):
+    __slots__ = ("items", "pos")
+
     def __init__(self, items: List[Any]):
         self.items = items  # list of statements / declarations
 
 class Return(Node):
+    __slots__ = ("expr", "pos")
+
     def __init__(self, expr):
         self.expr = expr
 
 class Break(Node):
-    pass
+    __slots__ = ("pos",)
 
 class ExprStmt(Node):
+    __slots__ = ("expr", "pos")
+
     def __init__(self, expr):
         self.expr = expr
 
 class IfStmt(Node):
+    __slots__ = ("cond", "then_stmt", "else_stmt", "pos")
+
     def __init__(self, cond, then_stmt, else_stmt=None):
         self.cond = cond
         self.then_stmt = then_stmt
         self.else_stmt = else_stmt
 
 class WhileStmt(Node):
+    __slots__ = ("cond", "body", "pos")
+
     def __init__(self, cond, body):
         self.cond = cond
         self.body = body
 
 class ForStmt(Node):
+    __slots__ = ("init", "cond", "post", "body", "pos")
+
     def __init__(self, init, cond, post, body):
         self.init = init
         self.cond = cond
@@ -119,34 +181,56 @@ class ForStmt(Node):
         self.body = body
 
 class SwitchStmt(Node):
+    __slots__ = ("expr", "body", "pos")
+
     def __init__(self, expr, body):
         self.expr = expr
         self.body = body
 
 class CaseStmt(Node):
+    __slots__ = ("value", "statement", "pos")
+
     def __init__(self, value, statement):
         self.value = value
         self.statement = statement
 
 class DefaultStmt(Node):
+    __slots__ = ("statement", "pos")
+
     def __init__(self, statement):
         self.statement = statement
 
 class Call(Node):
-    def __init__(self, func, args):
+    __slots__ = ("func", "args", "pos", "_csent_fname", "_csent_line")
+
+    def __init__(self, func, args, pos=None):
         self.func = func
         self.args = args
+        self.pos = pos
 
 class Identifier(Node):
-    def __init__(self, name):
-        self.name = name
+    __slots__ = ("name", "pos")
+    _scalar_fields = ("name", "pos")
+
+    def __init__(self, name, pos=None):
+        self.name = sys.intern(name) if type(name) is str else name
+        # member names wrapped by MemberAccess have no position of their own
+        if pos is not None:
+            self.pos = pos
 
 class Constant(Node):
-    def __init__(self, value, ctype="int"):
+    __slots__ = ("value", "ctype", "pos")
+    _scalar_fields = ("value", "ctype", "pos")
+
+    def __init__(self, value, ctype="int", pos=None):
         self.value = value
         self.ctype = ctype
+        self.pos = pos
 
 class BinaryOp(Node):
+    __slots__ = ("op", "left", "right", "pos")
+    _scalar_fields = ("op", "pos")
+
     def __init__(self, op, left, right, pos=None):
         self.op = op
         self.left = left
@@ -154,22 +238,33 @@ class BinaryOp(Node):
         self.pos=pos
 
 class UnaryOp(Node):
-    def __init__(self, op, operand):
+    __slots__ = ("op", "operand", "pos")
+    _scalar_fields = ("op", "pos")
+
+    def __init__(self, op, operand, pos=None):
         self.op = op
         self.operand = operand
+        self.pos = pos
 
 class PointerDecl(Node):
+    __slots__ = ("pos", "level")
+    _scalar_fields = ("pos", "level")
+
     def __init__(self, pos=None, level=1):
         self.pos = pos
         self.level = level
 
 class ArrayDecl(Node):
+    __slots__ = ("size", "pos")
+    _scalar_fields = ("size", "pos")
+
     def __init__(self, size=None):
         self.size = size
         
 # ----------------- New AST node types (postfix & member access) -----------------
 class ArrayRef(Node):
     """Represents array indexing: base[index]"""
+    __slots__ = ("base", "index", "pos")
     def __init__(self, base, index, pos=None):
         self.base = base
         self.index = index
@@ -177,6 +272,7 @@ class ArrayRef(Node):
 
 class MemberAccess(Node):
     """Represents struct/union member access: base.member"""
+    __slots__ = ("base", "member", "pos")
     def __init__(self, base, member, pos=None):
         # member will be an Identifier node for consistency
         self.base = base
@@ -185,6 +281,7 @@ class MemberAccess(Node):
 
 class PointerMemberAccess(Node):
     """Represents pointer member access: base->member"""
+    __slots__ = ("base", "member", "pos")
     def __init__(self, base, member, pos=None):
         self.base = base
         self.member = member if isinstance(member, Identifier) else Identifier(member)
@@ -195,88 +292,63 @@ class PosMixin:
         return getattr(self, "pos", (0,0))
     
 # --- AST node: Cast (insert near other AST node classes) ---
-class Cast:
+class Cast(Node):
+    __slots__ = ("to_type", "expr", "pos")
+
     def __init__(self, to_type, expr, pos=None):
         # to_type: a simple string (type_specifier) or more complex node if you extend types later
         self.to_type = to_type
         self.expr = expr
         self.pos = pos
-
-    def get_pos(self):
-        return self.pos
-
-    def __repr__(self):
-        return f"Cast(to_type={self.to_type}, expr={self.expr})"
     
-class TernaryOp:
+class TernaryOp(Node):
+    __slots__ = ("condition", "true_expr", "false_expr", "pos")
+
     def __init__(self, condition, true_expr, false_expr, pos=None):
         self.condition = condition
         self.true_expr = true_expr
         self.false_expr = false_expr
         self.pos = pos
-
-    def get_pos(self):
-        return self.pos
-
-    def __repr__(self):
-        return f"TernaryOp(cond={self.condition}, true={self.true_expr}, false={self.false_expr})"
     
-class StructSpecifier:
+class StructSpecifier(Node):
+    __slots__ = ("name", "fields", "pos")
+
     def __init__(self, name, fields, pos=None):
         self.name = name
         self.fields = fields or []
         self.pos = pos
 
-    def get_pos(self):
-        return self.pos
+class StructField(Node):
+    __slots__ = ("type_spec", "declarators", "pos")
 
-class StructField:
     def __init__(self, type_spec, declarators, pos=None):
         self.type_spec = type_spec
         self.declarators = declarators
         self.pos = pos
 
-    def get_pos(self):
-        return self.pos
-
 
 
 
 # ---------------------Parser tokens (taken from lexer module)------------------------------
  
-import importlib
-
-# import lexer safely
-try:
-    lexer_module = importlib.import_module("core.lexer_c")
-except ImportError:
-    lexer_module = importlib.import_module("analyzer_core.core.lexer_c")
-
-# build tokens list safely
-_extra_tokens = ["DEREF", "ADDRESS", "TYPEDEF"]
-
-tokens_list = list(getattr(lexer_module, "tokens", []))
-for t in _extra_tokens:
-    if t not in tokens_list:
-        tokens_list.append(t)
-
-tokens = tuple(tokens_list)
-lexer = getattr(lexer_module, "lexer", None)
+# the lexer's tokens (imported above), plus the names the parser declares
+# that the lexer never emits; TYPEDEF comes from its keyword table already
+tokens = tuple(lexer_module.tokens) + ("DEREF", "ADDRESS")
 
 # --- begin precedence patch (keep names even if they are not tokens) ---
-_PRECEDENCE_RAW = [
-    ("left", ["OR"]),
-    ("left", ["AND"]),
-    ("left", ["EQ", "NEQ"]),
-    ("left", ["LT", "GT", "LE", "GE"]),
-    ("left", ["LSHIFT", "RSHIFT"]),
-    ("left", ["PLUS", "MINUS"]),
-    ("left", ["TIMES", "DIVIDE", "MOD"]),
-    ("right", ["UMINUS", "UPLUS"]),  # precedence names used via %prec
-]
-
-
-precedence = tuple((assoc,) + tuple(names) for (assoc, names) in _PRECEDENCE_RAW)
+precedence = (
+    ("left", "OR"),
+    ("left", "AND"),
+    ("left", "BOR"),
+    ("left", "BXOR"),
+    ("left", "BAND"),
+    ("left", "EQ", "NEQ"),
+    ("left", "LT", "GT", "LE", "GE"),
+    ("left", "LSHIFT", "RSHIFT"),
+    ("left", "PLUS", "MINUS"),
+    ("left", "TIMES", "DIVIDE", "MOD"),
+    ("right", "UMINUS", "UPLUS"),  # precedence names used via %prec
+)
 # --- end precedence patch ---
 
 # ---------- Position helpers (paste near top, after tokens are defined) ----------
@@ -289,53 +361,29 @@ def tokpos(tok):
       - tuples that are already (lineno, lexpos).
     If nothing found, return (0, 0).
     """
+    # Direct LexToken (the usual case from the lexer): one exact type check
+    if type(tok) is LexToken:
+        return (tok.lineno, tok.lexpos)
+
     if tok is None:
         return (0, 0)
 
-    # Direct LexToken (the usual case from the lexer)
-    if hasattr(tok, "lineno") and hasattr(tok, "lexpos"):
-        try:
-            return (int(getattr(tok, "lineno", 0)), int(getattr(tok, "lexpos", 0)))
-        except Exception:
-            return (0, 0)
+    # If tok is a YaccSymbol from p.slice: use the node (or token) it carries
+    v = getattr(tok, "value", None)
+    if hasattr(v, "pos"):
+        return v.pos
+    if type(v) is LexToken:
+        return (v.lineno, v.lexpos)
 
-    # If tok is a YaccSymbol from p.slice: try tok.value, then attributes
-    if hasattr(tok, "value"):
-        v = tok.value
-        # If value itself is an AST node with .pos
-        if hasattr(v, "pos"):
-            return v.pos
-        # If value is a LexToken (in some configurations)
-        if hasattr(v, "lineno") and hasattr(v, "lexpos"):
-            try:
-                return (int(getattr(v, "lineno", 0)), int(getattr(v, "lexpos", 0)))
-            except Exception:
-                return (0, 0)
-
-    # If this is an AST node with .pos attribute
-    if hasattr(tok, "pos"):
-        pos = getattr(tok, "pos")
-        if isinstance(pos, tuple) and len(pos) == 2:
-            return pos
-        # sometimes pos stored as two ints in list/tuple-like
-        try:
-            return (int(pos[0]), int(pos[1]))
-        except Exception:
-            pass
+    # If this is an AST node with a (lineno, lexpos) .pos attribute
+    pos = getattr(tok, "pos", None)
+    if type(pos) is tuple and len(pos) == 2:
+        return pos
 
     # Already a (lineno, lexpos) tuple
-    if isinstance(tok, tuple) and len(tok) == 2 and all(isinstance(i, int) for i in tok):
+    if type(tok) is tuple and len(tok) == 2 and all(type(i) is int for i in tok):
         return tok
 
-    # Last-chance: try numeric attributes often present
-    lineno = getattr(tok, "lineno", None) or getattr(tok, "lineno", None)
-    lexpos = getattr(tok, "lexpos", None) or getattr(tok, "lexpos", None)
-    if lineno is not None and lexpos is not None:
-        try:
-            return (int(lineno), int(lexpos))
-        except Exception:
-            pass
-
     return (0, 0)
 
 
@@ -354,6 +402,10 @@ def get_pos(p, index):
     except Exception:
         return None
 
+    # Fast path: a terminal straight from the lexer
+    if type(tok) is LexToken:
+        return (tok.lineno, tok.lexpos)
+
     # If it's a lex token with lineno/lexpos
     if hasattr(tok, "lineno"):
         lineno = getattr(tok, "lineno", None)
@@ -377,10 +429,20 @@ def get_pos(p, index):
 
 # ---------- end position helpers ----------
 
+@lru_cache(maxsize=256)
+def _join_type_words(words):
+    return sys.intern(" ".join(words))
+
 def normalize_type_spec(t):
     if isinstance(t, list):
-        return " ".join(str(x) for x in t)
-    return t
+        # keyword-only specifiers ("unsigned int", "const char", ...) repeat
+        # across a file, so their joined form is cached; lists holding a
+        # struct node are joined directly rather than pinned in the cache
+        if all(type(x) is str for x in t):
+            return _join_type_words(tuple(t))
+        return " ".join(map(str, t))
+    # a lone specifier is a keyword or typedef name token
+    return sys.intern(t) if type(t) is str else t
 
 def normalize_type_name(t):
     if isinstance(t, tuple):
@@ -406,8 +468,9 @@ def p_external_list(p):
     """external_list : external_list external_declaration
                      | external_declaration"""
     if len(p) == 3:
-        # p[1] is a list, p[2] is a node -> concatenate
-        p[0] = p[1] + [p[2]]
+        # p[1] is a list, p[2] is a node -> extend in place
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         # single element list
         p[0] = [p[1]]
@@ -459,7 +522,8 @@ def p_init_declarator_list(p):
     """init_declarator_list : init_declarator_list COMMA init_declarator
                             | init_declarator"""
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -484,9 +548,10 @@ def p_declarator(p):
         # pointer declaration
         name = p[2].name
         pointer_level = p[1] if isinstance(p[1], int) else 1
-        decl = VarDeclarator(name, declarator_type=PointerDecl(level=pointer_level))
-        decl.pos = tokpos(p.slice[2])
-        p[0] = decl
+        p[0] = VarDeclarator(
+            name, declarator_type=PointerDecl(level=pointer_level),
+            pos=tokpos(p.slice[2]),
+        )
 
 def p_pointer(p):
     """pointer : TIMES
@@ -502,14 +567,11 @@ def p_direct_declarator(p):
                          | IDENTIFIER LBRACKET IDENTIFIER RBRACKET
                          | IDENTIFIER LBRACKET RBRACKET"""
     if len(p) == 2:
-        p[0] = VarDeclarator(p[1])
-        p[0].pos = tokpos(p.slice[1])
+        p[0] = VarDeclarator(p[1], pos=tokpos(p.slice[1]))
     elif len(p) == 4:
-        p[0] = VarDeclarator(p[1], declarator_type=ArrayDecl(size=None))
-        p[0].pos = tokpos(p.slice[1])
+        p[0] = VarDeclarator(p[1], declarator_type=ArrayDecl(size=None), pos=tokpos(p.slice[1]))
     else:
-        p[0] = VarDeclarator(p[1], declarator_type=ArrayDecl(size=p[3]))
-        p[0].pos = tokpos(p.slice[1])
+        p[0] = VarDeclarator(p[1], declarator_type=ArrayDecl(size=p[3]), pos=tokpos(p.slice[1]))
 
 def p_initializer(p):
     """initializer : assignment_expression"""
@@ -534,7 +596,8 @@ def p_struct_declaration_list(p):
     """struct_declaration_list : struct_declaration_list struct_declaration
                                | struct_declaration"""
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -561,8 +624,12 @@ def p_type_specifier_seq(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        left = p[1] if isinstance(p[1], list) else [p[1]]
-        p[0] = left + [p[2]]
+        # a list p[1] was built by an earlier reduction of this rule
+        if isinstance(p[1], list):
+            p[1].append(p[2])
+            p[0] = p[1]
+        else:
+            p[0] = [p[1], p[2]]
 
 def p_type_name(p):
     """type_name : type_specifier_seq
@@ -599,13 +666,15 @@ def p_function_definition(p):
         p[0] = FunctionDef(normalize_type_spec(p[1]), p[2], params, body)
     else:
         body = p[5]
-        p[0] = FunctionDef(normalize_type_spec(p[1]), p[2], [], body)
+        # () is a shared singleton: no fresh list per parameterless function
+        p[0] = FunctionDef(normalize_type_spec(p[1]), p[2], (), body)
 
 def p_parameter_list(p):
     """parameter_list : parameter_list COMMA parameter_declaration
                       | parameter_declaration"""
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -624,13 +693,14 @@ def p_compound_statement(p):
     if len(p) == 4:
         p[0] = Compound(p[2])
     else:
-        p[0] = Compound([])
+        p[0] = Compound(())
 
 def p_statement_list(p):
     """statement_list : statement_list statement
                       | statement"""
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -706,6 +776,10 @@ def p_expression(p):
         # represent comma as right-associative sequence -> keep last expression
         p[0] = p[3]
         
+# BinaryOp is built on the hottest reduce paths: allocate it directly and
+# fill its slots, skipping the __init__ call and its argument handling
+_new_node = object.__new__
+
 def p_assignment_expression(p):
     """
     assignment_expression : conditional_expression
@@ -714,8 +788,12 @@ def p_assignment_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = BinaryOp(op='=', left=p[1], right=p[3], pos=get_pos(p, 2))
-        p[0].op = p[2]
+        b = _new_node(BinaryOp)
+        b.op = p[2]
+        b.left = p[1]
+        b.right = p[3]
+        b.pos = get_pos(p, 2)
+        p[0] = b
 
 def p_assignment_operator(p):
     """assignment_operator : ASSIGN
@@ -733,114 +811,98 @@ def p_constant_expression(p):
     """constant_expression : assignment_expression"""
     p[0] = p[1]
 
-def p_logical_or_expression(p):
-    """logical_or_expression : logical_or_expression OR logical_and_expression
-                             | logical_and_expression"""
-    if len(p) == 4:
-        p[0] = BinaryOp('||', p[1], p[3])
-        get_pos(p, 2)
-    else:
-        p[0] = p[1]
-        p[0].pos = p[1].get_pos()
-
-def p_logical_and_expression(p):
-    """logical_and_expression : logical_and_expression AND bitwise_or_expression
-                              | bitwise_or_expression"""
-    if len(p) == 4:
-        p[0] = BinaryOp('&&', p[1], p[3])
-        get_pos(p, 2)
-    else:
-        p[0] = p[1]
-        p[0].pos = p[1].get_pos()
+# ---------- Constant folding (int literals, C int semantics) ----------
+_INT_MIN, _INT_MAX = -(1 << 31), (1 << 31) - 1
 
-def p_bitwise_or_expression(p):
-    """bitwise_or_expression : bitwise_or_expression BOR bitwise_xor_expression
-                             | bitwise_xor_expression"""
-    if len(p) == 4:
-        p[0] = BinaryOp('|', p[1], p[3])
-        get_pos(p, 2)
-    else:
-        p[0] = p[1]
-        p[0].pos = p[1].get_pos()
+def _c_div(a, b):
+    # C truncates toward zero; Python's // floors
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
 
-def p_bitwise_xor_expression(p):
-    """bitwise_xor_expression : bitwise_xor_expression BXOR bitwise_and_expression
-                              | bitwise_and_expression"""
-    if len(p) == 4:
-        p[0] = BinaryOp('^', p[1], p[3])
-        get_pos(p, 2)
-    else:
-        p[0] = p[1]
-        p[0].pos = p[1].get_pos()
+_FOLD_OPS = {
+    "+": operator.add, "-": operator.sub, "*": operator.mul,
+    "/": _c_div, "%": lambda a, b: a - b * _c_div(a, b),
+    "<<": operator.lshift, ">>": operator.rshift,
+    "&": operator.and_, "|": operator.or_, "^": operator.xor,
+}
 
-def p_bitwise_and_expression(p):
-    """bitwise_and_expression : bitwise_and_expression BAND equality_expression
-                              | equality_expression"""
-    if len(p) == 4:
-        p[0] = BinaryOp('&', p[1], p[3])
-        get_pos(p, 2)
-    else:
-        p[0] = p[1]
-        p[0].pos = p[1].get_pos()
-
-def p_equality_expression(p):
-    """equality_expression : equality_expression EQ relational_expression
-                           | equality_expression NEQ relational_expression
-                           | relational_expression"""
-    if len(p) == 4:
-        p[0] = BinaryOp(p[2], p[1], p[3])
-        get_pos(p, 2)
-    else:
-        p[0] = p[1]
-        p[0].pos = p[1].get_pos()
-
-def p_relational_expression(p):
-    """relational_expression : relational_expression LT shift_expression
-                             | relational_expression GT shift_expression
-                             | relational_expression LE shift_expression
-                             | relational_expression GE shift_expression
-                             | shift_expression"""
-    if len(p) == 4:
-        p[0] = BinaryOp(p[2], p[1], p[3])
-        get_pos(p, 2)
-    else:
-        p[0] = p[1]
-        p[0].pos = p[1].get_pos()
-
-def p_shift_expression(p):
-    """shift_expression : shift_expression LSHIFT additive_expression
-                        | shift_expression RSHIFT additive_expression
-                        | additive_expression"""
-    if len(p) == 4:
-        p[0] = BinaryOp(p[2], p[1], p[3])
-        get_pos(p, 2)
-    else:
-        p[0] = p[1]
-        p[0].pos = p[1].get_pos()
+def _int_value(node):
+    """Value of an unsuffixed int Constant (decimal/hex/octal/binary), else None."""
+    if type(node) is not Constant or node.ctype != "int":
+        return None
+    text = node.value
+    try:
+        if len(text) > 1 and text[0] == "0" and text[1] not in "xXbB":
+            value = int(text, 8)
+        else:
+            value = int(text, 0)
+    except (TypeError, ValueError):
+        # suffixed (10u, 1L) or otherwise not a plain literal
+        return None
+    # a literal past INT_MAX (0x80000000, 4294967295) has an unsigned or
+    # wider type in C; signed Python arithmetic would fold it wrongly
+    if not _INT_MIN <= value <= _INT_MAX:
+        return None
+    return value
 
-def p_additive_expression(p):
-    """additive_expression : additive_expression PLUS multiplicative_expression
-                           | additive_expression MINUS multiplicative_expression
-                           | multiplicative_expression"""
+def _fold(op, left, right):
+    """
+    Fold `left op right` into a Constant when both are int literals and the
+    result is a well-defined int; None leaves the BinaryOp in place.
+    """
+    fn = _FOLD_OPS.get(op)
+    if fn is None:
+        return None
+    a = _int_value(left)
+    if a is None:
+        return None
+    b = _int_value(right)
+    if b is None:
+        return None
+    if op in ("/", "%") and b == 0:
+        return None
+    if op in ("<<", ">>") and (not 0 <= b < 32 or (op == "<<" and a < 0)):
+        return None
+    result = fn(a, b)
+    if not _INT_MIN <= result <= _INT_MAX:
+        return None
+    return Constant(str(result), ctype="int", pos=left.get_pos())
+
+def p_binary_expression(p):
+    """binary_expression : binary_expression OR binary_expression
+                         | binary_expression AND binary_expression
+                         | binary_expression BOR binary_expression
+                         | binary_expression BXOR binary_expression
+                         | binary_expression BAND binary_expression
+                         | binary_expression EQ binary_expression
+                         | binary_expression NEQ binary_expression
+                         | binary_expression LT binary_expression
+                         | binary_expression GT binary_expression
+                         | binary_expression LE binary_expression
+                         | binary_expression GE binary_expression
+                         | binary_expression LSHIFT binary_expression
+                         | binary_expression RSHIFT binary_expression
+                         | binary_expression PLUS binary_expression
+                         | binary_expression MINUS binary_expression
+                         | binary_expression TIMES binary_expression
+                         | binary_expression DIVIDE binary_expression
+                         | binary_expression MOD binary_expression
+                         | unary_expression"""
+    # One rule for every binary operator (the precedence table orders them),
+    # so a leaf expression takes one reduction here instead of one per level
     if len(p) == 4:
-        p[0] = BinaryOp(p[2], p[1], p[3])
-        get_pos(p, 2)
+        p[0] = _fold(p[2], p[1], p[3])
+        if p[0] is None:
+            b = _new_node(BinaryOp)
+            b.op = p[2]
+            b.left = p[1]
+            b.right = p[3]
+            b.pos = get_pos(p, 2)   # operator position
+            p[0] = b
     else:
         p[0] = p[1]
         p[0].pos = p[1].get_pos()
 
-def p_multiplicative_expression(p):
-    """multiplicative_expression : multiplicative_expression TIMES unary_expression
-                                 | multiplicative_expression DIVIDE unary_expression
-                                 | multiplicative_expression MOD unary_expression
-                                 | unary_expression"""
-    if len(p) == 4:
-        p[0] = BinaryOp(p[2], p[1], p[3])
-        get_pos(p, 2)   # operator position
-    else:
-        p[0] = p[1]
-        p[0].pos = p[1].get_pos()       # safe fallback (no operator)
-
 def p_cast_expression(p):
     """
     cast_expression : LPAREN type_name RPAREN cast_expression
@@ -868,23 +930,20 @@ def p_unary_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = UnaryOp(p[1], p[2])
-        get_pos(p, 2)
+        p[0] = UnaryOp(p[1], p[2], pos=get_pos(p, 1))
         
 def p_unary_expression_sizeof(p):
     """unary_expression : SIZEOF LPAREN expression RPAREN
                         | SIZEOF LPAREN type_name RPAREN"""
-    p[0] = UnaryOp('sizeof', p[3])
-    p[0].pos = tokpos(p.slice[1])
+    p[0] = UnaryOp('sizeof', p[3], pos=tokpos(p.slice[1]))
     
 def p_unary_expression_cast(p):
     """unary_expression : LPAREN type_name RPAREN unary_expression"""
-    p[0] = Cast(normalize_type_name(p[2]), p[4])
-    p[0].pos = tokpos(p.slice[1])
+    p[0] = Cast(normalize_type_name(p[2]), p[4], pos=tokpos(p.slice[1]))
 
 def p_conditional_expression(p):
-    """conditional_expression : logical_or_expression QUESTION expression COLON conditional_expression
-                              | logical_or_expression"""
+    """conditional_expression : binary_expression QUESTION expression COLON conditional_expression
+                              | binary_expression"""
     if len(p) == 2:
         p[0] = p[1]
     else:
@@ -915,15 +974,13 @@ def p_postfix_expression(p):
     if len(p) == 5 and p[2] == '[':
         base = p[1]
         index = p[3]
-        p[0] = ArrayRef(base, index)
-        get_pos(p, 2)
+        p[0] = ArrayRef(base, index, pos=get_pos(p, 2))
         return
 
     # function call without args: base ( )
     if len(p) == 4 and p[2] == '(' and p[3] == ')':
         func = p[1]
-        p[0] = Call(func, [])
-        get_pos(p, 2)
+        p[0] = Call(func, [], pos=get_pos(p, 2))
         return
 
     # function call with args: base ( arglist )
@@ -933,76 +990,79 @@ def p_postfix_expression(p):
         # ensure args is a flat list
         if not isinstance(args, list):
             args = [args]
-        p[0] = Call(func, args)
-        get_pos(p, 2)
+        p[0] = Call(func, args, pos=get_pos(p, 2))
         return
 
     # member access: dot
     if len(p) == 4 and p[2] == '.':
         base = p[1]
         member_lexeme = p[3]
-        p[0] = MemberAccess(base, member_lexeme)
-        get_pos(p, 2)
+        p[0] = MemberAccess(base, member_lexeme, pos=get_pos(p, 2))
         return
 
     # pointer member access: arrow
     if len(p) == 4 and p[2] == '->':
         base = p[1]
         member_lexeme = p[3]
-        p[0] = PointerMemberAccess(base, member_lexeme)
-        get_pos(p, 2)
+        p[0] = PointerMemberAccess(base, member_lexeme, pos=get_pos(p, 2))
         return
 
     # postfix ++ / --
     if len(p) == 3 and p[2] == '++':
-        p[0] = UnaryOp('POSTINC', p[1])
-        get_pos(p, 2)
+        p[0] = UnaryOp('POSTINC', p[1], pos=get_pos(p, 2))
         return
     if len(p) == 3 and p[2] == '--':
-        p[0] = UnaryOp('POSTDEC', p[1])
-        get_pos(p, 2)
+        p[0] = UnaryOp('POSTDEC', p[1], pos=get_pos(p, 2))
         return
 
     # fallback
     p[0] = p[1]
 
+# primary_expression token type -> node factory(value, pos); anything else
+# is the parenthesized expression
+_PRIMARY_DISPATCH = {
+    'IDENTIFIER': Identifier,
+    'INT_CONST': lambda val, pos: Constant(val, 'int', pos),
+    'FLOAT_CONST': lambda val, pos: Constant(val, 'float', pos),
+    'CHAR_CONST': lambda val, pos: Constant(val, 'char', pos),
+}
+
 def p_primary_expression(p):
     """primary_expression : IDENTIFIER
                           | INT_CONST
                           | FLOAT_CONST
-                          | STRING_LITERAL
+                          | string_literal_list
                           | CHAR_CONST
                           | LPAREN expression RPAREN"""
     tok = p.slice[1]
-    val = tok.value
-    ttype = tok.type
-
-    if ttype == 'IDENTIFIER':
-        p[0] = Identifier(val)
-        p[0].pos = tokpos(tok)
-    elif ttype == 'INT_CONST':
-        p[0] = Constant(val, ctype='int')
-        p[0].pos = tokpos(tok)
-    elif ttype == 'FLOAT_CONST':
-        p[0] = Constant(val, ctype='float')
-        p[0].pos = tokpos(tok)
-    elif ttype == 'STRING_LITERAL':
-        p[0] = Constant(val, ctype='string')
-        p[0].pos = tokpos(tok)
-    elif ttype == 'CHAR_CONST':
-        p[0] = Constant(val, ctype='char')
-        p[0].pos = tokpos(tok)
+    make = _PRIMARY_DISPATCH.get(tok.type)
+    if make is not None:
+        p[0] = make(tok.value, tokpos(tok))
+    elif tok.type == 'string_literal_list':
+        p[0] = p[1]
     else:
         # parenthesized expressions
         p[0] = p[2]
         p[0].pos = tokpos(tok)
 
 
+def p_string_literal_list(p):
+    """string_literal_list : STRING_LITERAL
+                           | string_literal_list STRING_LITERAL"""
+    if len(p) == 2:
+        p[0] = Constant(p[1], 'string', tokpos(p.slice[1]))
+    else:
+        # adjacent literals concatenate, as in C: "ab" "cd" -> "abcd"
+        p[1].value = p[1].value[:-1] + p[2][1:]
+        p[0] = p[1]
+
+
 def p_argument_expression_list(p):
     """argument_expression_list : argument_expression_list COMMA assignment_expression
                                 | assignment_expression"""
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -1010,32 +1070,122 @@ def p_argument_expression_list(p):
 
 def p_error(p):
     if p:
-        msg = f"Syntax error at token {p.type} (value={p.value!r}) line={p.lineno}"
-        logger.error("Phase 4: " + msg)
+        logger.error(
+            "Phase 4: Syntax error at token %s (value=%r) line=%s",
+            p.type, p.value, p.lineno,
+        )
         # try to recover: skip the token
         p.lexer.skip(1)
     else:
         logger.error("Phase 4: Syntax error at EOF")
 
 # Build parser
-parser = yacc.yacc()
+# LALR tables are cached in parsetab.py next to this module: PLY reloads
+# them when their signature (tokens, precedence, rule docstrings) matches,
+# and only rebuilds and rewrites them after a grammar change. That load is
+# well under a millisecond, so optimize=1 (which drops the signature check
+# and keeps using stale tables after a grammar edit) and picklefile (slower
+# to load than the compiled parsetab module) are deliberately not used.
+parser = yacc.yacc(tabmodule="parsetab", write_tables=True)
+
+def _lex_token(ttype, value, lineno, lexpos):
+    tok = LexToken()
+    tok.type = ttype
+    tok.value = value
+    tok.lineno = lineno
+    tok.lexpos = lexpos
+    return tok
+
+class _TokenFeed:
+    """
+    Lexer stand-in for parser.parse(): hands out LexTokens built from a
+    lex_code() TokenStream, which holds exactly the tokens PLY's lexer
+    produces from the same rules.
+    skip(n) reproduces PLY's lexer.skip(n) (move n characters past the end
+    of the last token handed out). Skipped whitespace or one whole token
+    just drops stream entries; newlines skipped that way are never counted
+    by PLY, so later line numbers are shifted down to match. A skip that
+    ends inside a token or comment hands over to a PLY lexer positioned
+    there, which continues the same parse.
+    """
+    __slots__ = ("token", "_source", "_stream", "_types", "_shift", "_lexer")
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._shift = 0
+        self._lexer = None
+        # parse() binds lexer.token once, so token stays the same callable
+        # and a skip swaps the iterator it reads from
+        self._source = source = [None]
+        self.token = lambda: next(source[0], None)
+        self._feed_from(0)
+
+    def _feed_from(self, i):
+        s = self._stream
+        # the type column is a list: its iterator's length hint tells
+        # skip() how many tokens have been handed out
+        self._types = types = iter(s.type[i:] if i else s.type)
+        lines = s.line[i:]
+        if self._shift:
+            lines = map(operator.sub, lines, itertools.repeat(self._shift))
+        self._source[0] = map(_lex_token, types, s.value[i:], lines, s.start[i:])
+
+    def skip(self, n):
+        if self._lexer is not None:
+            self._lexer.skip(n)
+            return
+        s = self._stream
+        src = s.source
+        i = len(s) - operator.length_hint(self._types)
+        end = s.end[i - 1] if i else 0
+        target = end + n
+        nxt = s.start[i] if i < len(s) else len(src)
+        gap = src[end:min(target, nxt)]
+        if not gap.strip(" \t\r\n"):
+            if target <= nxt:
+                self._shift += gap.count("\n")
+                self._feed_from(i)
+                return
+            if i < len(s) and s.end[i] == target:
+                self._shift += gap.count("\n")
+                self._feed_from(i + 1)
+                return
+        lexer = lexer_module.thread_lexer()
+        lexer.input(src)
+        lexer.lexpos = target
+        lexer.lineno = 1 + src.count("\n", 0, end) - self._shift
+        self._lexer = self._source[0] = lexer
 
 # Public API: parse_code() and parse_file()
-def parse_code(code: str) -> Program:
+def parse_code(code: str, preprocess: bool = False) -> Program:
     """
-    Parse cleaned code string and return Program AST root.
+    Parse code string and return Program AST root.
+    The lexer discards comments itself, so raw source parses directly;
+    preprocess=True runs preprocess_code() first, for an AST whose
+    positions match the cleaned code the pipeline shows.
     """
     logger.info("Phase 4: parse_code started")
     try:
-        # Build fresh lexer instance from lexer_module definitions
-        lexer = lex.lex(module=lexer_module, reflags=0) 
+        if preprocess:
+            # imported here: preprocess sets up logging when imported
+            from analyzer_core.core.preprocess import preprocess_code
+            code, _meta = preprocess_code(code)
+        # Tokens come from lex_code(), memoized on the source text: the
+        # pipeline has already lexed this code for the token view, so the
+        # parser does not scan it a second time.
+        # Rules read positions off p.slice tokens (tokpos/get_pos), never
+        # p.lineno(n)/p.lexpos(n), so PLY's position tracking stays off and
+        # parse() runs its parseopt_notrack loop.
         parser.errorok = True
-        result = parser.parse(code, lexer=lexer)
+        result = parser.parse(
+            lexer=_TokenFeed(lexer_module.lex_code(code)),
+            debug=False, tracking=False,
+        )
         logger.info("Phase 4: parse_code finished")
         return result
     except Exception as e:
         logger.error("Phase 4: parse_code failed: %s", e)
-        logger.debug(traceback.format_exc())
+        logger.debug("Phase 4: parse_code traceback", exc_info=True)
         raise
 
 def parse_file(path: str) -> Program:
@@ -1044,5 +1194,5 @@ def parse_file(path: str) -> Program:
         msg = f"Phase 4: parse_file - file not found: {path}"
         logger.error(msg)
         raise FileNotFoundError(msg)
-    code = p.read_text(encoding='utf-8', errors='replace')
+    code = lexer_module.read_source(p)
     return parse_code(code)
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftORleftANDleftEQNEQleftLTGTLEGEleftLSHIFTRSHIFTleftPLUSMINUSleftTIMESDIVIDEMODrightUMINUSUPLUSADDRESS AND ARROW ASSIGN ATOMIC AUTO BAND BNOT BOOL BOR BREAK BXOR CASE CHAR CHAR_CONST COLON COMMA COMPLEX CONST CONTINUE DEC DEFAULT DEREF DIVIDE DIV_ASSIGN DO DOT DOUBLE ELSE ENUM EQ EXTERN FLOAT FLOAT_CONST FOR GE GENERIC GOTO GT HASH IDENTIFIER IF IMAGINARY INC INLINE INT INT_CONST LBRACE LBRACKET LE LONG LPAREN LSHIFT LSHIFT_ASSIGN LT MINUS MINUS_ASSIGN MOD MOD_ASSIGN MUL_ASSIGN NEQ NOT OR PLUS PLUS_ASSIGN PP_DIRECTIVE QUESTION RBRACE RBRACKET REGISTER RESTRICT RETURN RPAREN RSHIFT RSHIFT_ASSIGN SEMICOLON SHORT SIGNED SIZEOF STATIC STATIC_ASSERT STRING_LITERAL STRUCT SWITCH THREAD_LOCAL TIMES TYPEDEF UNION UNSIGNED VOID VOLATILE WHILEprogram : external_listempty :external_list : external_list external_declaration\n                     | external_declarationexternal_declaration : function_definition\n                            | declaration\n                            | include_directive\n                            | PP_DIRECTIVE\n                            | typedef_declaration\n    typedef_declaration : TYPEDEF declarationheader_name : IDENTIFIER\n                   | IDENTIFIER DOT IDENTIFIERinclude_directive : PP_DIRECTIVEdeclaration : type_specifier_seq init_declarator_list SEMICOLONinit_declarator_list : init_declarator_list COMMA init_declarator\n                            | init_declaratorinit_declarator : declarator\n                       | declarator ASSIGN initializerdeclarator : direct_declarator\n                  | pointer direct_declaratorpointer : TIMES\n               | TIMES pointerdirect_declarator : IDENTIFIER\n                         | IDENTIFIER LBRACKET INT_CONST RBRACKET\n                         | IDENTIFIER LBRACKET IDENTIFIER RBRACKET\n                         | IDENTIFIER LBRACKET RBRACKETinitializer : assignment_expressionstruct_specifier : STRUCT IDENTIFIER LBRACE struct_declaration_list RBRACE\n                        | STRUCT LBRACE struct_declaration_list RBRACE\n                        | STRUCT IDENTIFIERstruct_declaration_list : struct_declaration_list struct_declaration\n                               | struct_declarationstruct_declaration : type_specifier_seq init_declarator_list SEMICOLONspecifier_qualifier_list : type_specifier_seq\n                                | type_specifier_seq specifier_qualifier_listtype_specifier_seq : type_specifier_seq type_specifier\n                          | type_specifiertype_name : type_specifier_seq\n                 | type_specifier_seq pointertype_specifier : INT\n                      | CHAR\n                      | VOID\n                      | FLOAT\n                      | DOUBLE\n                      | SHORT\n                      | LONG\n                      | SIGNED\n                      | UNSIGNED\n                      | BOOL\n                      | CONST\n                      | struct_specifier\n                      | IDENTIFIERfunction_definition : type_specifier_seq IDENTIFIER LPAREN parameter_list RPAREN compound_statement\n                           | type_specifier_seq IDENTIFIER LPAREN RPAREN compound_statementparameter_list : parameter_list COMMA parameter_declaration\n                      | parameter_declarationparameter_declaration : type_specifier_seq declarator\n                             | type_specifier_seqcompound_statement : LBRACE statement_list RBRACE\n                          | LBRACE RBRACEstatement_list : statement_list statement\n                      | statementstatement : expression_statement\n                 | compound_statement\n                 | selection_statement\n                 | iteration_statement\n                 | jump_statement\n                 | declaration\n                 | labeled_statementlabeled_statement : CASE constant_expression COLON statement\n                         | DEFAULT COLON statementexpression_statement : expression SEMICOLON\n                            | SEMICOLONselection_statement : IF LPAREN expression RPAREN statement\n                           | IF LPAREN expression RPAREN statement ELSE statement\n                           | SWITCH LPAREN expression RPAREN statementiteration_statement : WHILE LPAREN expression RPAREN statement\n                           | FOR LPAREN expression_statement expression_statement expression RPAREN statement\n                           | FOR LPAREN declaration expression_statement expression RPAREN statement\n                           | FOR LPAREN expression_statement expression_statement RPAREN statement\n                           | FOR LPAREN declaration expression_statement RPAREN statementjump_statement : RETURN expression SEMICOLON\n                      | RETURN SEMICOLON\n                      | BREAK SEMICOLONexpression : assignment_expression\n                  | expression COMMA assignment_expression\n    assignment_expression : conditional_expression\n                          | unary_expression assignment_operator assignment_expression\n    assignment_operator : ASSIGN\n                           | PLUS_ASSIGN\n                           | MINUS_ASSIGN\n                           | MUL_ASSIGN\n                           | DIV_ASSIGN\n                           | MOD_ASSIGN\n                           | LSHIFT_ASSIGN\n                           | RSHIFT_ASSIGNconstant_expression : assignment_expressionlogical_or_expression : logical_or_expression OR logical_and_expression\n                             | logical_and_expressionlogical_and_expression : logical_and_expression AND bitwise_or_expression\n                              | bitwise_or_expressionbitwise_or_expression : bitwise_or_expression BOR bitwise_xor_expression\n                             | bitwise_xor_expressionbitwise_xor_expression : bitwise_xor_expression BXOR bitwise_and_expression\n                              | bitwise_and_expressionbitwise_and_expression : bitwise_and_expression BAND equality_expression\n                              | equality_expressionequality_expression : equality_expression EQ relational_expression\n                           | equality_expression NEQ relational_expression\n                           | relational_expressionrelational_expression : relational_expression LT shift_expression\n                             | relational_expression GT shift_expression\n                             | relational_expression LE shift_expression\n                             | relational_expression GE shift_expression\n                             | shift_expressionshift_expression : shift_expression LSHIFT additive_expression\n                        | shift_expression RSHIFT additive_expression\n                        | additive_expressionadditive_expression : additive_expression PLUS multiplicative_expression\n                           | additive_expression MINUS multiplicative_expression\n                           | multiplicative_expressionmultiplicative_expression : multiplicative_expression TIMES unary_expression\n                                 | multiplicative_expression DIVIDE unary_expression\n                                 | multiplicative_expression MOD unary_expression\n                                 | unary_expression\n    cast_expression : LPAREN type_name RPAREN cast_expression\n                    | postfix_expression\n    unary_expression : postfix_expression\n                        | PLUS unary_expression %prec UPLUS\n                        | MINUS unary_expression %prec UMINUS\n                        | NOT unary_expression\n                        | BAND unary_expressionunary_expression : SIZEOF LPAREN expression RPAREN\n                        | SIZEOF LPAREN type_name RPARENunary_expression : LPAREN type_name RPAREN unary_expressionconditional_expression : logical_or_expression QUESTION expression COLON conditional_expression\n                              | logical_or_expression\n    postfix_expression : primary_expression\n                       | postfix_expression LBRACKET expression RBRACKET\n                       | postfix_expression LPAREN argument_expression_list RPAREN\n                       | postfix_expression LPAREN RPAREN\n                       | postfix_expression DOT IDENTIFIER\n                       | postfix_expression ARROW IDENTIFIER\n                       | postfix_expression INC\n                       | postfix_expression DEC\n    primary_expression : IDENTIFIER\n                          | INT_CONST\n                          | FLOAT_CONST\n                          | STRING_LITERAL\n                          | CHAR_CONST\n                          | LPAREN expression RPARENargument_expression_list : argument_expression_list COMMA assignment_expression\n                                | assignment_expression'
+_lr_signature = 'leftORleftANDleftBORleftBXORleftBANDleftEQNEQleftLTGTLEGEleftLSHIFTRSHIFTleftPLUSMINUSleftTIMESDIVIDEMODrightUMINUSUPLUSADDRESS AND ARROW ASSIGN ATOMIC AUTO BAND BNOT BOOL BOR BREAK BXOR CASE CHAR CHAR_CONST COLON COMMA COMPLEX CONST CONTINUE DEC DEFAULT DEREF DIVIDE DIV_ASSIGN DO DOT DOUBLE ELSE ENUM EQ EXTERN FLOAT FLOAT_CONST FOR GE GENERIC GOTO GT HASH IDENTIFIER IF IMAGINARY INC INLINE INT INT_CONST LBRACE LBRACKET LE LONG LPAREN LSHIFT LSHIFT_ASSIGN LT MINUS MINUS_ASSIGN MOD MOD_ASSIGN MUL_ASSIGN NEQ NOT OR PLUS PLUS_ASSIGN PP_DIRECTIVE QUESTION RBRACE RBRACKET REGISTER RESTRICT RETURN RPAREN RSHIFT RSHIFT_ASSIGN SEMICOLON SHORT SIGNED SIZEOF STATIC STATIC_ASSERT STRING_LITERAL STRUCT SWITCH THREAD_LOCAL TIMES TYPEDEF UNION UNSIGNED VOID VOLATILE WHILEprogram : external_listempty :external_list : external_list external_declaration\n                     | external_declarationexternal_declaration : function_definition\n                            | declaration\n                            | include_directive\n                            | PP_DIRECTIVE\n                            | typedef_declaration\n    typedef_declaration : TYPEDEF declarationheader_name : IDENTIFIER\n                   | IDENTIFIER DOT IDENTIFIERinclude_directive : PP_DIRECTIVEdeclaration : type_specifier_seq init_declarator_list SEMICOLONinit_declarator_list : init_declarator_list COMMA init_declarator\n                            | init_declaratorinit_declarator : declarator\n                       | declarator ASSIGN initializerdeclarator : direct_declarator\n                  | pointer direct_declaratorpointer : TIMES\n               | TIMES pointerdirect_declarator : IDENTIFIER\n                         | IDENTIFIER LBRACKET INT_CONST RBRACKET\n                         | IDENTIFIER LBRACKET IDENTIFIER RBRACKET\n                         | IDENTIFIER LBRACKET RBRACKETinitializer : assignment_expressionstruct_specifier : STRUCT IDENTIFIER LBRACE struct_declaration_list RBRACE\n                        | STRUCT LBRACE struct_declaration_list RBRACE\n                        | STRUCT IDENTIFIERstruct_declaration_list : struct_declaration_list struct_declaration\n                               | struct_declarationstruct_declaration : type_specifier_seq init_declarator_list SEMICOLONspecifier_qualifier_list : type_specifier_seq\n                                | type_specifier_seq specifier_qualifier_listtype_specifier_seq : type_specifier_seq type_specifier\n                          | type_specifiertype_name : type_specifier_seq\n                 | type_specifier_seq pointertype_specifier : INT\n                      | CHAR\n                      | VOID\n                      | FLOAT\n                      | DOUBLE\n                      | SHORT\n                      | LONG\n                      | SIGNED\n                      | UNSIGNED\n                      | BOOL\n                      | CONST\n                      | struct_specifier\n                      | IDENTIFIERfunction_definition : type_specifier_seq IDENTIFIER LPAREN parameter_list RPAREN compound_statement\n                           | type_specifier_seq IDENTIFIER LPAREN RPAREN compound_statementparameter_list : parameter_list COMMA parameter_declaration\n                      | parameter_declarationparameter_declaration : type_specifier_seq declarator\n                             | type_specifier_seqcompound_statement : LBRACE statement_list RBRACE\n                          | LBRACE RBRACEstatement_list : statement_list statement\n                      | statementstatement : expression_statement\n                 | compound_statement\n                 | selection_statement\n                 | iteration_statement\n                 | jump_statement\n                 | declaration\n                 | labeled_statementlabeled_statement : CASE constant_expression COLON statement\n                         | DEFAULT COLON statementexpression_statement : expression SEMICOLON\n                            | SEMICOLONselection_statement : IF LPAREN expression RPAREN statement\n                           | IF LPAREN expression RPAREN statement ELSE statement\n                           | SWITCH LPAREN expression RPAREN statementiteration_statement : WHILE LPAREN expression RPAREN statement\n                           | FOR LPAREN expression_statement expression_statement expression RPAREN statement\n                           | FOR LPAREN declaration expression_statement expression RPAREN statement\n                           | FOR LPAREN expression_statement expression_statement RPAREN statement\n                           | FOR LPAREN declaration expression_statement RPAREN statementjump_statement : RETURN expression SEMICOLON\n                      | RETURN SEMICOLON\n                      | BREAK SEMICOLONexpression : assignment_expression\n                  | expression COMMA assignment_expression\n    assignment_expression : conditional_expression\n                          | unary_expression assignment_operator assignment_expression\n    assignment_operator : ASSIGN\n                           | PLUS_ASSIGN\n                           | MINUS_ASSIGN\n                           | MUL_ASSIGN\n                           | DIV_ASSIGN\n                           | MOD_ASSIGN\n                           | LSHIFT_ASSIGN\n                           | RSHIFT_ASSIGNconstant_expression : assignment_expressionbinary_expression : binary_expression OR binary_expression\n                         | binary_expression AND binary_expression\n                         | binary_expression BOR binary_expression\n                         | binary_expression BXOR binary_expression\n                         | binary_expression BAND binary_expression\n                         | binary_expression EQ binary_expression\n                         | binary_expression NEQ binary_expression\n                         | binary_expression LT binary_expression\n                         | binary_expression GT binary_expression\n                         | binary_expression LE binary_expression\n                         | binary_expression GE binary_expression\n                         | binary_expression LSHIFT binary_expression\n                         | binary_expression RSHIFT binary_expression\n                         | binary_expression PLUS binary_expression\n                         | binary_expression MINUS binary_expression\n                         | binary_expression TIMES binary_expression\n                         | binary_expression DIVIDE binary_expression\n                         | binary_expression MOD binary_expression\n                         | unary_expression\n    cast_expression : LPAREN type_name RPAREN cast_expression\n                    | postfix_expression\n    unary_expression : postfix_expression\n                        | PLUS unary_expression %prec UPLUS\n                        | MINUS unary_expression %prec UMINUS\n                        | NOT unary_expression\n                        | BAND unary_expressionunary_expression : SIZEOF LPAREN expression RPAREN\n                        | SIZEOF LPAREN type_name RPARENunary_expression : LPAREN type_name RPAREN unary_expressionconditional_expression : binary_expression QUESTION expression COLON conditional_expression\n                              | binary_expression\n    postfix_expression : primary_expression\n                       | postfix_expression LBRACKET expression RBRACKET\n                       | postfix_expression LPAREN argument_expression_list RPAREN\n                       | postfix_expression LPAREN RPAREN\n                       | postfix_expression DOT IDENTIFIER\n                       | postfix_expression ARROW IDENTIFIER\n                       | postfix_expression INC\n                       | postfix_expression DEC\n    primary_expression : IDENTIFIER\n                          | INT_CONST\n                          | FLOAT_CONST\n                          | string_literal_list\n                          | CHAR_CONST\n                          | LPAREN expression RPARENstring_literal_list : STRING_LITERAL\n                           | string_literal_list STRING_LITERALargument_expression_list : argument_expression_list COMMA assignment_expression\n                                | assignment_expression'
     
-_lr_action_items = {'PP_DIRECTIVE':([0,2,3,4,5,6,7,8,26,35,41,94,144,147,199,],[7,7,-4,-5,-6,-7,-8,-9,-3,-10,-14,-54,-53,-60,-59,]),'TYPEDEF':([0,2,3,4,5,6,7,8,26,35,41,94,144,147,199,],[11,11,-4,-5,-6,-7,-8,-9,-3,-10,-14,-54,-53,-60,-59,]),'INT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[13,13,-4,-5,-6,-7,-8,-9,13,-52,13,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,13,-30,13,13,-14,-52,13,13,-32,13,13,13,13,-29,-31,13,-54,13,13,13,-52,-28,-33,-53,13,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,13,-83,-84,13,-82,13,-71,13,13,13,-70,-74,-76,-77,13,13,13,13,-80,13,-81,-75,-78,-79,]),'CHAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[14,14,-4,-5,-6,-7,-8,-9,14,-52,14,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,14,-30,14,14,-14,-52,14,14,-32,14,14,14,14,-29,-31,14,-54,14,14,14,-52,-28,-33,-53,14,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,14,-83,-84,14,-82,14,-71,14,14,14,-70,-74,-76,-77,14,14,14,14,-80,14,-81,-75,-78,-79,]),'VOID':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[15,15,-4,-5,-6,-7,-8,-9,15,-52,15,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,15,-30,15,15,-14,-52,15,15,-32,15,15,15,15,-29,-31,15,-54,15,15,15,-52,-28,-33,-53,15,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,15,-83,-84,15,-82,15,-71,15,15,15,-70,-74,-76,-77,15,15,15,15,-80,15,-81,-75,-78,-79,]),'FLOAT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[16,16,-4,-5,-6,-7,-8,-9,16,-52,16,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,16,-30,16,16,-14,-52,16,16,-32,16,16,16,16,-29,-31,16,-54,16,16,16,-52,-28,-33,-53,16,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,16,-83,-84,16,-82,16,-71,16,16,16,-70,-74,-76,-77,16,16,16,16,-80,16,-81,-75,-78,-79,]),'DOUBLE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[17,17,-4,-5,-6,-7,-8,-9,17,-52,17,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,17,-30,17,17,-14,-52,17,17,-32,17,17,17,17,-29,-31,17,-54,17,17,17,-52,-28,-33,-53,17,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,17,-83,-84,17,-82,17,-71,17,17,17,-70,-74,-76,-77,17,17,17,17,-80,17,-81,-75,-78,-79,]),'SHORT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[18,18,-4,-5,-6,-7,-8,-9,18,-52,18,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,18,-30,18,18,-14,-52,18,18,-32,18,18,18,18,-29,-31,18,-54,18,18,18,-52,-28,-33,-53,18,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,18,-83,-84,18,-82,18,-71,18,18,18,-70,-74,-76,-77,18,18,18,18,-80,18,-81,-75,-78,-79,]),'LONG':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[19,19,-4,-5,-6,-7,-8,-9,19,-52,19,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,19,-30,19,19,-14,-52,19,19,-32,19,19,19,19,-29,-31,19,-54,19,19,19,-52,-28,-33,-53,19,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,19,-83,-84,19,-82,19,-71,19,19,19,-70,-74,-76,-77,19,19,19,19,-80,19,-81,-75,-78,-79,]),'SIGNED':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[20,20,-4,-5,-6,-7,-8,-9,20,-52,20,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,20,-30,20,20,-14,-52,20,20,-32,20,20,20,20,-29,-31,20,-54,20,20,20,-52,-28,-33,-53,20,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,20,-83,-84,20,-82,20,-71,20,20,20,-70,-74,-76,-77,20,20,20,20,-80,20,-81,-75,-78,-79,]),'UNSIGNED':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[21,21,-4,-5,-6,-7,-8,-9,21,-52,21,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,21,-30,21,21,-14,-52,21,21,-32,21,21,21,21,-29,-31,21,-54,21,21,21,-52,-28,-33,-53,21,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,21,-83,-84,21,-82,21,-71,21,21,21,-70,-74,-76,-77,21,21,21,21,-80,21,-81,-75,-78,-79,]),'BOOL':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[22,22,-4,-5,-6,-7,-8,-9,22,-52,22,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,22,-30,22,22,-14,-52,22,22,-32,22,22,22,22,-29,-31,22,-54,22,22,22,-52,-28,-33,-53,22,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,22,-83,-84,22,-82,22,-71,22,22,22,-70,-74,-76,-77,22,22,22,22,-80,22,-81,-75,-78,-79,]),'CONST':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[23,23,-4,-5,-6,-7,-8,-9,23,-52,23,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,23,-30,23,23,-14,-52,23,23,-32,23,23,23,23,-29,-31,23,-54,23,23,23,-52,-28,-33,-53,23,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,23,-83,-84,23,-82,23,-71,23,23,23,-70,-74,-76,-77,23,23,23,23,-80,23,-81,-75,-78,-79,]),'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,33,34,35,36,37,38,39,40,41,42,43,46,47,48,49,50,51,52,66,67,68,69,71,87,88,89,93,94,95,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,119,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,157,162,164,178,180,199,200,201,202,203,204,205,207,208,211,212,215,223,224,225,226,227,230,231,232,233,234,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[10,10,-4,-5,-6,-7,-8,-9,27,-52,10,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,37,-3,-52,-36,45,-21,-10,47,-30,10,10,56,-14,45,74,-22,-52,10,10,-32,47,47,74,74,74,74,124,10,-29,-31,10,-54,124,74,-89,-90,-91,-92,-93,-94,-95,-96,74,74,74,74,174,175,124,10,-52,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-28,-33,-53,124,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,74,74,74,74,-59,-61,-72,74,74,74,124,-83,-84,124,74,74,74,74,-82,124,-71,124,124,124,74,74,-70,-74,-76,-77,124,124,124,124,-80,124,-81,-75,-78,-79,]),'STRUCT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,87,88,89,93,94,95,119,122,124,142,143,144,146,147,148,149,150,151,152,153,154,155,157,199,200,201,205,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[25,25,-4,-5,-6,-7,-8,-9,25,-52,25,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,25,-30,25,25,-14,-52,25,25,-32,25,25,25,25,-29,-31,25,-54,25,25,25,-52,-28,-33,-53,25,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,25,-83,-84,25,-82,25,-71,25,25,25,-70,-74,-76,-77,25,25,25,25,-80,25,-81,-75,-78,-79,]),'$end':([1,2,3,4,5,6,7,8,26,35,41,94,144,147,199,],[0,-1,-4,-5,-6,-7,-8,-9,-3,-10,-14,-54,-53,-60,-59,]),'TIMES':([9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,27,29,34,36,37,42,47,51,52,63,65,73,74,76,77,78,79,86,88,113,114,115,116,117,118,122,124,142,169,172,174,175,179,194,195,196,197,198,213,214,216,217,218,],[34,-52,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-36,34,34,-30,34,-52,34,34,-125,-128,-138,-146,-147,-148,-149,-150,139,-29,-144,-145,-129,-130,-131,-132,34,-52,-28,-125,-141,-142,-143,-151,139,139,-122,-123,-124,-139,-140,-133,-134,-135,]),'RPAREN':([10,12,13,14,15,16,17,18,19,20,21,22,23,24,29,32,34,37,39,44,45,46,47,52,53,55,58,62,63,64,65,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,88,91,96,97,110,113,114,115,116,117,118,120,121,122,123,124,142,145,157,166,168,169,171,172,173,174,175,176,177,179,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,201,213,214,216,217,218,219,220,221,222,228,229,233,234,239,241,],[-52,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-36,-19,-21,-30,54,-20,-23,-22,-23,-58,92,-56,-26,-87,-125,-137,-128,-99,-138,-146,-101,-147,-148,-149,-150,-103,-105,-107,-110,-115,-118,-121,-29,-57,-25,-24,172,-144,-145,-129,-130,-131,-132,178,179,-38,-85,-52,-28,-55,-73,-88,-98,-125,214,-141,-153,-142,-143,216,217,-151,-39,-100,-102,-104,-106,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-72,-139,-140,-133,-134,-135,-86,230,231,232,-136,-152,240,242,244,246,]),'COMMA':([10,12,13,14,15,16,17,18,19,20,21,22,23,24,27,28,29,30,31,32,37,44,45,47,52,53,55,58,59,60,61,62,63,64,65,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,88,90,91,96,97,113,114,115,116,117,118,121,123,124,142,145,156,166,167,168,169,170,171,172,173,174,175,176,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,206,213,214,216,217,218,219,220,221,222,228,229,239,241,],[-52,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-23,42,-36,-16,-17,-19,-30,-20,-23,-23,-58,93,-56,-26,-15,-18,-27,-87,-125,-137,-128,-99,-138,-146,-101,-147,-148,-149,-150,-103,-105,-107,-110,-115,-118,-121,-29,42,-57,-25,-24,-144,-145,-129,-130,-131,-132,180,-85,-146,-28,-55,180,-88,180,-98,-125,180,215,-141,-153,-142,-143,180,-151,-100,-102,-104,-106,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,180,-139,-140,-133,-134,-135,-86,180,180,180,-136,-152,180,180,]),'LBRACE':([25,37,41,54,92,95,146,147,148,149,150,151,152,153,154,155,157,199,200,201,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[38,48,-14,95,95,95,95,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,95,-82,95,-71,95,95,95,-70,-74,-76,-77,95,95,95,95,-80,95,-81,-75,-78,-79,]),'LPAREN':([27,41,43,65,66,67,68,69,70,71,73,74,76,77,78,79,95,98,99,100,101,102,103,104,105,106,107,108,109,110,113,114,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,147,148,149,150,151,152,153,154,155,157,158,159,160,161,162,164,172,174,175,178,179,180,199,200,201,202,203,204,205,207,208,211,212,213,214,215,223,224,225,226,227,230,231,232,233,234,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[39,-14,71,110,71,71,71,71,119,71,-138,-146,-147,-148,-149,-150,71,71,-89,-90,-91,-92,-93,-94,-95,-96,71,71,71,71,-144,-145,71,-146,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,202,203,204,205,71,71,-141,-142,-143,71,-151,71,-59,-61,-72,71,71,71,71,-83,-84,71,71,-139,-140,71,71,71,-82,71,-71,71,71,71,71,71,-70,-74,-76,-77,71,71,71,71,-80,71,-81,-75,-78,-79,]),'ASSIGN':([27,31,32,44,45,47,58,63,65,73,74,76,77,78,79,96,97,113,114,115,116,117,118,124,172,174,175,179,213,214,216,217,218,],[-23,43,-19,-20,-23,-23,-26,99,-128,-138,-146,-147,-148,-149,-150,-25,-24,-144,-145,-129,-130,-131,-132,-146,-141,-142,-143,-151,-139,-140,-133,-134,-135,]),'SEMICOLON':([27,28,30,31,32,41,44,45,47,58,59,60,61,62,63,64,65,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,90,95,96,97,113,114,115,116,117,118,123,124,146,147,148,149,150,151,152,153,154,155,156,157,162,163,166,168,169,172,174,175,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,205,206,207,208,211,213,214,216,217,218,219,223,224,225,226,227,228,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-23,41,-16,-17,-19,-14,-20,-23,-23,-26,-15,-18,-27,-87,-125,-137,-128,-99,-138,-146,-101,-147,-148,-149,-150,-103,-105,-107,-110,-115,-118,-121,143,157,-25,-24,-144,-145,-129,-130,-131,-132,-85,-146,157,-60,-62,-63,-64,-65,-66,-67,-68,-69,201,-73,207,208,-88,-98,-125,-141,-142,-143,-151,-100,-102,-104,-106,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-59,-61,-72,157,225,-83,-84,157,-139,-140,-133,-134,-135,-86,157,157,-82,157,-71,-136,157,157,157,-70,-74,-76,-77,157,157,157,157,-80,157,-81,-75,-78,-79,]),'LBRACKET':([27,45,47,65,73,74,76,77,78,79,113,114,124,172,174,175,179,213,214,],[40,40,40,109,-138,-146,-147,-148,-149,-150,-144,-145,-146,-141,-142,-143,-151,-139,-140,]),'INT_CONST':([40,41,43,66,67,68,69,71,95,98,99,100,101,102,103,104,105,106,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,147,148,149,150,151,152,153,154,155,157,162,164,178,180,199,200,201,202,203,204,205,207,208,211,212,215,223,224,225,226,227,230,231,232,233,234,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[57,-14,76,76,76,76,76,76,76,76,-89,-90,-91,-92,-93,-94,-95,-96,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,76,76,76,76,-59,-61,-72,76,76,76,76,-83,-84,76,76,76,76,76,-82,76,-71,76,76,76,76,76,-70,-74,-76,-77,76,76,76,76,-80,76,-81,-75,-78,-79,]),'RBRACKET':([40,56,57,62,63,64,65,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,113,114,115,116,117,118,123,166,168,169,170,172,174,175,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,219,228,],[58,96,97,-87,-125,-137,-128,-99,-138,-146,-101,-147,-148,-149,-150,-103,-105,-107,-110,-115,-118,-121,-144,-145,-129,-130,-131,-132,-85,-88,-98,-125,213,-141,-142,-143,-151,-100,-102,-104,-106,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,-86,-136,]),'RBRACE':([41,49,50,87,89,95,143,146,147,148,149,150,151,152,153,154,155,157,199,200,201,207,208,225,227,235,236,237,238,245,247,248,249,250,],[-14,88,-32,142,-31,147,-33,199,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,-82,-71,-70,-74,-76,-77,-80,-81,-75,-78,-79,]),'IF':([41,95,146,147,148,149,150,151,152,153,154,155,157,199,200,201,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,158,158,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,158,-82,158,-71,158,158,158,-70,-74,-76,-77,158,158,158,158,-80,158,-81,-75,-78,-79,]),'SWITCH':([41,95,146,147,148,149,150,151,152,153,154,155,157,199,200,201,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,159,159,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,159,-82,159,-71,159,159,159,-70,-74,-76,-77,159,159,159,159,-80,159,-81,-75,-78,-79,]),'WHILE':([41,95,146,147,148,149,150,151,152,153,154,155,157,199,200,201,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,160,160,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,160,-82,160,-71,160,160,160,-70,-74,-76,-77,160,160,160,160,-80,160,-81,-75,-78,-79,]),'FOR':([41,95,146,147,148,149,150,151,152,153,154,155,157,199,200,201,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,161,161,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,161,-82,161,-71,161,161,161,-70,-74,-76,-77,161,161,161,161,-80,161,-81,-75,-78,-79,]),'RETURN':([41,95,146,147,148,149,150,151,152,153,154,155,157,199,200,201,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,162,162,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,162,-82,162,-71,162,162,162,-70,-74,-76,-77,162,162,162,162,-80,162,-81,-75,-78,-79,]),'BREAK':([41,95,146,147,148,149,150,151,152,153,154,155,157,199,200,201,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,163,163,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,163,-82,163,-71,163,163,163,-70,-74,-76,-77,163,163,163,163,-80,163,-81,-75,-78,-79,]),'CASE':([41,95,146,147,148,149,150,151,152,153,154,155,157,199,200,201,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,164,164,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,164,-82,164,-71,164,164,164,-70,-74,-76,-77,164,164,164,164,-80,164,-81,-75,-78,-79,]),'DEFAULT':([41,95,146,147,148,149,150,151,152,153,154,155,157,199,200,201,207,208,211,225,226,227,230,231,232,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,165,165,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,165,-82,165,-71,165,165,165,-70,-74,-76,-77,165,165,165,165,-80,165,-81,-75,-78,-79,]),'PLUS':([41,43,63,65,66,67,68,69,71,73,74,76,77,78,79,85,86,95,98,99,100,101,102,103,104,105,106,107,108,109,110,113,114,115,116,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,147,148,149,150,151,152,153,154,155,157,162,164,169,172,174,175,178,179,180,192,193,194,195,196,197,198,199,200,201,202,203,204,205,207,208,211,212,213,214,215,216,217,218,223,224,225,226,227,230,231,232,233,234,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,66,-125,-128,66,66,66,66,66,-138,-146,-147,-148,-149,-150,137,-121,66,66,-89,-90,-91,-92,-93,-94,-95,-96,66,66,66,66,-144,-145,-129,-130,-131,-132,66,-146,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,66,66,-125,-141,-142,-143,66,-151,66,137,137,-119,-120,-122,-123,-124,-59,-61,-72,66,66,66,66,-83,-84,66,66,-139,-140,66,-133,-134,-135,66,66,-82,66,-71,66,66,66,66,66,-70,-74,-76,-77,66,66,66,66,-80,66,-81,-75,-78,-79,]),'MINUS':([41,43,63,65,66,67,68,69,71,73,74,76,77,78,79,85,86,95,98,99,100,101,102,103,104,105,106,107,108,109,110,113,114,115,116,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,147,148,149,150,151,152,153,154,155,157,162,164,169,172,174,175,178,179,180,192,193,194,195,196,197,198,199,200,201,202,203,204,205,207,208,211,212,213,214,215,216,217,218,223,224,225,226,227,230,231,232,233,234,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,67,-125,-128,67,67,67,67,67,-138,-146,-147,-148,-149,-150,138,-121,67,67,-89,-90,-91,-92,-93,-94,-95,-96,67,67,67,67,-144,-145,-129,-130,-131,-132,67,-146,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,67,67,-125,-141,-142,-143,67,-151,67,138,138,-119,-120,-122,-123,-124,-59,-61,-72,67,67,67,67,-83,-84,67,67,-139,-140,67,-133,-134,-135,67,67,-82,67,-71,67,67,67,67,67,-70,-74,-76,-77,67,67,67,67,-80,67,-81,-75,-78,-79,]),'NOT':([41,43,66,67,68,69,71,95,98,99,100,101,102,103,104,105,106,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,147,148,149,150,151,152,153,154,155,157,162,164,178,180,199,200,201,202,203,204,205,207,208,211,212,215,223,224,225,226,227,230,231,232,233,234,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,68,68,68,68,68,68,68,68,-89,-90,-91,-92,-93,-94,-95,-96,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,68,68,68,68,-59,-61,-72,68,68,68,68,-83,-84,68,68,68,68,68,-82,68,-71,68,68,68,68,68,-70,-74,-76,-77,68,68,68,68,-80,68,-81,-75,-78,-79,]),'BAND':([41,43,63,65,66,67,68,69,71,73,74,76,77,78,79,81,82,83,84,85,86,95,98,99,100,101,102,103,104,105,106,107,108,109,110,113,114,115,116,117,118,119,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,147,148,149,150,151,152,153,154,155,157,162,164,169,172,174,175,178,179,180,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,207,208,211,212,213,214,215,216,217,218,223,224,225,226,227,230,231,232,233,234,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,69,-125,-128,69,69,69,69,69,-138,-146,-147,-148,-149,-150,128,-107,-110,-115,-118,-121,69,69,-89,-90,-91,-92,-93,-94,-95,-96,69,69,69,69,-144,-145,-129,-130,-131,-132,69,-146,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,69,69,-125,-141,-142,-143,69,-151,69,128,-106,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-59,-61,-72,69,69,69,69,-83,-84,69,69,-139,-140,69,-133,-134,-135,69,69,-82,69,-71,69,69,69,69,69,-70,-74,-76,-77,69,69,69,69,-80,69,-81,-75,-78,-79,]),'SIZEOF':([41,43,66,67,68,69,71,95,98,99,100,101,102,103,104,105,106,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,147,148,149,150,151,152,153,154,155,157,162,164,178,180,199,200,201,202,203,204,205,207,208,211,212,215,223,224,225,226,227,230,231,232,233,234,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,70,70,70,70,70,70,70,70,-89,-90,-91,-92,-93,-94,-95,-96,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,70,70,70,70,-59,-61,-72,70,70,70,70,-83,-84,70,70,70,70,70,-82,70,-71,70,70,70,70,70,-70,-74,-76,-77,70,70,70,70,-80,70,-81,-75,-78,-79,]),'FLOAT_CONST':([41,43,66,67,68,69,71,95,98,99,100,101,102,103,104,105,106,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,147,148,149,150,151,152,153,154,155,157,162,164,178,180,199,200,201,202,203,204,205,207,208,211,212,215,223,224,225,226,227,230,231,232,233,234,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,77,77,77,77,77,77,77,77,-89,-90,-91,-92,-93,-94,-95,-96,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,77,77,77,77,-59,-61,-72,77,77,77,77,-83,-84,77,77,77,77,77,-82,77,-71,77,77,77,77,77,-70,-74,-76,-77,77,77,77,77,-80,77,-81,-75,-78,-79,]),'STRING_LITERAL':([41,43,66,67,68,69,71,95,98,99,100,101,102,103,104,105,106,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,147,148,149,150,151,152,153,154,155,157,162,164,178,180,199,200,201,202,203,204,205,207,208,211,212,215,223,224,225,226,227,230,231,232,233,234,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,78,78,78,78,78,78,78,78,-89,-90,-91,-92,-93,-94,-95,-96,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,78,78,78,78,-59,-61,-72,78,78,78,78,-83,-84,78,78,78,78,78,-82,78,-71,78,78,78,78,78,-70,-74,-76,-77,78,78,78,78,-80,78,-81,-75,-78,-79,]),'CHAR_CONST':([41,43,66,67,68,69,71,95,98,99,100,101,102,103,104,105,106,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,147,148,149,150,151,152,153,154,155,157,162,164,178,180,199,200,201,202,203,204,205,207,208,211,212,215,223,224,225,226,227,230,231,232,233,234,235,236,237,238,240,242,243,244,245,246,247,248,249,250,],[-14,79,79,79,79,79,79,79,79,-89,-90,-91,-92,-93,-94,-95,-96,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,79,79,79,79,-59,-61,-72,79,79,79,79,-83,-84,79,79,79,79,79,-82,79,-71,79,79,79,79,79,-70,-74,-76,-77,79,79,79,79,-80,79,-81,-75,-78,-79,]),'ELSE':([41,147,149,150,151,152,153,154,155,157,199,201,207,208,225,227,235,236,237,238,245,247,248,249,250,],[-14,-60,-63,-64,-65,-66,-67,-68,-69,-73,-59,-72,-83,-84,-82,-71,-70,243,-76,-77,-80,-81,-75,-78,-79,]),'COLON':([62,63,64,65,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,113,114,115,116,117,118,123,165,166,167,168,169,172,174,175,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,209,210,213,214,216,217,218,219,228,],[-87,-125,-137,-128,-99,-138,-146,-101,-147,-148,-149,-150,-103,-105,-107,-110,-115,-118,-121,-144,-145,-129,-130,-131,-132,-85,211,-88,212,-98,-125,-141,-142,-143,-151,-100,-102,-104,-106,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,226,-97,-139,-140,-133,-134,-135,-86,-136,]),'DIVIDE':([63,65,73,74,76,77,78,79,86,113,114,115,116,117,118,124,169,172,174,175,179,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,-147,-148,-149,-150,140,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,140,140,-122,-123,-124,-139,-140,-133,-134,-135,]),'MOD':([63,65,73,74,76,77,78,79,86,113,114,115,116,117,118,124,169,172,174,175,179,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,-147,-148,-149,-150,141,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,141,141,-122,-123,-124,-139,-140,-133,-134,-135,]),'LSHIFT':([63,65,73,74,76,77,78,79,84,85,86,113,114,115,116,117,118,124,169,172,174,175,179,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,-147,-148,-149,-150,135,-118,-121,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,135,135,135,135,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'RSHIFT':([63,65,73,74,76,77,78,79,84,85,86,113,114,115,116,117,118,124,169,172,174,175,179,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,-147,-148,-149,-150,136,-118,-121,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,136,136,136,136,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'LT':([63,65,73,74,76,77,78,79,83,84,85,86,113,114,115,116,117,118,124,169,172,174,175,179,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,-147,-148,-149,-150,131,-115,-118,-121,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,131,131,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'GT':([63,65,73,74,76,77,78,79,83,84,85,86,113,114,115,116,117,118,124,169,172,174,175,179,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,-147,-148,-149,-150,132,-115,-118,-121,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,132,132,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'LE':([63,65,73,74,76,77,78,79,83,84,85,86,113,114,115,116,117,118,124,169,172,174,175,179,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,-147,-148,-149,-150,133,-115,-118,-121,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,133,133,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'GE':([63,65,73,74,76,77,78,79,83,84,85,86,113,114,115,116,117,118,124,169,172,174,175,179,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,-147,-148,-149,-150,134,-115,-118,-121,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,134,134,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'EQ':([63,65,73,74,76,77,78,79,82,83,84,85,86,113,114,115,116,117,118,124,169,172,174,175,179,185,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,-147,-148,-149,-150,129,-110,-115,-118,-121,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,129,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'NEQ':([63,65,73,74,76,77,78,79,82,83,84,85,86,113,114,115,116,117,118,124,169,172,174,175,179,185,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,-147,-148,-149,-150,130,-110,-115,-118,-121,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,130,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'BXOR':([63,65,73,74,76,77,78,79,80,81,82,83,84,85,86,113,114,115,116,117,118,124,169,172,174,175,179,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,-147,-148,-149,-150,127,-105,-107,-110,-115,-118,-121,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,127,-104,-106,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'BOR':([63,65,73,74,75,76,77,78,79,80,81,82,83,84,85,86,113,114,115,116,117,118,124,169,172,174,175,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,-128,-138,-146,126,-147,-148,-149,-150,-103,-105,-107,-110,-115,-118,-121,-144,-145,-129,-130,-131,-132,-146,-125,-141,-142,-143,-151,126,-102,-104,-106,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'AND':([63,65,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,113,114,115,116,117,118,124,168,169,172,174,175,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,-128,125,-138,-146,-101,-147,-148,-149,-150,-103,-105,-107,-110,-115,-118,-121,-144,-145,-129,-130,-131,-132,-146,125,-125,-141,-142,-143,-151,-100,-102,-104,-106,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'QUESTION':([63,64,65,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,113,114,115,116,117,118,124,168,169,172,174,175,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,107,-128,-99,-138,-146,-101,-147,-148,-149,-150,-103,-105,-107,-110,-115,-118,-121,-144,-145,-129,-130,-131,-132,-146,-98,-125,-141,-142,-143,-151,-100,-102,-104,-106,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'OR':([63,64,65,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,113,114,115,116,117,118,124,168,169,172,174,175,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,213,214,216,217,218,],[-125,108,-128,-99,-138,-146,-101,-147,-148,-149,-150,-103,-105,-107,-110,-115,-118,-121,-144,-145,-129,-130,-131,-132,-146,-98,-125,-141,-142,-143,-151,-100,-102,-104,-106,-108,-109,-111,-112,-113,-114,-116,-117,-119,-120,-122,-123,-124,-139,-140,-133,-134,-135,]),'PLUS_ASSIGN':([63,65,73,74,76,77,78,79,113,114,115,116,117,118,124,172,174,175,179,213,214,216,217,218,],[100,-128,-138,-146,-147,-148,-149,-150,-144,-145,-129,-130,-131,-132,-146,-141,-142,-143,-151,-139,-140,-133,-134,-135,]),'MINUS_ASSIGN':([63,65,73,74,76,77,78,79,113,114,115,116,117,118,124,172,174,175,179,213,214,216,217,218,],[101,-128,-138,-146,-147,-148,-149,-150,-144,-145,-129,-130,-131,-132,-146,-141,-142,-143,-151,-139,-140,-133,-134,-135,]),'MUL_ASSIGN':([63,65,73,74,76,77,78,79,113,114,115,116,117,118,124,172,174,175,179,213,214,216,217,218,],[102,-128,-138,-146,-147,-148,-149,-150,-144,-145,-129,-130,-131,-132,-146,-141,-142,-143,-151,-139,-140,-133,-134,-135,]),'DIV_ASSIGN':([63,65,73,74,76,77,78,79,113,114,115,116,117,118,124,172,174,175,179,213,214,216,217,218,],[103,-128,-138,-146,-147,-148,-149,-150,-144,-145,-129,-130,-131,-132,-146,-141,-142,-143,-151,-139,-140,-133,-134,-135,]),'MOD_ASSIGN':([63,65,73,74,76,77,78,79,113,114,115,116,117,118,124,172,174,175,179,213,214,216,217,218,],[104,-128,-138,-146,-147,-148,-149,-150,-144,-145,-129,-130,-131,-132,-146,-141,-142,-143,-151,-139,-140,-133,-134,-135,]),'LSHIFT_ASSIGN':([63,65,73,74,76,77,78,79,113,114,115,116,117,118,124,172,174,175,179,213,214,216,217,218,],[105,-128,-138,-146,-147,-148,-149,-150,-144,-145,-129,-130,-131,-132,-146,-141,-142,-143,-151,-139,-140,-133,-134,-135,]),'RSHIFT_ASSIGN':([63,65,73,74,76,77,78,79,113,114,115,116,117,118,124,172,174,175,179,213,214,216,217,218,],[106,-128,-138,-146,-147,-148,-149,-150,-144,-145,-129,-130,-131,-132,-146,-141,-142,-143,-151,-139,-140,-133,-134,-135,]),'DOT':([65,73,74,76,77,78,79,113,114,124,172,174,175,179,213,214,],[111,-138,-146,-147,-148,-149,-150,-144,-145,-146,-141,-142,-143,-151,-139,-140,]),'ARROW':([65,73,74,76,77,78,79,113,114,124,172,174,175,179,213,214,],[112,-138,-146,-147,-148,-149,-150,-144,-145,-146,-141,-142,-143,-151,-139,-140,]),'INC':([65,73,74,76,77,78,79,113,114,124,172,174,175,179,213,214,],[113,-138,-146,-147,-148,-149,-150,-144,-145,-146,-141,-142,-143,-151,-139,-140,]),'DEC':([65,73,74,76,77,78,79,113,114,124,172,174,175,179,213,214,],[114,-138,-146,-147,-148,-149,-150,-144,-145,-146,-141,-142,-143,-151,-139,-140,]),}
+_lr_action_items = {'PP_DIRECTIVE':([0,2,3,4,5,6,7,8,26,35,41,86,137,140,192,],[7,7,-4,-5,-6,-7,-8,-9,-3,-10,-14,-54,-53,-60,-59,]),'TYPEDEF':([0,2,3,4,5,6,7,8,26,35,41,86,137,140,192,],[11,11,-4,-5,-6,-7,-8,-9,-3,-10,-14,-54,-53,-60,-59,]),'INT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[13,13,-4,-5,-6,-7,-8,-9,13,-52,13,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,13,-30,13,13,-14,-52,13,13,-32,13,13,13,13,-29,-31,13,-54,13,13,13,-52,-28,-33,-53,13,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,13,-83,-84,13,-82,13,-71,13,13,13,-70,-74,-76,-77,13,13,13,13,-80,13,-81,-75,-78,-79,]),'CHAR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[14,14,-4,-5,-6,-7,-8,-9,14,-52,14,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,14,-30,14,14,-14,-52,14,14,-32,14,14,14,14,-29,-31,14,-54,14,14,14,-52,-28,-33,-53,14,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,14,-83,-84,14,-82,14,-71,14,14,14,-70,-74,-76,-77,14,14,14,14,-80,14,-81,-75,-78,-79,]),'VOID':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[15,15,-4,-5,-6,-7,-8,-9,15,-52,15,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,15,-30,15,15,-14,-52,15,15,-32,15,15,15,15,-29,-31,15,-54,15,15,15,-52,-28,-33,-53,15,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,15,-83,-84,15,-82,15,-71,15,15,15,-70,-74,-76,-77,15,15,15,15,-80,15,-81,-75,-78,-79,]),'FLOAT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[16,16,-4,-5,-6,-7,-8,-9,16,-52,16,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,16,-30,16,16,-14,-52,16,16,-32,16,16,16,16,-29,-31,16,-54,16,16,16,-52,-28,-33,-53,16,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,16,-83,-84,16,-82,16,-71,16,16,16,-70,-74,-76,-77,16,16,16,16,-80,16,-81,-75,-78,-79,]),'DOUBLE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[17,17,-4,-5,-6,-7,-8,-9,17,-52,17,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,17,-30,17,17,-14,-52,17,17,-32,17,17,17,17,-29,-31,17,-54,17,17,17,-52,-28,-33,-53,17,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,17,-83,-84,17,-82,17,-71,17,17,17,-70,-74,-76,-77,17,17,17,17,-80,17,-81,-75,-78,-79,]),'SHORT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[18,18,-4,-5,-6,-7,-8,-9,18,-52,18,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,18,-30,18,18,-14,-52,18,18,-32,18,18,18,18,-29,-31,18,-54,18,18,18,-52,-28,-33,-53,18,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,18,-83,-84,18,-82,18,-71,18,18,18,-70,-74,-76,-77,18,18,18,18,-80,18,-81,-75,-78,-79,]),'LONG':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[19,19,-4,-5,-6,-7,-8,-9,19,-52,19,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,19,-30,19,19,-14,-52,19,19,-32,19,19,19,19,-29,-31,19,-54,19,19,19,-52,-28,-33,-53,19,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,19,-83,-84,19,-82,19,-71,19,19,19,-70,-74,-76,-77,19,19,19,19,-80,19,-81,-75,-78,-79,]),'SIGNED':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[20,20,-4,-5,-6,-7,-8,-9,20,-52,20,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,20,-30,20,20,-14,-52,20,20,-32,20,20,20,20,-29,-31,20,-54,20,20,20,-52,-28,-33,-53,20,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,20,-83,-84,20,-82,20,-71,20,20,20,-70,-74,-76,-77,20,20,20,20,-80,20,-81,-75,-78,-79,]),'UNSIGNED':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[21,21,-4,-5,-6,-7,-8,-9,21,-52,21,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,21,-30,21,21,-14,-52,21,21,-32,21,21,21,21,-29,-31,21,-54,21,21,21,-52,-28,-33,-53,21,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,21,-83,-84,21,-82,21,-71,21,21,21,-70,-74,-76,-77,21,21,21,21,-80,21,-81,-75,-78,-79,]),'BOOL':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[22,22,-4,-5,-6,-7,-8,-9,22,-52,22,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,22,-30,22,22,-14,-52,22,22,-32,22,22,22,22,-29,-31,22,-54,22,22,22,-52,-28,-33,-53,22,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,22,-83,-84,22,-82,22,-71,22,22,22,-70,-74,-76,-77,22,22,22,22,-80,22,-81,-75,-78,-79,]),'CONST':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[23,23,-4,-5,-6,-7,-8,-9,23,-52,23,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,23,-30,23,23,-14,-52,23,23,-32,23,23,23,23,-29,-31,23,-54,23,23,23,-52,-28,-33,-53,23,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,23,-83,-84,23,-82,23,-71,23,23,23,-70,-74,-76,-77,23,23,23,23,-80,23,-81,-75,-78,-79,]),'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,33,34,35,36,37,38,39,40,41,42,43,46,47,48,49,50,51,52,66,67,68,69,71,79,80,81,85,86,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,155,157,188,190,192,193,194,195,196,197,198,200,201,204,205,208,216,217,218,219,220,223,224,225,226,227,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[10,10,-4,-5,-6,-7,-8,-9,27,-52,10,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,37,-3,-52,-36,45,-21,-10,47,-30,10,10,56,-14,45,73,-22,-52,10,10,-32,47,47,73,73,73,73,133,10,-29,-31,10,-54,133,73,-89,-90,-91,-92,-93,-94,-95,-96,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,184,185,133,10,-52,-28,-33,-53,133,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,73,73,73,73,-59,-61,-72,73,73,73,133,-83,-84,133,73,73,73,73,-82,133,-71,133,133,133,73,73,-70,-74,-76,-77,133,133,133,133,-80,133,-81,-75,-78,-79,]),'STRUCT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,29,35,36,37,38,39,41,47,48,49,50,51,52,71,79,80,81,85,86,87,128,131,133,135,136,137,139,140,141,142,143,144,145,146,147,148,150,192,193,194,198,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[25,25,-4,-5,-6,-7,-8,-9,25,-52,25,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-3,-52,-36,-10,25,-30,25,25,-14,-52,25,25,-32,25,25,25,25,-29,-31,25,-54,25,25,25,-52,-28,-33,-53,25,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,25,-83,-84,25,-82,25,-71,25,25,25,-70,-74,-76,-77,25,25,25,25,-80,25,-81,-75,-78,-79,]),'$end':([1,2,3,4,5,6,7,8,26,35,41,86,137,140,192,],[0,-1,-4,-5,-6,-7,-8,-9,-3,-10,-14,-54,-53,-60,-59,]),'TIMES':([9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,27,29,34,36,37,42,47,51,52,63,64,65,72,73,74,75,76,77,78,80,122,123,124,125,126,127,131,133,134,135,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[34,-52,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-36,34,34,-30,34,-52,34,34,-116,115,-119,-129,-137,-138,-139,-140,-141,-143,-29,-135,-136,-120,-121,-122,-123,34,-52,-144,-28,115,-116,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'RPAREN':([10,12,13,14,15,16,17,18,19,20,21,22,23,24,29,32,34,37,39,44,45,46,47,52,53,55,58,62,63,64,65,72,73,74,75,76,77,78,80,83,88,89,119,122,123,124,125,126,127,129,130,131,132,133,134,135,138,150,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,181,182,183,184,185,186,187,189,191,194,206,207,209,210,211,212,213,214,215,221,222,226,227,232,234,],[-52,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-36,-19,-21,-30,54,-20,-23,-22,-23,-58,84,-56,-26,-87,-116,-128,-119,-129,-137,-138,-139,-140,-141,-143,-29,-57,-25,-24,182,-135,-136,-120,-121,-122,-123,188,189,-38,-85,-52,-144,-28,-55,-73,-88,-98,-116,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,207,-132,-146,-133,-134,209,210,-142,-39,-72,-130,-131,-124,-125,-126,-86,223,224,225,-127,-145,233,235,237,239,]),'COMMA':([10,12,13,14,15,16,17,18,19,20,21,22,23,24,27,28,29,30,31,32,37,44,45,47,52,53,55,58,59,60,61,62,63,64,65,72,73,74,75,76,77,78,80,82,83,88,89,122,123,124,125,126,127,130,132,133,134,135,138,149,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,189,199,206,207,209,210,211,212,213,214,215,221,222,232,234,],[-52,-37,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-23,42,-36,-16,-17,-19,-30,-20,-23,-23,-58,85,-56,-26,-15,-18,-27,-87,-116,-128,-119,-129,-137,-138,-139,-140,-141,-143,-29,42,-57,-25,-24,-135,-136,-120,-121,-122,-123,190,-85,-137,-144,-28,-55,190,-88,190,-98,-116,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,190,208,-132,-146,-133,-134,190,-142,190,-130,-131,-124,-125,-126,-86,190,190,190,-127,-145,190,190,]),'LBRACE':([25,37,41,54,84,87,139,140,141,142,143,144,145,146,147,148,150,192,193,194,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[38,48,-14,87,87,87,87,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,87,-82,87,-71,87,87,87,-70,-74,-76,-77,87,87,87,87,-80,87,-81,-75,-78,-79,]),'LPAREN':([27,41,43,65,66,67,68,69,70,71,72,73,74,75,76,77,78,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,128,133,134,139,140,141,142,143,144,145,146,147,148,150,151,152,153,154,155,157,182,184,185,188,189,190,192,193,194,195,196,197,198,200,201,204,205,206,207,208,216,217,218,219,220,223,224,225,226,227,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[39,-14,71,119,71,71,71,71,128,71,-129,-137,-138,-139,-140,-141,-143,71,71,-89,-90,-91,-92,-93,-94,-95,-96,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-135,-136,71,-137,-144,71,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,195,196,197,198,71,71,-132,-133,-134,71,-142,71,-59,-61,-72,71,71,71,71,-83,-84,71,71,-130,-131,71,71,71,-82,71,-71,71,71,71,71,71,-70,-74,-76,-77,71,71,71,71,-80,71,-81,-75,-78,-79,]),'ASSIGN':([27,31,32,44,45,47,58,63,65,72,73,74,75,76,77,78,88,89,122,123,124,125,126,127,133,134,182,184,185,189,206,207,209,210,211,],[-23,43,-19,-20,-23,-23,-26,91,-119,-129,-137,-138,-139,-140,-141,-143,-25,-24,-135,-136,-120,-121,-122,-123,-137,-144,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'SEMICOLON':([27,28,30,31,32,41,44,45,47,58,59,60,61,62,63,64,65,72,73,74,75,76,77,78,82,87,88,89,122,123,124,125,126,127,132,133,134,139,140,141,142,143,144,145,146,147,148,149,150,155,156,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,192,193,194,198,199,200,201,204,206,207,209,210,211,212,216,217,218,219,220,221,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-23,41,-16,-17,-19,-14,-20,-23,-23,-26,-15,-18,-27,-87,-116,-128,-119,-129,-137,-138,-139,-140,-141,-143,136,150,-25,-24,-135,-136,-120,-121,-122,-123,-85,-137,-144,150,-60,-62,-63,-64,-65,-66,-67,-68,-69,194,-73,200,201,-88,-98,-116,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-59,-61,-72,150,218,-83,-84,150,-130,-131,-124,-125,-126,-86,150,150,-82,150,-71,-127,150,150,150,-70,-74,-76,-77,150,150,150,150,-80,150,-81,-75,-78,-79,]),'LBRACKET':([27,45,47,65,72,73,74,75,76,77,78,122,123,133,134,182,184,185,189,206,207,],[40,40,40,118,-129,-137,-138,-139,-140,-141,-143,-135,-136,-137,-144,-132,-133,-134,-142,-130,-131,]),'INT_CONST':([40,41,43,66,67,68,69,71,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,128,139,140,141,142,143,144,145,146,147,148,150,155,157,188,190,192,193,194,195,196,197,198,200,201,204,205,208,216,217,218,219,220,223,224,225,226,227,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[57,-14,74,74,74,74,74,74,74,74,-89,-90,-91,-92,-93,-94,-95,-96,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,74,74,74,74,-59,-61,-72,74,74,74,74,-83,-84,74,74,74,74,74,-82,74,-71,74,74,74,74,74,-70,-74,-76,-77,74,74,74,74,-80,74,-81,-75,-78,-79,]),'RBRACKET':([40,56,57,62,63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,132,134,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,184,185,189,206,207,209,210,211,212,221,],[58,88,89,-87,-116,-128,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-85,-144,-88,-98,-116,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,206,-132,-133,-134,-142,-130,-131,-124,-125,-126,-86,-127,]),'RBRACE':([41,49,50,79,81,87,136,139,140,141,142,143,144,145,146,147,148,150,192,193,194,200,201,218,220,228,229,230,231,238,240,241,242,243,],[-14,80,-32,135,-31,140,-33,192,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,-82,-71,-70,-74,-76,-77,-80,-81,-75,-78,-79,]),'IF':([41,87,139,140,141,142,143,144,145,146,147,148,150,192,193,194,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,151,151,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,151,-82,151,-71,151,151,151,-70,-74,-76,-77,151,151,151,151,-80,151,-81,-75,-78,-79,]),'SWITCH':([41,87,139,140,141,142,143,144,145,146,147,148,150,192,193,194,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,152,152,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,152,-82,152,-71,152,152,152,-70,-74,-76,-77,152,152,152,152,-80,152,-81,-75,-78,-79,]),'WHILE':([41,87,139,140,141,142,143,144,145,146,147,148,150,192,193,194,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,153,153,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,153,-82,153,-71,153,153,153,-70,-74,-76,-77,153,153,153,153,-80,153,-81,-75,-78,-79,]),'FOR':([41,87,139,140,141,142,143,144,145,146,147,148,150,192,193,194,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,154,154,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,154,-82,154,-71,154,154,154,-70,-74,-76,-77,154,154,154,154,-80,154,-81,-75,-78,-79,]),'RETURN':([41,87,139,140,141,142,143,144,145,146,147,148,150,192,193,194,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,155,155,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,155,-82,155,-71,155,155,155,-70,-74,-76,-77,155,155,155,155,-80,155,-81,-75,-78,-79,]),'BREAK':([41,87,139,140,141,142,143,144,145,146,147,148,150,192,193,194,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,156,156,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,156,-82,156,-71,156,156,156,-70,-74,-76,-77,156,156,156,156,-80,156,-81,-75,-78,-79,]),'CASE':([41,87,139,140,141,142,143,144,145,146,147,148,150,192,193,194,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,157,157,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,157,-82,157,-71,157,157,157,-70,-74,-76,-77,157,157,157,157,-80,157,-81,-75,-78,-79,]),'DEFAULT':([41,87,139,140,141,142,143,144,145,146,147,148,150,192,193,194,200,201,204,218,219,220,223,224,225,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,158,158,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,-59,-61,-72,-83,-84,158,-82,158,-71,158,158,158,-70,-74,-76,-77,158,158,158,158,-80,158,-81,-75,-78,-79,]),'PLUS':([41,43,63,64,65,66,67,68,69,71,72,73,74,75,76,77,78,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,124,125,126,127,128,133,134,139,140,141,142,143,144,145,146,147,148,150,155,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,188,189,190,192,193,194,195,196,197,198,200,201,204,205,206,207,208,209,210,211,216,217,218,219,220,223,224,225,226,227,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,66,-116,113,-119,66,66,66,66,66,-129,-137,-138,-139,-140,-141,-143,66,66,-89,-90,-91,-92,-93,-94,-95,-96,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-135,-136,-120,-121,-122,-123,66,-137,-144,66,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,66,66,113,-116,113,113,113,113,113,113,113,113,113,113,113,113,-111,-112,-113,-114,-115,-132,-133,-134,66,-142,66,-59,-61,-72,66,66,66,66,-83,-84,66,66,-130,-131,66,-124,-125,-126,66,66,-82,66,-71,66,66,66,66,66,-70,-74,-76,-77,66,66,66,66,-80,66,-81,-75,-78,-79,]),'MINUS':([41,43,63,64,65,66,67,68,69,71,72,73,74,75,76,77,78,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,124,125,126,127,128,133,134,139,140,141,142,143,144,145,146,147,148,150,155,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,188,189,190,192,193,194,195,196,197,198,200,201,204,205,206,207,208,209,210,211,216,217,218,219,220,223,224,225,226,227,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,67,-116,114,-119,67,67,67,67,67,-129,-137,-138,-139,-140,-141,-143,67,67,-89,-90,-91,-92,-93,-94,-95,-96,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-135,-136,-120,-121,-122,-123,67,-137,-144,67,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,67,67,114,-116,114,114,114,114,114,114,114,114,114,114,114,114,-111,-112,-113,-114,-115,-132,-133,-134,67,-142,67,-59,-61,-72,67,67,67,67,-83,-84,67,67,-130,-131,67,-124,-125,-126,67,67,-82,67,-71,67,67,67,67,67,-70,-74,-76,-77,67,67,67,67,-80,67,-81,-75,-78,-79,]),'NOT':([41,43,66,67,68,69,71,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,128,139,140,141,142,143,144,145,146,147,148,150,155,157,188,190,192,193,194,195,196,197,198,200,201,204,205,208,216,217,218,219,220,223,224,225,226,227,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,68,68,68,68,68,68,68,68,-89,-90,-91,-92,-93,-94,-95,-96,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,68,68,68,68,-59,-61,-72,68,68,68,68,-83,-84,68,68,68,68,68,-82,68,-71,68,68,68,68,68,-70,-74,-76,-77,68,68,68,68,-80,68,-81,-75,-78,-79,]),'BAND':([41,43,63,64,65,66,67,68,69,71,72,73,74,75,76,77,78,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,122,123,124,125,126,127,128,133,134,139,140,141,142,143,144,145,146,147,148,150,155,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,188,189,190,192,193,194,195,196,197,198,200,201,204,205,206,207,208,209,210,211,216,217,218,219,220,223,224,225,226,227,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,69,-116,104,-119,69,69,69,69,69,-129,-137,-138,-139,-140,-141,-143,69,69,-89,-90,-91,-92,-93,-94,-95,-96,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-135,-136,-120,-121,-122,-123,69,-137,-144,69,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,69,69,104,-116,104,104,104,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,69,-142,69,-59,-61,-72,69,69,69,69,-83,-84,69,69,-130,-131,69,-124,-125,-126,69,69,-82,69,-71,69,69,69,69,69,-70,-74,-76,-77,69,69,69,69,-80,69,-81,-75,-78,-79,]),'SIZEOF':([41,43,66,67,68,69,71,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,128,139,140,141,142,143,144,145,146,147,148,150,155,157,188,190,192,193,194,195,196,197,198,200,201,204,205,208,216,217,218,219,220,223,224,225,226,227,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,70,70,70,70,70,70,70,70,-89,-90,-91,-92,-93,-94,-95,-96,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,70,70,70,70,-59,-61,-72,70,70,70,70,-83,-84,70,70,70,70,70,-82,70,-71,70,70,70,70,70,-70,-74,-76,-77,70,70,70,70,-80,70,-81,-75,-78,-79,]),'FLOAT_CONST':([41,43,66,67,68,69,71,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,128,139,140,141,142,143,144,145,146,147,148,150,155,157,188,190,192,193,194,195,196,197,198,200,201,204,205,208,216,217,218,219,220,223,224,225,226,227,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,75,75,75,75,75,75,75,75,-89,-90,-91,-92,-93,-94,-95,-96,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,75,75,75,75,-59,-61,-72,75,75,75,75,-83,-84,75,75,75,75,75,-82,75,-71,75,75,75,75,75,-70,-74,-76,-77,75,75,75,75,-80,75,-81,-75,-78,-79,]),'CHAR_CONST':([41,43,66,67,68,69,71,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,128,139,140,141,142,143,144,145,146,147,148,150,155,157,188,190,192,193,194,195,196,197,198,200,201,204,205,208,216,217,218,219,220,223,224,225,226,227,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,77,77,77,77,77,77,77,77,-89,-90,-91,-92,-93,-94,-95,-96,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,77,77,77,77,-59,-61,-72,77,77,77,77,-83,-84,77,77,77,77,77,-82,77,-71,77,77,77,77,77,-70,-74,-76,-77,77,77,77,77,-80,77,-81,-75,-78,-79,]),'STRING_LITERAL':([41,43,66,67,68,69,71,76,78,87,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,128,134,139,140,141,142,143,144,145,146,147,148,150,155,157,188,190,192,193,194,195,196,197,198,200,201,204,205,208,216,217,218,219,220,223,224,225,226,227,228,229,230,231,233,235,236,237,238,239,240,241,242,243,],[-14,78,78,78,78,78,78,134,-143,78,78,-89,-90,-91,-92,-93,-94,-95,-96,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-144,78,-60,-62,-63,-64,-65,-66,-67,-68,-69,-73,78,78,78,78,-59,-61,-72,78,78,78,78,-83,-84,78,78,78,78,78,-82,78,-71,78,78,78,78,78,-70,-74,-76,-77,78,78,78,78,-80,78,-81,-75,-78,-79,]),'ELSE':([41,140,142,143,144,145,146,147,148,150,192,194,200,201,218,220,228,229,230,231,238,240,241,242,243,],[-14,-60,-63,-64,-65,-66,-67,-68,-69,-73,-59,-72,-83,-84,-82,-71,-70,236,-76,-77,-80,-81,-75,-78,-79,]),'COLON':([62,63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,132,134,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,202,203,206,207,209,210,211,212,221,],[-87,-116,-128,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-85,-144,204,-88,205,-98,-116,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,219,-97,-130,-131,-124,-125,-126,-86,-127,]),'QUESTION':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,99,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,-98,-116,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'OR':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,100,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,-98,-116,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'AND':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,101,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,101,-116,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'BOR':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,102,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,102,-116,102,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'BXOR':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,103,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,103,-116,103,103,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'EQ':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,105,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,105,-116,105,105,105,105,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'NEQ':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,106,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,106,-116,106,106,106,106,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'LT':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,107,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,107,-116,107,107,107,107,107,107,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'GT':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,108,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,108,-116,108,108,108,108,108,108,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'LE':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,109,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,109,-116,109,109,109,109,109,109,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'GE':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,110,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,110,-116,110,110,110,110,110,110,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'LSHIFT':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,111,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,111,-116,111,111,111,111,111,111,111,111,111,111,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'RSHIFT':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,112,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,112,-116,112,112,112,112,112,112,112,112,112,112,-109,-110,-111,-112,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'DIVIDE':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,116,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,116,-116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'MOD':([63,64,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,185,189,206,207,209,210,211,],[-116,117,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,117,-116,117,117,117,117,117,117,117,117,117,117,117,117,117,117,-113,-114,-115,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'PLUS_ASSIGN':([63,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,182,184,185,189,206,207,209,210,211,],[92,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'MINUS_ASSIGN':([63,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,182,184,185,189,206,207,209,210,211,],[93,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'MUL_ASSIGN':([63,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,182,184,185,189,206,207,209,210,211,],[94,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'DIV_ASSIGN':([63,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,182,184,185,189,206,207,209,210,211,],[95,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'MOD_ASSIGN':([63,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,182,184,185,189,206,207,209,210,211,],[96,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'LSHIFT_ASSIGN':([63,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,182,184,185,189,206,207,209,210,211,],[97,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'RSHIFT_ASSIGN':([63,65,72,73,74,75,76,77,78,122,123,124,125,126,127,133,134,182,184,185,189,206,207,209,210,211,],[98,-119,-129,-137,-138,-139,-140,-141,-143,-135,-136,-120,-121,-122,-123,-137,-144,-132,-133,-134,-142,-130,-131,-124,-125,-126,]),'DOT':([65,72,73,74,75,76,77,78,122,123,133,134,182,184,185,189,206,207,],[120,-129,-137,-138,-139,-140,-141,-143,-135,-136,-137,-144,-132,-133,-134,-142,-130,-131,]),'ARROW':([65,72,73,74,75,76,77,78,122,123,133,134,182,184,185,189,206,207,],[121,-129,-137,-138,-139,-140,-141,-143,-135,-136,-137,-144,-132,-133,-134,-142,-130,-131,]),'INC':([65,72,73,74,75,76,77,78,122,123,133,134,182,184,185,189,206,207,],[122,-129,-137,-138,-139,-140,-141,-143,-135,-136,-137,-144,-132,-133,-134,-142,-130,-131,]),'DEC':([65,72,73,74,75,76,77,78,122,123,133,134,182,184,185,189,206,207,],[123,-129,-137,-138,-139,-140,-141,-143,-135,-136,-137,-144,-132,-133,-134,-142,-130,-131,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'external_list':([0,],[2,]),'external_declaration':([0,2,],[3,26,]),'function_definition':([0,2,],[4,4,]),'declaration':([0,2,11,95,146,205,211,226,230,231,232,240,242,243,244,246,],[5,5,35,154,154,224,154,154,154,154,154,154,154,154,154,154,]),'include_directive':([0,2,],[6,6,]),'typedef_declaration':([0,2,],[8,8,]),'type_specifier_seq':([0,2,11,38,39,48,49,71,87,93,95,119,146,205,211,226,230,231,232,240,242,243,244,246,],[9,9,36,51,52,51,51,122,51,52,36,122,36,36,36,36,36,36,36,36,36,36,36,36,]),'type_specifier':([0,2,9,11,36,38,39,48,49,51,52,71,87,93,95,119,122,146,205,211,226,230,231,232,240,242,243,244,246,],[12,12,29,12,29,12,12,12,12,29,29,12,12,12,12,12,29,12,12,12,12,12,12,12,12,12,12,12,12,]),'struct_specifier':([0,2,9,11,36,38,39,48,49,51,52,71,87,93,95,119,122,146,205,211,226,230,231,232,240,242,243,244,246,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'init_declarator_list':([9,36,51,],[28,28,90,]),'init_declarator':([9,36,42,51,],[30,30,59,30,]),'declarator':([9,36,42,51,52,],[31,31,31,31,91,]),'direct_declarator':([9,33,36,42,51,52,],[32,44,32,32,32,32,]),'pointer':([9,34,36,42,51,52,122,],[33,46,33,33,33,33,181,]),'struct_declaration_list':([38,48,],[49,87,]),'struct_declaration':([38,48,49,87,],[50,50,89,89,]),'parameter_list':([39,],[53,]),'parameter_declaration':([39,93,],[55,145,]),'initializer':([43,],[60,]),'assignment_expression':([43,71,95,98,107,109,110,119,146,162,164,180,202,203,204,205,211,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[61,123,123,166,123,123,173,123,123,123,210,219,123,123,123,123,123,229,123,123,123,123,123,123,123,123,123,123,123,123,123,]),'conditional_expression':([43,71,95,98,107,109,110,119,146,162,164,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,228,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'unary_expression':([43,66,67,68,69,71,95,98,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,162,164,178,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[63,115,116,117,118,63,63,63,63,169,63,63,63,169,169,169,169,169,169,169,169,169,169,169,169,169,169,196,197,198,63,63,63,218,63,63,63,63,63,63,169,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'logical_or_expression':([43,71,95,98,107,109,110,119,146,162,164,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'postfix_expression':([43,66,67,68,69,71,95,98,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,162,164,178,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'logical_and_expression':([43,71,95,98,107,108,109,110,119,146,162,164,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[72,72,72,72,72,168,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'primary_expression':([43,66,67,68,69,71,95,98,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,146,162,164,178,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'bitwise_or_expression':([43,71,95,98,107,108,109,110,119,125,146,162,164,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[75,75,75,75,75,75,75,75,75,182,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'bitwise_xor_expression':([43,71,95,98,107,108,109,110,119,125,126,146,162,164,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[80,80,80,80,80,80,80,80,80,80,183,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'bitwise_and_expression':([43,71,95,98,107,108,109,110,119,125,126,127,146,162,164,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[81,81,81,81,81,81,81,81,81,81,81,184,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'equality_expression':([43,71,95,98,107,108,109,110,119,125,126,127,128,146,162,164,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[82,82,82,82,82,82,82,82,82,82,82,82,185,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,]),'relational_expression':([43,71,95,98,107,108,109,110,119,125,126,127,128,129,130,146,162,164,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[83,83,83,83,83,83,83,83,83,83,83,83,83,186,187,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,]),'shift_expression':([43,71,95,98,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,146,162,164,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,188,189,190,191,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,]),'additive_expression':([43,71,95,98,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,135,136,146,162,164,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,192,193,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,]),'multiplicative_expression':([43,71,95,98,107,108,109,110,119,125,126,127,128,129,130,131,132,133,134,135,136,137,138,146,162,164,180,202,203,204,205,211,212,215,223,224,226,230,231,232,233,234,240,242,243,244,246,],[86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,194,195,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,]),'compound_statement':([54,92,95,146,211,226,230,231,232,240,242,243,244,246,],[94,144,150,150,150,150,150,150,150,150,150,150,150,150,]),'assignment_operator':([63,],[98,]),'type_name':([71,119,],[120,177,]),'expression':([71,95,107,109,119,146,162,202,203,204,205,211,223,224,226,230,231,232,233,234,240,242,243,244,246,],[121,156,167,170,176,156,206,220,221,222,156,156,156,156,156,156,156,156,239,241,156,156,156,156,156,]),'statement_list':([95,],[146,]),'statement':([95,146,211,226,230,231,232,240,242,243,244,246,],[148,200,227,235,236,237,238,245,247,248,249,250,]),'expression_statement':([95,146,205,211,223,224,226,230,231,232,240,242,243,244,246,],[149,149,223,149,233,234,149,149,149,149,149,149,149,149,149,]),'selection_statement':([95,146,211,226,230,231,232,240,242,243,244,246,],[151,151,151,151,151,151,151,151,151,151,151,151,]),'iteration_statement':([95,146,211,226,230,231,232,240,242,243,244,246,],[152,152,152,152,152,152,152,152,152,152,152,152,]),'jump_statement':([95,146,211,226,230,231,232,240,242,243,244,246,],[153,153,153,153,153,153,153,153,153,153,153,153,]),'labeled_statement':([95,146,211,226,230,231,232,240,242,243,244,246,],[155,155,155,155,155,155,155,155,155,155,155,155,]),'argument_expression_list':([110,],[171,]),'constant_expression':([164,],[209,]),}
+_lr_goto_items = {'program':([0,],[1,]),'external_list':([0,],[2,]),'external_declaration':([0,2,],[3,26,]),'function_definition':([0,2,],[4,4,]),'declaration':([0,2,11,87,139,198,204,219,223,224,225,233,235,236,237,239,],[5,5,35,147,147,217,147,147,147,147,147,147,147,147,147,147,]),'include_directive':([0,2,],[6,6,]),'typedef_declaration':([0,2,],[8,8,]),'type_specifier_seq':([0,2,11,38,39,48,49,71,79,85,87,128,139,198,204,219,223,224,225,233,235,236,237,239,],[9,9,36,51,52,51,51,131,51,52,36,131,36,36,36,36,36,36,36,36,36,36,36,36,]),'type_specifier':([0,2,9,11,36,38,39,48,49,51,52,71,79,85,87,128,131,139,198,204,219,223,224,225,233,235,236,237,239,],[12,12,29,12,29,12,12,12,12,29,29,12,12,12,12,12,29,12,12,12,12,12,12,12,12,12,12,12,12,]),'struct_specifier':([0,2,9,11,36,38,39,48,49,51,52,71,79,85,87,128,131,139,198,204,219,223,224,225,233,235,236,237,239,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'init_declarator_list':([9,36,51,],[28,28,82,]),'init_declarator':([9,36,42,51,],[30,30,59,30,]),'declarator':([9,36,42,51,52,],[31,31,31,31,83,]),'direct_declarator':([9,33,36,42,51,52,],[32,44,32,32,32,32,]),'pointer':([9,34,36,42,51,52,131,],[33,46,33,33,33,33,191,]),'struct_declaration_list':([38,48,],[49,79,]),'struct_declaration':([38,48,49,79,],[50,50,81,81,]),'parameter_list':([39,],[53,]),'parameter_declaration':([39,85,],[55,138,]),'initializer':([43,],[60,]),'assignment_expression':([43,71,87,90,99,118,119,128,139,155,157,190,195,196,197,198,204,208,216,217,219,223,224,225,226,227,233,235,236,237,239,],[61,132,132,159,132,132,183,132,132,132,203,212,132,132,132,132,132,222,132,132,132,132,132,132,132,132,132,132,132,132,132,]),'conditional_expression':([43,71,87,90,99,118,119,128,139,155,157,190,195,196,197,198,204,205,208,216,217,219,223,224,225,226,227,233,235,236,237,239,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,221,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'unary_expression':([43,66,67,68,69,71,87,90,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,128,139,155,157,188,190,195,196,197,198,204,205,208,216,217,219,223,224,225,226,227,233,235,236,237,239,],[63,124,125,126,127,63,63,63,63,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,63,63,63,63,63,63,211,63,63,63,63,63,63,162,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'binary_expression':([43,71,87,90,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,128,139,155,157,190,195,196,197,198,204,205,208,216,217,219,223,224,225,226,227,233,235,236,237,239,],[64,64,64,64,64,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'postfix_expression':([43,66,67,68,69,71,87,90,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,128,139,155,157,188,190,195,196,197,198,204,205,208,216,217,219,223,224,225,226,227,233,235,236,237,239,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'primary_expression':([43,66,67,68,69,71,87,90,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,128,139,155,157,188,190,195,196,197,198,204,205,208,216,217,219,223,224,225,226,227,233,235,236,237,239,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'string_literal_list':([43,66,67,68,69,71,87,90,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,128,139,155,157,188,190,195,196,197,198,204,205,208,216,217,219,223,224,225,226,227,233,235,236,237,239,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'compound_statement':([54,84,87,139,204,219,223,224,225,233,235,236,237,239,],[86,137,143,143,143,143,143,143,143,143,143,143,143,143,]),'assignment_operator':([63,],[90,]),'type_name':([71,128,],[129,187,]),'expression':([71,87,99,118,128,139,155,195,196,197,198,204,216,217,219,223,224,225,226,227,233,235,236,237,239,],[130,149,160,180,186,149,199,213,214,215,149,149,149,149,149,149,149,149,232,234,149,149,149,149,149,]),'statement_list':([87,],[139,]),'statement':([87,139,204,219,223,224,225,233,235,236,237,239,],[141,193,220,228,229,230,231,238,240,241,242,243,]),'expression_statement':([87,139,198,204,216,217,219,223,224,225,233,235,236,237,239,],[142,142,216,142,226,227,142,142,142,142,142,142,142,142,142,]),'selection_statement':([87,139,204,219,223,224,225,233,235,236,237,239,],[144,144,144,144,144,144,144,144,144,144,144,144,]),'iteration_statement':([87,139,204,219,223,224,225,233,235,236,237,239,],[145,145,145,145,145,145,145,145,145,145,145,145,]),'jump_statement':([87,139,204,219,223,224,225,233,235,236,237,239,],[146,146,146,146,146,146,146,146,146,146,146,146,]),'labeled_statement':([87,139,204,219,223,224,225,233,235,236,237,239,],[148,148,148,148,148,148,148,148,148,148,148,148,]),'argument_expression_list':([119,],[181,]),'constant_expression':([157,],[202,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,157 +27,150 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> external_list','program',1,'p_program','parser_ast.py',396),
-  ('empty -> <empty>','empty',0,'p_empty','parser_ast.py',402),
-  ('external_list -> external_list external_declaration','external_list',2,'p_external_list','parser_ast.py',406),
-  ('external_list -> external_declaration','external_list',1,'p_external_list','parser_ast.py',407),
-  ('external_declaration -> function_definition','external_declaration',1,'p_external_declaration','parser_ast.py',418),
-  ('external_declaration -> declaration','external_declaration',1,'p_external_declaration','parser_ast.py',419),
-  ('external_declaration -> include_directive','external_declaration',1,'p_external_declaration','parser_ast.py',420),
-  ('external_declaration -> PP_DIRECTIVE','external_declaration',1,'p_external_declaration','parser_ast.py',421),
-  ('external_declaration -> typedef_declaration','external_declaration',1,'p_external_declaration','parser_ast.py',422),
-  ('typedef_declaration -> TYPEDEF declaration','typedef_declaration',2,'p_typedef_declaration','parser_ast.py',430),
-  ('header_name -> IDENTIFIER','header_name',1,'p_header_name','parser_ast.py',437),
-  ('header_name -> IDENTIFIER DOT IDENTIFIER','header_name',3,'p_header_name','parser_ast.py',438),
-  ('include_directive -> PP_DIRECTIVE','include_directive',1,'p_include_directive','parser_ast.py',446),
-  ('declaration -> type_specifier_seq init_declarator_list SEMICOLON','declaration',3,'p_declaration','parser_ast.py',453),
-  ('init_declarator_list -> init_declarator_list COMMA init_declarator','init_declarator_list',3,'p_init_declarator_list','parser_ast.py',459),
-  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','parser_ast.py',460),
-  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','parser_ast.py',467),
-  ('init_declarator -> declarator ASSIGN initializer','init_declarator',3,'p_init_declarator','parser_ast.py',468),
-  ('declarator -> direct_declarator','declarator',1,'p_declarator','parser_ast.py',479),
-  ('declarator -> pointer direct_declarator','declarator',2,'p_declarator','parser_ast.py',480),
-  ('pointer -> TIMES','pointer',1,'p_pointer','parser_ast.py',492),
-  ('pointer -> TIMES pointer','pointer',2,'p_pointer','parser_ast.py',493),
-  ('direct_declarator -> IDENTIFIER','direct_declarator',1,'p_direct_declarator','parser_ast.py',500),
-  ('direct_declarator -> IDENTIFIER LBRACKET INT_CONST RBRACKET','direct_declarator',4,'p_direct_declarator','parser_ast.py',501),
-  ('direct_declarator -> IDENTIFIER LBRACKET IDENTIFIER RBRACKET','direct_declarator',4,'p_direct_declarator','parser_ast.py',502),
-  ('direct_declarator -> IDENTIFIER LBRACKET RBRACKET','direct_declarator',3,'p_direct_declarator','parser_ast.py',503),
-  ('initializer -> assignment_expression','initializer',1,'p_initializer','parser_ast.py',515),
-  ('struct_specifier -> STRUCT IDENTIFIER LBRACE struct_declaration_list RBRACE','struct_specifier',5,'p_struct_specifier','parser_ast.py',520),
-  ('struct_specifier -> STRUCT LBRACE struct_declaration_list RBRACE','struct_specifier',4,'p_struct_specifier','parser_ast.py',521),
-  ('struct_specifier -> STRUCT IDENTIFIER','struct_specifier',2,'p_struct_specifier','parser_ast.py',522),
-  ('struct_declaration_list -> struct_declaration_list struct_declaration','struct_declaration_list',2,'p_struct_declaration_list','parser_ast.py',534),
-  ('struct_declaration_list -> struct_declaration','struct_declaration_list',1,'p_struct_declaration_list','parser_ast.py',535),
-  ('struct_declaration -> type_specifier_seq init_declarator_list SEMICOLON','struct_declaration',3,'p_struct_declaration','parser_ast.py',542),
-  ('specifier_qualifier_list -> type_specifier_seq','specifier_qualifier_list',1,'p_specifier_qualifier_list','parser_ast.py',546),
-  ('specifier_qualifier_list -> type_specifier_seq specifier_qualifier_list','specifier_qualifier_list',2,'p_specifier_qualifier_list','parser_ast.py',547),
-  ('type_specifier_seq -> type_specifier_seq type_specifier','type_specifier_seq',2,'p_type_specifier_seq','parser_ast.py',559),
-  ('type_specifier_seq -> type_specifier','type_specifier_seq',1,'p_type_specifier_seq','parser_ast.py',560),
-  ('type_name -> type_specifier_seq','type_name',1,'p_type_name','parser_ast.py',568),
-  ('type_name -> type_specifier_seq pointer','type_name',2,'p_type_name','parser_ast.py',569),
-  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','parser_ast.py',577),
-  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','parser_ast.py',578),
-  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier','parser_ast.py',579),
-  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','parser_ast.py',580),
-  ('type_specifier -> DOUBLE','type_specifier',1,'p_type_specifier','parser_ast.py',581),
-  ('type_specifier -> SHORT','type_specifier',1,'p_type_specifier','parser_ast.py',582),
-  ('type_specifier -> LONG','type_specifier',1,'p_type_specifier','parser_ast.py',583),
-  ('type_specifier -> SIGNED','type_specifier',1,'p_type_specifier','parser_ast.py',584),
-  ('type_specifier -> UNSIGNED','type_specifier',1,'p_type_specifier','parser_ast.py',585),
-  ('type_specifier -> BOOL','type_specifier',1,'p_type_specifier','parser_ast.py',586),
-  ('type_specifier -> CONST','type_specifier',1,'p_type_specifier','parser_ast.py',587),
-  ('type_specifier -> struct_specifier','type_specifier',1,'p_type_specifier','parser_ast.py',588),
-  ('type_specifier -> IDENTIFIER','type_specifier',1,'p_type_specifier','parser_ast.py',589),
-  ('function_definition -> type_specifier_seq IDENTIFIER LPAREN parameter_list RPAREN compound_statement','function_definition',6,'p_function_definition','parser_ast.py',594),
-  ('function_definition -> type_specifier_seq IDENTIFIER LPAREN RPAREN compound_statement','function_definition',5,'p_function_definition','parser_ast.py',595),
-  ('parameter_list -> parameter_list COMMA parameter_declaration','parameter_list',3,'p_parameter_list','parser_ast.py',605),
-  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','parser_ast.py',606),
-  ('parameter_declaration -> type_specifier_seq declarator','parameter_declaration',2,'p_parameter_declaration','parser_ast.py',613),
-  ('parameter_declaration -> type_specifier_seq','parameter_declaration',1,'p_parameter_declaration','parser_ast.py',614),
-  ('compound_statement -> LBRACE statement_list RBRACE','compound_statement',3,'p_compound_statement','parser_ast.py',622),
-  ('compound_statement -> LBRACE RBRACE','compound_statement',2,'p_compound_statement','parser_ast.py',623),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser_ast.py',630),
-  ('statement_list -> statement','statement_list',1,'p_statement_list','parser_ast.py',631),
-  ('statement -> expression_statement','statement',1,'p_statement','parser_ast.py',638),
-  ('statement -> compound_statement','statement',1,'p_statement','parser_ast.py',639),
-  ('statement -> selection_statement','statement',1,'p_statement','parser_ast.py',640),
-  ('statement -> iteration_statement','statement',1,'p_statement','parser_ast.py',641),
-  ('statement -> jump_statement','statement',1,'p_statement','parser_ast.py',642),
-  ('statement -> declaration','statement',1,'p_statement','parser_ast.py',643),
-  ('statement -> labeled_statement','statement',1,'p_statement','parser_ast.py',644),
-  ('labeled_statement -> CASE constant_expression COLON statement','labeled_statement',4,'p_labeled_statement','parser_ast.py',648),
-  ('labeled_statement -> DEFAULT COLON statement','labeled_statement',3,'p_labeled_statement','parser_ast.py',649),
-  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','parser_ast.py',656),
-  ('expression_statement -> SEMICOLON','expression_statement',1,'p_expression_statement','parser_ast.py',657),
-  ('selection_statement -> IF LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement','parser_ast.py',664),
-  ('selection_statement -> IF LPAREN expression RPAREN statement ELSE statement','selection_statement',7,'p_selection_statement','parser_ast.py',665),
-  ('selection_statement -> SWITCH LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement','parser_ast.py',666),
-  ('iteration_statement -> WHILE LPAREN expression RPAREN statement','iteration_statement',5,'p_iteration_statement','parser_ast.py',676),
-  ('iteration_statement -> FOR LPAREN expression_statement expression_statement expression RPAREN statement','iteration_statement',7,'p_iteration_statement','parser_ast.py',677),
-  ('iteration_statement -> FOR LPAREN declaration expression_statement expression RPAREN statement','iteration_statement',7,'p_iteration_statement','parser_ast.py',678),
-  ('iteration_statement -> FOR LPAREN expression_statement expression_statement RPAREN statement','iteration_statement',6,'p_iteration_statement','parser_ast.py',679),
-  ('iteration_statement -> FOR LPAREN declaration expression_statement RPAREN statement','iteration_statement',6,'p_iteration_statement','parser_ast.py',680),
-  ('jump_statement -> RETURN expression SEMICOLON','jump_statement',3,'p_jump_statement','parser_ast.py',689),
-  ('jump_statement -> RETURN SEMICOLON','jump_statement',2,'p_jump_statement','parser_ast.py',690),
-  ('jump_statement -> BREAK SEMICOLON','jump_statement',2,'p_jump_statement','parser_ast.py',691),
-  ('expression -> assignment_expression','expression',1,'p_expression','parser_ast.py',701),
-  ('expression -> expression COMMA assignment_expression','expression',3,'p_expression','parser_ast.py',702),
-  ('assignment_expression -> conditional_expression','assignment_expression',1,'p_assignment_expression','parser_ast.py',711),
-  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','parser_ast.py',712),
-  ('assignment_operator -> ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',721),
-  ('assignment_operator -> PLUS_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',722),
-  ('assignment_operator -> MINUS_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',723),
-  ('assignment_operator -> MUL_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',724),
-  ('assignment_operator -> DIV_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',725),
-  ('assignment_operator -> MOD_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',726),
-  ('assignment_operator -> LSHIFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',727),
-  ('assignment_operator -> RSHIFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',728),
-  ('constant_expression -> assignment_expression','constant_expression',1,'p_constant_expression','parser_ast.py',733),
-  ('logical_or_expression -> logical_or_expression OR logical_and_expression','logical_or_expression',3,'p_logical_or_expression','parser_ast.py',737),
-  ('logical_or_expression -> logical_and_expression','logical_or_expression',1,'p_logical_or_expression','parser_ast.py',738),
-  ('logical_and_expression -> logical_and_expression AND bitwise_or_expression','logical_and_expression',3,'p_logical_and_expression','parser_ast.py',747),
-  ('logical_and_expression -> bitwise_or_expression','logical_and_expression',1,'p_logical_and_expression','parser_ast.py',748),
-  ('bitwise_or_expression -> bitwise_or_expression BOR bitwise_xor_expression','bitwise_or_expression',3,'p_bitwise_or_expression','parser_ast.py',757),
-  ('bitwise_or_expression -> bitwise_xor_expression','bitwise_or_expression',1,'p_bitwise_or_expression','parser_ast.py',758),
-  ('bitwise_xor_expression -> bitwise_xor_expression BXOR bitwise_and_expression','bitwise_xor_expression',3,'p_bitwise_xor_expression','parser_ast.py',767),
-  ('bitwise_xor_expression -> bitwise_and_expression','bitwise_xor_expression',1,'p_bitwise_xor_expression','parser_ast.py',768),
-  ('bitwise_and_expression -> bitwise_and_expression BAND equality_expression','bitwise_and_expression',3,'p_bitwise_and_expression','parser_ast.py',777),
-  ('bitwise_and_expression -> equality_expression','bitwise_and_expression',1,'p_bitwise_and_expression','parser_ast.py',778),
-  ('equality_expression -> equality_expression EQ relational_expression','equality_expression',3,'p_equality_expression','parser_ast.py',787),
-  ('equality_expression -> equality_expression NEQ relational_expression','equality_expression',3,'p_equality_expression','parser_ast.py',788),
-  ('equality_expression -> relational_expression','equality_expression',1,'p_equality_expression','parser_ast.py',789),
-  ('relational_expression -> relational_expression LT shift_expression','relational_expression',3,'p_relational_expression','parser_ast.py',798),
-  ('relational_expression -> relational_expression GT shift_expression','relational_expression',3,'p_relational_expression','parser_ast.py',799),
-  ('relational_expression -> relational_expression LE shift_expression','relational_expression',3,'p_relational_expression','parser_ast.py',800),
-  ('relational_expression -> relational_expression GE shift_expression','relational_expression',3,'p_relational_expression','parser_ast.py',801),
-  ('relational_expression -> shift_expression','relational_expression',1,'p_relational_expression','parser_ast.py',802),
-  ('shift_expression -> shift_expression LSHIFT additive_expression','shift_expression',3,'p_shift_expression','parser_ast.py',811),
-  ('shift_expression -> shift_expression RSHIFT additive_expression','shift_expression',3,'p_shift_expression','parser_ast.py',812),
-  ('shift_expression -> additive_expression','shift_expression',1,'p_shift_expression','parser_ast.py',813),
-  ('additive_expression -> additive_expression PLUS multiplicative_expression','additive_expression',3,'p_additive_expression','parser_ast.py',822),
-  ('additive_expression -> additive_expression MINUS multiplicative_expression','additive_expression',3,'p_additive_expression','parser_ast.py',823),
-  ('additive_expression -> multiplicative_expression','additive_expression',1,'p_additive_expression','parser_ast.py',824),
-  ('multiplicative_expression -> multiplicative_expression TIMES unary_expression','multiplicative_expression',3,'p_multiplicative_expression','parser_ast.py',833),
-  ('multiplicative_expression -> multiplicative_expression DIVIDE unary_expression','multiplicative_expression',3,'p_multiplicative_expression','parser_ast.py',834),
-  ('multiplicative_expression -> multiplicative_expression MOD unary_expression','multiplicative_expression',3,'p_multiplicative_expression','parser_ast.py',835),
-  ('multiplicative_expression -> unary_expression','multiplicative_expression',1,'p_multiplicative_expression','parser_ast.py',836),
-  ('cast_expression -> LPAREN type_name RPAREN cast_expression','cast_expression',4,'p_cast_expression','parser_ast.py',846),
-  ('cast_expression -> postfix_expression','cast_expression',1,'p_cast_expression','parser_ast.py',847),
-  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression','parser_ast.py',863),
-  ('unary_expression -> PLUS unary_expression','unary_expression',2,'p_unary_expression','parser_ast.py',864),
-  ('unary_expression -> MINUS unary_expression','unary_expression',2,'p_unary_expression','parser_ast.py',865),
-  ('unary_expression -> NOT unary_expression','unary_expression',2,'p_unary_expression','parser_ast.py',866),
-  ('unary_expression -> BAND unary_expression','unary_expression',2,'p_unary_expression','parser_ast.py',867),
-  ('unary_expression -> SIZEOF LPAREN expression RPAREN','unary_expression',4,'p_unary_expression_sizeof','parser_ast.py',875),
-  ('unary_expression -> SIZEOF LPAREN type_name RPAREN','unary_expression',4,'p_unary_expression_sizeof','parser_ast.py',876),
-  ('unary_expression -> LPAREN type_name RPAREN unary_expression','unary_expression',4,'p_unary_expression_cast','parser_ast.py',881),
-  ('conditional_expression -> logical_or_expression QUESTION expression COLON conditional_expression','conditional_expression',5,'p_conditional_expression','parser_ast.py',886),
-  ('conditional_expression -> logical_or_expression','conditional_expression',1,'p_conditional_expression','parser_ast.py',887),
-  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression','parser_ast.py',900),
-  ('postfix_expression -> postfix_expression LBRACKET expression RBRACKET','postfix_expression',4,'p_postfix_expression','parser_ast.py',901),
-  ('postfix_expression -> postfix_expression LPAREN argument_expression_list RPAREN','postfix_expression',4,'p_postfix_expression','parser_ast.py',902),
-  ('postfix_expression -> postfix_expression LPAREN RPAREN','postfix_expression',3,'p_postfix_expression','parser_ast.py',903),
-  ('postfix_expression -> postfix_expression DOT IDENTIFIER','postfix_expression',3,'p_postfix_expression','parser_ast.py',904),
-  ('postfix_expression -> postfix_expression ARROW IDENTIFIER','postfix_expression',3,'p_postfix_expression','parser_ast.py',905),
-  ('postfix_expression -> postfix_expression INC','postfix_expression',2,'p_postfix_expression','parser_ast.py',906),
-  ('postfix_expression -> postfix_expression DEC','postfix_expression',2,'p_postfix_expression','parser_ast.py',907),
-  ('primary_expression -> IDENTIFIER','primary_expression',1,'p_primary_expression','parser_ast.py',970),
-  ('primary_expression -> INT_CONST','primary_expression',1,'p_primary_expression','parser_ast.py',971),
-  ('primary_expression -> FLOAT_CONST','primary_expression',1,'p_primary_expression','parser_ast.py',972),
-  ('primary_expression -> STRING_LITERAL','primary_expression',1,'p_primary_expression','parser_ast.py',973),
-  ('primary_expression -> CHAR_CONST','primary_expression',1,'p_primary_expression','parser_ast.py',974),
-  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression','parser_ast.py',975),
-  ('argument_expression_list -> argument_expression_list COMMA assignment_expression','argument_expression_list',3,'p_argument_expression_list','parser_ast.py',1002),
-  ('argument_expression_list -> assignment_expression','argument_expression_list',1,'p_argument_expression_list','parser_ast.py',1003),
+  ('program -> external_list','program',1,'p_program','parser_ast.py',458),
+  ('empty -> <empty>','empty',0,'p_empty','parser_ast.py',464),
+  ('external_list -> external_list external_declaration','external_list',2,'p_external_list','parser_ast.py',468),
+  ('external_list -> external_declaration','external_list',1,'p_external_list','parser_ast.py',469),
+  ('external_declaration -> function_definition','external_declaration',1,'p_external_declaration','parser_ast.py',481),
+  ('external_declaration -> declaration','external_declaration',1,'p_external_declaration','parser_ast.py',482),
+  ('external_declaration -> include_directive','external_declaration',1,'p_external_declaration','parser_ast.py',483),
+  ('external_declaration -> PP_DIRECTIVE','external_declaration',1,'p_external_declaration','parser_ast.py',484),
+  ('external_declaration -> typedef_declaration','external_declaration',1,'p_external_declaration','parser_ast.py',485),
+  ('typedef_declaration -> TYPEDEF declaration','typedef_declaration',2,'p_typedef_declaration','parser_ast.py',493),
+  ('header_name -> IDENTIFIER','header_name',1,'p_header_name','parser_ast.py',500),
+  ('header_name -> IDENTIFIER DOT IDENTIFIER','header_name',3,'p_header_name','parser_ast.py',501),
+  ('include_directive -> PP_DIRECTIVE','include_directive',1,'p_include_directive','parser_ast.py',509),
+  ('declaration -> type_specifier_seq init_declarator_list SEMICOLON','declaration',3,'p_declaration','parser_ast.py',516),
+  ('init_declarator_list -> init_declarator_list COMMA init_declarator','init_declarator_list',3,'p_init_declarator_list','parser_ast.py',522),
+  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','parser_ast.py',523),
+  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','parser_ast.py',531),
+  ('init_declarator -> declarator ASSIGN initializer','init_declarator',3,'p_init_declarator','parser_ast.py',532),
+  ('declarator -> direct_declarator','declarator',1,'p_declarator','parser_ast.py',543),
+  ('declarator -> pointer direct_declarator','declarator',2,'p_declarator','parser_ast.py',544),
+  ('pointer -> TIMES','pointer',1,'p_pointer','parser_ast.py',557),
+  ('pointer -> TIMES pointer','pointer',2,'p_pointer','parser_ast.py',558),
+  ('direct_declarator -> IDENTIFIER','direct_declarator',1,'p_direct_declarator','parser_ast.py',565),
+  ('direct_declarator -> IDENTIFIER LBRACKET INT_CONST RBRACKET','direct_declarator',4,'p_direct_declarator','parser_ast.py',566),
+  ('direct_declarator -> IDENTIFIER LBRACKET IDENTIFIER RBRACKET','direct_declarator',4,'p_direct_declarator','parser_ast.py',567),
+  ('direct_declarator -> IDENTIFIER LBRACKET RBRACKET','direct_declarator',3,'p_direct_declarator','parser_ast.py',568),
+  ('initializer -> assignment_expression','initializer',1,'p_initializer','parser_ast.py',577),
+  ('struct_specifier -> STRUCT IDENTIFIER LBRACE struct_declaration_list RBRACE','struct_specifier',5,'p_struct_specifier','parser_ast.py',582),
+  ('struct_specifier -> STRUCT LBRACE struct_declaration_list RBRACE','struct_specifier',4,'p_struct_specifier','parser_ast.py',583),
+  ('struct_specifier -> STRUCT IDENTIFIER','struct_specifier',2,'p_struct_specifier','parser_ast.py',584),
+  ('struct_declaration_list -> struct_declaration_list struct_declaration','struct_declaration_list',2,'p_struct_declaration_list','parser_ast.py',596),
+  ('struct_declaration_list -> struct_declaration','struct_declaration_list',1,'p_struct_declaration_list','parser_ast.py',597),
+  ('struct_declaration -> type_specifier_seq init_declarator_list SEMICOLON','struct_declaration',3,'p_struct_declaration','parser_ast.py',605),
+  ('specifier_qualifier_list -> type_specifier_seq','specifier_qualifier_list',1,'p_specifier_qualifier_list','parser_ast.py',609),
+  ('specifier_qualifier_list -> type_specifier_seq specifier_qualifier_list','specifier_qualifier_list',2,'p_specifier_qualifier_list','parser_ast.py',610),
+  ('type_specifier_seq -> type_specifier_seq type_specifier','type_specifier_seq',2,'p_type_specifier_seq','parser_ast.py',622),
+  ('type_specifier_seq -> type_specifier','type_specifier_seq',1,'p_type_specifier_seq','parser_ast.py',623),
+  ('type_name -> type_specifier_seq','type_name',1,'p_type_name','parser_ast.py',635),
+  ('type_name -> type_specifier_seq pointer','type_name',2,'p_type_name','parser_ast.py',636),
+  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','parser_ast.py',644),
+  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','parser_ast.py',645),
+  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier','parser_ast.py',646),
+  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','parser_ast.py',647),
+  ('type_specifier -> DOUBLE','type_specifier',1,'p_type_specifier','parser_ast.py',648),
+  ('type_specifier -> SHORT','type_specifier',1,'p_type_specifier','parser_ast.py',649),
+  ('type_specifier -> LONG','type_specifier',1,'p_type_specifier','parser_ast.py',650),
+  ('type_specifier -> SIGNED','type_specifier',1,'p_type_specifier','parser_ast.py',651),
+  ('type_specifier -> UNSIGNED','type_specifier',1,'p_type_specifier','parser_ast.py',652),
+  ('type_specifier -> BOOL','type_specifier',1,'p_type_specifier','parser_ast.py',653),
+  ('type_specifier -> CONST','type_specifier',1,'p_type_specifier','parser_ast.py',654),
+  ('type_specifier -> struct_specifier','type_specifier',1,'p_type_specifier','parser_ast.py',655),
+  ('type_specifier -> IDENTIFIER','type_specifier',1,'p_type_specifier','parser_ast.py',656),
+  ('function_definition -> type_specifier_seq IDENTIFIER LPAREN parameter_list RPAREN compound_statement','function_definition',6,'p_function_definition','parser_ast.py',661),
+  ('function_definition -> type_specifier_seq IDENTIFIER LPAREN RPAREN compound_statement','function_definition',5,'p_function_definition','parser_ast.py',662),
+  ('parameter_list -> parameter_list COMMA parameter_declaration','parameter_list',3,'p_parameter_list','parser_ast.py',673),
+  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','parser_ast.py',674),
+  ('parameter_declaration -> type_specifier_seq declarator','parameter_declaration',2,'p_parameter_declaration','parser_ast.py',682),
+  ('parameter_declaration -> type_specifier_seq','parameter_declaration',1,'p_parameter_declaration','parser_ast.py',683),
+  ('compound_statement -> LBRACE statement_list RBRACE','compound_statement',3,'p_compound_statement','parser_ast.py',691),
+  ('compound_statement -> LBRACE RBRACE','compound_statement',2,'p_compound_statement','parser_ast.py',692),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser_ast.py',699),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','parser_ast.py',700),
+  ('statement -> expression_statement','statement',1,'p_statement','parser_ast.py',708),
+  ('statement -> compound_statement','statement',1,'p_statement','parser_ast.py',709),
+  ('statement -> selection_statement','statement',1,'p_statement','parser_ast.py',710),
+  ('statement -> iteration_statement','statement',1,'p_statement','parser_ast.py',711),
+  ('statement -> jump_statement','statement',1,'p_statement','parser_ast.py',712),
+  ('statement -> declaration','statement',1,'p_statement','parser_ast.py',713),
+  ('statement -> labeled_statement','statement',1,'p_statement','parser_ast.py',714),
+  ('labeled_statement -> CASE constant_expression COLON statement','labeled_statement',4,'p_labeled_statement','parser_ast.py',718),
+  ('labeled_statement -> DEFAULT COLON statement','labeled_statement',3,'p_labeled_statement','parser_ast.py',719),
+  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','parser_ast.py',726),
+  ('expression_statement -> SEMICOLON','expression_statement',1,'p_expression_statement','parser_ast.py',727),
+  ('selection_statement -> IF LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement','parser_ast.py',734),
+  ('selection_statement -> IF LPAREN expression RPAREN statement ELSE statement','selection_statement',7,'p_selection_statement','parser_ast.py',735),
+  ('selection_statement -> SWITCH LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement','parser_ast.py',736),
+  ('iteration_statement -> WHILE LPAREN expression RPAREN statement','iteration_statement',5,'p_iteration_statement','parser_ast.py',746),
+  ('iteration_statement -> FOR LPAREN expression_statement expression_statement expression RPAREN statement','iteration_statement',7,'p_iteration_statement','parser_ast.py',747),
+  ('iteration_statement -> FOR LPAREN declaration expression_statement expression RPAREN statement','iteration_statement',7,'p_iteration_statement','parser_ast.py',748),
+  ('iteration_statement -> FOR LPAREN expression_statement expression_statement RPAREN statement','iteration_statement',6,'p_iteration_statement','parser_ast.py',749),
+  ('iteration_statement -> FOR LPAREN declaration expression_statement RPAREN statement','iteration_statement',6,'p_iteration_statement','parser_ast.py',750),
+  ('jump_statement -> RETURN expression SEMICOLON','jump_statement',3,'p_jump_statement','parser_ast.py',759),
+  ('jump_statement -> RETURN SEMICOLON','jump_statement',2,'p_jump_statement','parser_ast.py',760),
+  ('jump_statement -> BREAK SEMICOLON','jump_statement',2,'p_jump_statement','parser_ast.py',761),
+  ('expression -> assignment_expression','expression',1,'p_expression','parser_ast.py',771),
+  ('expression -> expression COMMA assignment_expression','expression',3,'p_expression','parser_ast.py',772),
+  ('assignment_expression -> conditional_expression','assignment_expression',1,'p_assignment_expression','parser_ast.py',785),
+  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','parser_ast.py',786),
+  ('assignment_operator -> ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',799),
+  ('assignment_operator -> PLUS_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',800),
+  ('assignment_operator -> MINUS_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',801),
+  ('assignment_operator -> MUL_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',802),
+  ('assignment_operator -> DIV_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',803),
+  ('assignment_operator -> MOD_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',804),
+  ('assignment_operator -> LSHIFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',805),
+  ('assignment_operator -> RSHIFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ast.py',806),
+  ('constant_expression -> assignment_expression','constant_expression',1,'p_constant_expression','parser_ast.py',811),
+  ('binary_expression -> binary_expression OR binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',872),
+  ('binary_expression -> binary_expression AND binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',873),
+  ('binary_expression -> binary_expression BOR binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',874),
+  ('binary_expression -> binary_expression BXOR binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',875),
+  ('binary_expression -> binary_expression BAND binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',876),
+  ('binary_expression -> binary_expression EQ binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',877),
+  ('binary_expression -> binary_expression NEQ binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',878),
+  ('binary_expression -> binary_expression LT binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',879),
+  ('binary_expression -> binary_expression GT binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',880),
+  ('binary_expression -> binary_expression LE binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',881),
+  ('binary_expression -> binary_expression GE binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',882),
+  ('binary_expression -> binary_expression LSHIFT binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',883),
+  ('binary_expression -> binary_expression RSHIFT binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',884),
+  ('binary_expression -> binary_expression PLUS binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',885),
+  ('binary_expression -> binary_expression MINUS binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',886),
+  ('binary_expression -> binary_expression TIMES binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',887),
+  ('binary_expression -> binary_expression DIVIDE binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',888),
+  ('binary_expression -> binary_expression MOD binary_expression','binary_expression',3,'p_binary_expression','parser_ast.py',889),
+  ('binary_expression -> unary_expression','binary_expression',1,'p_binary_expression','parser_ast.py',890),
+  ('cast_expression -> LPAREN type_name RPAREN cast_expression','cast_expression',4,'p_cast_expression','parser_ast.py',908),
+  ('cast_expression -> postfix_expression','cast_expression',1,'p_cast_expression','parser_ast.py',909),
+  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression','parser_ast.py',925),
+  ('unary_expression -> PLUS unary_expression','unary_expression',2,'p_unary_expression','parser_ast.py',926),
+  ('unary_expression -> MINUS unary_expression','unary_expression',2,'p_unary_expression','parser_ast.py',927),
+  ('unary_expression -> NOT unary_expression','unary_expression',2,'p_unary_expression','parser_ast.py',928),
+  ('unary_expression -> BAND unary_expression','unary_expression',2,'p_unary_expression','parser_ast.py',929),
+  ('unary_expression -> SIZEOF LPAREN expression RPAREN','unary_expression',4,'p_unary_expression_sizeof','parser_ast.py',936),
+  ('unary_expression -> SIZEOF LPAREN type_name RPAREN','unary_expression',4,'p_unary_expression_sizeof','parser_ast.py',937),
+  ('unary_expression -> LPAREN type_name RPAREN unary_expression','unary_expression',4,'p_unary_expression_cast','parser_ast.py',941),
+  ('conditional_expression -> binary_expression QUESTION expression COLON conditional_expression','conditional_expression',5,'p_conditional_expression','parser_ast.py',945),
+  ('conditional_expression -> binary_expression','conditional_expression',1,'p_conditional_expression','parser_ast.py',946),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression','parser_ast.py',959),
+  ('postfix_expression -> postfix_expression LBRACKET expression RBRACKET','postfix_expression',4,'p_postfix_expression','parser_ast.py',960),
+  ('postfix_expression -> postfix_expression LPAREN argument_expression_list RPAREN','postfix_expression',4,'p_postfix_expression','parser_ast.py',961),
+  ('postfix_expression -> postfix_expression LPAREN RPAREN','postfix_expression',3,'p_postfix_expression','parser_ast.py',962),
+  ('postfix_expression -> postfix_expression DOT IDENTIFIER','postfix_expression',3,'p_postfix_expression','parser_ast.py',963),
+  ('postfix_expression -> postfix_expression ARROW IDENTIFIER','postfix_expression',3,'p_postfix_expression','parser_ast.py',964),
+  ('postfix_expression -> postfix_expression INC','postfix_expression',2,'p_postfix_expression','parser_ast.py',965),
+  ('postfix_expression -> postfix_expression DEC','postfix_expression',2,'p_postfix_expression','parser_ast.py',966),
+  ('primary_expression -> IDENTIFIER','primary_expression',1,'p_primary_expression','parser_ast.py',1031),
+  ('primary_expression -> INT_CONST','primary_expression',1,'p_primary_expression','parser_ast.py',1032),
+  ('primary_expression -> FLOAT_CONST','primary_expression',1,'p_primary_expression','parser_ast.py',1033),
+  ('primary_expression -> string_literal_list','primary_expression',1,'p_primary_expression','parser_ast.py',1034),
+  ('primary_expression -> CHAR_CONST','primary_expression',1,'p_primary_expression','parser_ast.py',1035),
+  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression','parser_ast.py',1036),
+  ('string_literal_list -> STRING_LITERAL','string_literal_list',1,'p_string_literal_list','parser_ast.py',1050),
+  ('string_literal_list -> string_literal_list STRING_LITERAL','string_literal_list',2,'p_string_literal_list','parser_ast.py',1051),
+  ('argument_expression_list -> argument_expression_list COMMA assignment_expression','argument_expression_list',3,'p_argument_expression_list','parser_ast.py',1061),
+  ('argument_expression_list -> assignment_expression','argument_expression_list',1,'p_argument_expression_list','parser_ast.py',1062),
 ]
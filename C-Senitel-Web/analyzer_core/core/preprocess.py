@@ -11,9 +11,11 @@ Phase 2 — Preprocessor (Option 3, pcpp disabled)
 
 from pathlib import Path
 import logging
-import traceback
+import re
 from typing import Tuple
 
+from analyzer_core.core.lexer_c import LazyLogger, read_source
+
 
 # ---------------------------------------------------------
 # Force logging to project-root/logs/sentinel.log
@@ -33,134 +35,84 @@ def ensure_logging():
         )
 
 
-ensure_logging()
-logger = logging.getLogger("c_sentinel.phase2")
+logger = LazyLogger("c_sentinel.phase2", ensure_logging)
 
 
 # ---------------------------------------------------------
-# STATE-MACHINE PREPROCESSOR (Primary Implementation)
+# REGEX PREPROCESSOR (Primary Implementation)
 # ---------------------------------------------------------
 
+# One alternation over everything the preprocessor must recognize; normal
+# text between matches is left to re.sub. The open_* alternatives only
+# match constructs that run to EOF, so at most one fires (the last match).
+# Every alternative starts with a literal character and the named groups
+# are empty markers placed after it: that lets the regex engine derive the
+# set of possible first characters (/ " ') and skip ahead to them in C,
+# instead of trying each alternative at every position of normal text.
+_COMMENT_OR_LITERAL_RE = re.compile(
+    r"""
+      //(?P<line>)[^\n]*
+    | /\*(?P<block>).*?\*/
+    | /\*(?P<open_block>).*
+    | "[^"\\]*(?:\\.[^"\\]*)*"
+    | '[^'\\]*(?:\\.[^'\\]*)*'
+    | "(?P<open_string>).*
+    | '(?P<open_char>).*
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# unclosed construct -> (meta warning, log message)
+_UNCLOSED = {
+    "open_block": ("Unclosed multi-line comment at EOF.", "Phase 2: Unclosed multi-line comment."),
+    "open_string": ("Unclosed string literal at EOF.", "Phase 2: Unclosed string literal."),
+    "open_char": ("Unclosed char literal at EOF.", "Phase 2: Unclosed char literal."),
+}
+
+
 def preprocess_code(code: str) -> Tuple[str, dict]:
     """
-    Process code with a robust state-machine.
+    Strip comments with a single compiled regex (see _COMMENT_OR_LITERAL_RE).
+    String and char literals are matched so comment markers inside them
+    are kept.
     Preserves line count.
     """
-    logger.info("Phase 2: preprocess_code started (state-machine only)")
+    logger.info("Phase 2: preprocess_code started (regex)")
 
     meta = {"warnings": []}
 
     try:
-        n = len(code)
-        i = 0
-        out = []
-
-        in_single = False
-        in_multi = False
-        in_string = False
-        in_char = False
-        escape = False
-
-        while i < n:
-            ch = code[i]
-
-            
-            if in_single:
-                if ch == "\n":
-                    in_single = False
-                    out.append("\n")  # preserve newline
-                i += 1
-                continue
-
-        
-            if in_multi:
-                if ch == "\n":
-                    out.append("\n")  # preserve line count
-                    i += 1
-                    continue
-                if code[i:i+2] == "*/":
-                    in_multi = False
-                    i += 2
-                    continue
-                i += 1
-                continue
-
-        
-            if in_string:
-                out.append(ch)
-                if escape:
-                    escape = False
-                else:
-                    if ch == "\\":
-                        escape = True
-                    elif ch == '"':
-                        in_string = False
-                i += 1
-                continue
-
-            
-            if in_char:
-                out.append(ch)
-                if escape:
-                    escape = False
-                else:
-                    if ch == "\\":
-                        escape = True
-                    elif ch == "'":
-                        in_char = False
-                i += 1
-                continue
-
-
-            two = code[i:i+2]
-
-            if two == "//":
-                in_single = True
-                i += 2
-                continue
-
-            if two == "/*":
-                in_multi = True
-                i += 2
-                continue
-
-            # Start of string
-            if ch == '"':
-                in_string = True
-                out.append(ch)
-                i += 1
-                continue
-
-            # Start of char literal
-            if ch == "'":
-                in_char = True
-                out.append(ch)
-                i += 1
-                continue
-
-            # Normal character
-            out.append(ch)
-            i += 1
-
-
-        if in_multi:
-            meta["warnings"].append("Unclosed multi-line comment at EOF.")
-            logger.warning("Phase 2: Unclosed multi-line comment.")
-
-        if in_string:
-            meta["warnings"].append("Unclosed string literal at EOF.")
-            logger.warning("Phase 2: Unclosed string literal.")
-
-        if in_char:
-            meta["warnings"].append("Unclosed char literal at EOF.")
-            logger.warning("Phase 2: Unclosed char literal.")
+        unclosed = []
+
+        def replace(m):
+            kind = m.lastgroup
+            if kind is None:
+                # string / char literal, kept verbatim
+                return m.group()
+            if kind == "line":
+                # the newline itself is left in the text
+                return ""
+            if kind in _UNCLOSED:
+                unclosed.append(kind)
+                if kind != "open_block":
+                    return m.group()
+            # block comment: preserve line count
+            return "\n" * m.group().count("\n")
+
+        intermediate = _COMMENT_OR_LITERAL_RE.sub(replace, code)
+
+        for kind in unclosed:
+            warning, message = _UNCLOSED[kind]
+            meta["warnings"].append(warning)
+            logger.warning(message)
 
         # ---------------------------
         # Normalize whitespace (light)
         # ---------------------------
-        intermediate = "".join(out)
-        cleaned_lines = [ln.rstrip() for ln in intermediate.splitlines()]
-        cleaned = "\n".join(cleaned_lines)
+        # map() keeps the per-line rstrip call in C; the regex alternative
+        # ([ \t]+$ under re.M) is several times slower on indented code,
+        # because every indentation run is matched and then rejected
+        cleaned = "\n".join(map(str.rstrip, intermediate.splitlines()))
 
         if code.endswith("\n"):
             cleaned += "\n"
@@ -169,19 +121,20 @@ def preprocess_code(code: str) -> Tuple[str, dict]:
         meta["cleaned_length"] = len(cleaned)
 
         logger.info(
-            f"Phase 2 successful: original={meta['original_length']} cleaned={meta['cleaned_length']}"
+            "Phase 2 successful: original=%d cleaned=%d",
+            meta["original_length"], meta["cleaned_length"],
         )
         return cleaned, meta
 
     except Exception as e:
         logger.error("Phase 2: Exception in preprocess_code: %s", e)
-        logger.debug(traceback.format_exc())
+        logger.debug("Phase 2: preprocess_code traceback", exc_info=True)
         raise
 
 
 
 def preprocess_file(path: str) -> Tuple[str, dict]:
-    logger.info(f"Phase 2: preprocess_file called: {path}")
+    logger.info("Phase 2: preprocess_file called: %s", path)
 
     p = Path(path)
     if not p.exists():
@@ -190,12 +143,12 @@ def preprocess_file(path: str) -> Tuple[str, dict]:
         raise FileNotFoundError(msg)
 
     try:
-        code = p.read_text(encoding="utf-8", errors="replace")
+        code = read_source(p)
         cleaned, meta = preprocess_code(code)
         meta["source_path"] = str(p.resolve())
         return cleaned, meta
     except Exception as e:
         logger.error("Phase 2: preprocess_file failed: %s", e)
-        logger.debug(traceback.format_exc())
+        logger.debug("Phase 2: preprocess_file traceback", exc_info=True)
         raise
 
@@ -1,59 +1,73 @@
+from collections import deque
+
+_BRANCH = "├── "
+_LAST_BRANCH = "└── "
+_PIPE = "│   "
+_SPACE = "    "
+
+
 def ast_to_text(node, prefix="", is_last=True, is_root=False):
     if node is None:
         return ""
 
-    lines = []
+    # Iterative pre-order walk: stack entries are either a finished line
+    # (str) or a (node, prefix, is_last, is_root) task, pushed in reverse
+    # so they pop in output order. Every line goes into one buffer.
+    buf = []
+    stack = deque([(node, prefix, is_last, is_root)])
 
-    if is_root:
-        lines.append(type(node).__name__)
-        child_prefix = ""
-    else:
-        branch = "└── " if is_last else "├── "
-        lines.append(prefix + branch + type(node).__name__)
-        child_prefix = prefix + ("    " if is_last else "│   ")
-
-    if not hasattr(node, "__dict__"):
-        return "\n".join(lines)
+    while stack:
+        item = stack.pop()
+        if type(item) is str:
+            buf.append(item)
+            continue
 
-    children = []
+        node, prefix, is_last, is_root = item
 
-    for key, value in vars(node).items():
+        if is_root:
+            buf.append(type(node).__name__)
+            child_prefix = ""
+        else:
+            buf.append(prefix + (_LAST_BRANCH if is_last else _BRANCH) + type(node).__name__)
+            child_prefix = prefix + (_SPACE if is_last else _PIPE)
 
-        if value is None:
+        fields = getattr(type(node), "_fields", None)
+        if fields is None:
             continue
 
-        if isinstance(value, (str, int, float, tuple)):
-            children.append(("attr", f"{key}: {value!r}"))
-
-        elif isinstance(value, list) and value:
-            children.append(("label", key))
-            for item in value:
-                if hasattr(item, "__dict__"):
-                    children.append(("node", item))
-
-        elif hasattr(value, "__dict__"):
-            children.append(("label", key))
-            children.append(("node", value))
-
-    total = len(children)
-    for idx, child in enumerate(children):
-        last = idx == total - 1
-
-        if child[0] == "attr":
-            branch = "└── " if last else "├── "
-            lines.append(child_prefix + branch + child[1])
-
-        elif child[0] == "label":
-            branch = "└── " if last else "├── "
-            lines.append(child_prefix + branch + child[1] + ":")
-
-        elif child[0] == "node":
-            lines.append(
-                ast_to_text(
-                    child[1],
-                    child_prefix,
-                    last
-                )
-            )
-
-    return "\n".join(lines)
+        children = []
+
+        # _fields leaves out parent links / analysis annotations
+        for key in fields:
+            value = getattr(node, key, None)
+            if value is None:
+                continue
+
+            # an empty tuple is an empty child sequence, shown like an empty list
+            if isinstance(value, (str, int, float)) or (type(value) is tuple and value):
+                children.append(("attr", f"{key}: {value!r}"))
+
+            elif isinstance(value, list) and value:
+                children.append(("label", key))
+                for item in value:
+                    if hasattr(item, "_fields"):
+                        children.append(("node", item))
+
+            elif hasattr(value, "_fields"):
+                children.append(("label", key))
+                children.append(("node", value))
+
+        last_idx = len(children) - 1
+        for idx in range(last_idx, -1, -1):
+            kind, child = children[idx]
+            last = idx == last_idx
+
+            if kind == "node":
+                stack.append((child, child_prefix, last, False))
+            else:
+                branch = _LAST_BRANCH if last else _BRANCH
+                if kind == "label":
+                    child = child + ":"
+                stack.append(child_prefix + branch + child)
+
+    return "\n".join(buf)
@@ -1,19 +1,44 @@
-import tempfile
-import os
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
 
-from analyzer_core.c_sentinel import run_pipeline
+from analyzer_core.c_sentinel import run_pipeline_from_string
 from analyzer_core.analysis.buffer_overflow import BufferOverflowAnalyzer
 from analyzer_core.utils.ast_text import ast_to_text
 
 
+# Successful results by source digest, least recently used first. Uploading
+# the same file again (edit/save loops) skips the whole pipeline. Entries
+# are pickled, so no cached object is ever shared with a caller.
+_RESULT_CACHE_SIZE = 32
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _source_digest(code: str) -> bytes:
+    return hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
 def analyze_c_code(code: str, filename: str = "input.c"):
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".c") as f:
-        f.write(code.encode())
-        temp_path = f.name
+    """
+    Run the pipeline and analyzers on code and return the UI result dict.
+    Results are cached on the source text (file_name excluded); every call
+    returns its own dict, which the caller is free to modify.
+    """
+    key = _source_digest(code)
+    with _RESULT_CACHE_LOCK:
+        cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            _RESULT_CACHE.move_to_end(key)
+    if cached is not None:
+        result = pickle.loads(cached)
+        result["file_name"] = filename
+        return result
 
     try:
-        # Run pipeline
-        pipeline = run_pipeline(temp_path)
+        # Run pipeline on the code string directly (no temp file)
+        pipeline = run_pipeline_from_string(code)
 
         ast = pipeline["ast"]
         tokens = pipeline["tokens"]
@@ -25,7 +50,7 @@ def analyze_c_code(code: str, filename: str = "input.c"):
         analyzer = BufferOverflowAnalyzer()
         issues = analyzer.analyze(ast)
 
-        return {
+        result = {
             "status": "success",
             "file_name": filename,
 
@@ -48,8 +73,14 @@ def analyze_c_code(code: str, filename: str = "input.c"):
             "error": str(e)
         }
 
-    finally:
-        os.remove(temp_path)
+    # a plain-data snapshot: the result dict itself goes to the caller
+    cached = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = cached
+        _RESULT_CACHE.move_to_end(key)
+        if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return result
 
 
 
@@ -58,37 +89,15 @@ def analyze_c_code(code: str, filename: str = "input.c"):
 # ─────────────────────────────
 
 def serialize_tokens(tokens):
+    # zip over the TokenStream columns instead of materializing TokenObj
     return [
         {
-            "line": t.line,
-            "column": t.column,
-            "type": t.type,
-            "value": t.value
+            "line": line,
+            "column": column,
+            "type": ttype,
+            "value": value
         }
-        for t in tokens
+        for line, column, ttype, value in zip(
+            tokens.line, tokens.column, tokens.type, tokens.value
+        )
     ]
-
-
-def serialize_ast(node, depth=0):
-    if node is None or depth > 15:
-        return None
-
-    data = {
-        "node": type(node).__name__,
-        "children": []
-    }
-
-    for value in vars(node).values():
-        if hasattr(value, "__dict__"):
-            child = serialize_ast(value, depth + 1)
-            if child:
-                data["children"].append(child)
-
-        elif isinstance(value, list):
-            for item in value:
-                if hasattr(item, "__dict__"):
-                    child = serialize_ast(item, depth + 1)
-                    if child:
-                        data["children"].append(child)
-
-    return data
@@ -3,6 +3,14 @@ from app.analyzer import analyze_c_code
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 
+# orjson encodes the (large) analysis result several times faster than the
+# stdlib json encoder; fall back to it when orjson is not installed
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as AnalysisResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as AnalysisResponse
+
 
 app = FastAPI(title="C-Sentinel")
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -15,6 +23,9 @@ async def analyze(file: UploadFile = File(...)):
     if not file.filename.endswith(".c"):
         raise HTTPException(status_code=400, detail="Only .c files allowed")
 
-    code = await file.read()
-    result = analyze_c_code(code.decode(), file.filename)
-    return result
+    # decoded like the pipeline reads files: invalid UTF-8 is replaced
+    code = (await file.read()).decode("utf-8", "replace")
+    result = analyze_c_code(code, file.filename)
+    # The result is plain JSON data already: returning a response object
+    # skips FastAPI's jsonable_encoder walk over every token / CFG dict
+    return AnalysisResponse(result)